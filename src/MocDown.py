@@ -13,45 +13,73 @@ __year__ = '2014';
 # Standard library
 ###
 from argparse import ArgumentParser;
+from asyncio import create_subprocess_shell as CreateSubprocessShell,\
+                    new_event_loop as NewEventLoop,\
+                    run_coroutine_threadsafe as RunCoroutineThreadsafe,\
+                    Semaphore as AsyncSemaphore,\
+                    subprocess as AsyncSubprocess,\
+                    TimeoutError as AsyncTimeoutError,\
+                    wait_for as AsyncWaitFor;
 from concurrent import futures as Futures;
+from copy import copy as ShallowCopy;
 from csv import reader as CsvReader,\
                 writer as CsvWriter;
+from functools import partial as Partial;
 from glob import glob as Glob;
 from gzip import open as GzipOpen;
-from numpy import array as Array,\
+from hashlib import sha1 as Sha1;
+from lzma import open as LzmaOpen;
+from mmap import mmap as MemoryMap,\
+                 ACCESS_READ;
+from multiprocessing import get_context as GetMultiprocessingContext;
+from numpy import arange as Arange,\
+                  array as Array,\
                   concatenate as Concatenate,\
                   diff as Difference,\
                   empty as Empty,\
                   exp as Exponent,\
                   interp as LinearInterpolate,\
+                  isnan as IsNan,\
+                  ix_ as MeshIndex,\
+                  load as LoadArrays,\
                   log as NaturalLogarithm,\
                   logspace as LogSpace,\
+                  maximum as Maximum,\
+                  minimum as Minimum,\
+                  nan as NaN,\
                   nan_to_num as Nan2Num,\
                   nonzero as NonZero,\
+                  savez as SaveArrays,\
                   seterr as SetNumpyError,\
+                  where as Where,\
                   zeros as Zeros;
 SetNumpyError(invalid = 'ignore', divide = 'ignore');
-from os import getcwd as GetCurrentWorkingDirectory,\
+from os import access as Access,\
+               getcwd as GetCurrentWorkingDirectory,\
+               getpid as GetProcessId,\
+               killpg as KillProcessGroup,\
                mkdir as LibMakeDirectory,\
                remove as LibRemoveFile,\
                rmdir as LibRemoveDirectory,\
                stat as FileStatus,\
                symlink as LibSymbolicLink,\
-               system as SystemCall;
+               system as SystemCall,\
+               W_OK;
 from os.path import exists as Exists,\
-                    getmtime as GetModificationTime;
+                    getmtime as GetModificationTime,\
+                    isdir as IsDirectory;
 from pickle import dump as Pickle,\
-                   dumps as PickleString,\
-                   load as UnPickle,\
-                   UnpicklingError;
+                   load as UnPickle;
 from random import randint as RandomInteger;
 from re import compile as ReCompile;
 from shutil import copyfile as LibCopyFile,\
                    move as LibMoveFile,\
                    rmtree as LibRemoveTree;
+from signal import SIGKILL;
 from sys import modules as Modules,\
                 stdout as StdOut;
 from tempfile import mkdtemp as LibMakeTemporaryDirectory;
+from threading import Thread;
 from time import sleep as Sleep;
 ###
 # Physical constants
@@ -139,9 +167,31 @@ origenPunchCardTemplate = '''\
 origenXsLibraryTemplate = '''\
 {lib:>3d} {zam:>7d} {sigma[0]:.4E} {sigma[1]:.4E} {sigma[2]:.4E} {sigma[3]:.4E} {sigma[4]:.4E} {sigma[5]:.4E} -1''';
 ###
+# ORIGEN libraries and their parsed contents, keyed by file name and modification time;
+# Shared by every depletion calculation, including those of recycles
+###
+origenLibraryCache = {};
+###
+# Fissile isotopes, whose inventory changes drive adaptive depletion steps unless others are requested
+###
+adaptiveInventoryZams = (922330, 922350, 942390, 942410);
+###
 # Regular expression for numeric strings
 ###
 reNumber = ReCompile(r'[0-9]+', 2 | 8);
+###
+# Depletion step pickle sections, each of which is stored in its own file and loaded upon first access
+###
+depletionStepPickleSection2Attributes = {
+    'inventory' : ('cellNumber2Micros', 'cellNumber2OrigenCalculation', 'cellNumber2Zaid2MassDensity', 'cellNumber2Zaid2NumberDensity', 'cellNumber2Zam2Moles'),
+    'tapes' : ('cellNumber2TapeKeys', 'cellNumber2Tapes', 'tapeDigest2Blob'),
+    'raw' : ('transportInputRaw', 'transportOutputRaw'),
+};
+###
+# Pickle compressors, their file extensions, and the leading bytes which identify them when reading
+###
+pickleCompressor2Extension = {'gzip' : '.gz', 'lzma' : '.xz', 'none' : ''};
+pickleCompressor2Magic = {'gzip' : b'\x1f\x8b', 'lzma' : b'\xfd7zXZ\x00'};
 
 ###
 ### Custom classes
@@ -173,6 +223,108 @@ class Class:
     '''Empty class.''';
     pass;
 ###
+# Shell command runner
+###
+class CommandRunner:
+    '''Run shell commands on an event loop, with a concurrency limit, timeouts, return code checks, and retries.''';
+    def __init__(self, maximumConcurrency = 1, retries = 0):
+        '''Construct a new instance.''';
+        self.maximumConcurrency = maximumConcurrency;
+        self.retries = retries;
+        ###
+        self.StartLoop();
+        ###
+        return;
+    ###
+    # Generic getter methods
+    ###
+    def GetLoop(self):
+        '''Return event loop of this process.''';
+        ###
+        # Forked processes inherit the loop, but not the thread running it
+        ###
+        if self.processId != GetProcessId():
+            self.StartLoop();
+        ###
+        return self.loop;
+    ###
+    def GetMaximumConcurrency(self):
+        '''Return maximum number of concurrent commands.''';
+        return self.maximumConcurrency;
+    ###
+    def GetRetries(self):
+        '''Return number of retries for failed commands.''';
+        return self.retries;
+    ###
+    # Algorithmic methods
+    ###
+    def StartLoop(self):
+        '''Start an event loop in a background thread.''';
+        self.processId = GetProcessId();
+        self.loop = NewEventLoop();
+        self.semaphore = None;
+        ###
+        Thread(target = self.loop.run_forever, daemon = True).start();
+        ###
+        return;
+    ###
+    def Run(self, command, timeout = None, cleanUp = None):
+        '''Run a shell command from any thread, blocking until it is complete; return its captured output, or raise if every attempt fails.''';
+        return RunCoroutineThreadsafe(self.RunAsync(command, timeout, cleanUp), self.GetLoop()).result();
+    ###
+    async def RunAsync(self, command, timeout = None, cleanUp = None):
+        '''Run a shell command, retrying if it fails or times out, after cleaning up the failed attempt; return its captured output, or raise if every attempt fails.''';
+        ###
+        # The semaphore is bound to the loop, so it is made within it
+        ###
+        if self.semaphore is None:
+            self.semaphore = AsyncSemaphore(self.GetMaximumConcurrency());
+        ###
+        async with self.semaphore:
+            attempts = 1 + self.GetRetries();
+            for attempt in range(1, attempts + 1):
+                ###
+                # Retries start from the files of the first attempt, rather than those left by the failed attempt
+                ###
+                if attempt > 1 and cleanUp is not None:
+                    cleanUp();
+                ###
+                # Each command leads its own process group, so that a timeout kills the shell and its children
+                ###
+                process = await CreateSubprocessShell(command, stdout = AsyncSubprocess.PIPE, stderr = AsyncSubprocess.STDOUT, start_new_session = True);
+                try:
+                    output, _ = await AsyncWaitFor(process.communicate(), timeout);
+                except AsyncTimeoutError:
+                    ###
+                    # The process group may have exited just as the timeout elapsed
+                    ###
+                    try:
+                        KillProcessGroup(process.pid, SIGKILL);
+                    except ProcessLookupError:
+                        pass;
+                    await process.wait();
+                    ###
+                    output = b'';
+                    failure = 'timed out after {:.1f} seconds'.format(timeout);
+                else:
+                    if 0 == process.returncode:
+                        break;
+                    ###
+                    failure = 'exited with return code {:d}'.format(process.returncode);
+                ###
+                # Commands which redirect their output to a log leave nothing to capture
+                ###
+                message = 'Command `{}\' {} (attempt {:d} of {:d}){}'.format(command, failure, attempt, attempts, [' with no captured output; see any log to which it redirects', ':\n' + output.decode('utf-8', 'ignore')][bool(output.strip())]);
+                ###
+                # Once every attempt has failed, the missing or partial output must not be parsed
+                ###
+                if attempt == attempts:
+                    raise ChildProcessError(message);
+                ###
+                Warning(message);
+        ###
+        return output.decode('utf-8', 'ignore');
+###
 # Depletion calculation
 ###
 class DepletionCalculation:
@@ -280,6 +432,10 @@ class DepletionCalculation:
         '''Return dictionary mapping cell to isotope to moles for current depletion step.''';
         return self.cellNumber2Zam2Moles;
     ###
+    def GetCommandRunner(self):
+        '''Return runner of transport and transmute commands.''';
+        return self.commandRunner;
+    ###
     def GetCoolantDensityCalculations(self):
         '''Return cell coolant density calculuations for current depletion step.''';
         return self.coolantDensityCalculations;
@@ -304,6 +460,13 @@ class DepletionCalculation:
         '''Return system total flux for current depletion step.''';
         return self.GetParameter('depletionStepFluxes')[self.GetDepletionStep()];
     ###
+    def GetAppendedDepletionCalculationPickle(self):
+        '''Return append-only depletion calculation pickle of steps pickled so far.''';
+        if not hasattr(self, 'appendedDepletionCalculationPickle'):
+            return None;
+        ###
+        return self.appendedDepletionCalculationPickle;
+    ###
     def GetDepletionStepPickle(self, offset = 0):
         '''Return depletion I/O object for current step.''';
         try:
@@ -334,6 +497,8 @@ class DepletionCalculation:
     def GetFileName(self, extension = None, withoutTH = False):
         '''Return MCNP input filename for current depletion step.''';
         fileName = self.GetOriginalTransportFile().GetNewputFileName(self.GetDepletionStep());
+        if self.GetIsCorrector():
+            fileName += 'c';
         if self.GetEitherUpdate() and not withoutTH:
             fileName += '-{:d}'.format(self.GetTransportIteration());
         ###
@@ -358,6 +523,13 @@ class DepletionCalculation:
         '''Return if decay heat is to be considered.''';
         return self.GetParameter('includeDecayHeat');
     ###
+    def GetIsCorrector(self):
+        '''Return if the corrector transport of a predictor-corrector depletion step is underway.''';
+        if not hasattr(self, 'isCorrector'):
+            return False;
+        ###
+        return self.isCorrector;
+    ###
     def GetIsDecayStep(self):
         '''Return if current depletion step entails decay.''';
         return (self.GetParameter('isPowerMode') and 0 == self.GetDepletionStepPower()) or (not self.GetParameter('isPowerMode') and 0 == self.GetDepletionStepFlux());
@@ -397,6 +569,14 @@ class DepletionCalculation:
         '''Return excited fraction states for isotope of a ORIGEN2 sublibrary.''';
         return self.lib2Zam2Excite[lib][zam];
     ###
+    def GetCellNumberTransportBurnRate(self, cellNumber):
+        '''Return cell flux or power from transport results for current depletion step.''';
+        return self.cellNumber2TransportBurnRate[cellNumber];
+    ###
+    def GetCellNumberTransportMicros(self, cellNumber):
+        '''Return dictionary mapping (isotope, reaction) to transport-derived microscopic cross-section for a cell.''';
+        return self.cellNumber2TransportMicros[cellNumber];
+    ###
     def GetMaterialNumberZaid(self, materialNumber):
         '''Return isotope for a single-isotope material.''';
         return self.GetMaterialNumber2Zaid()[materialNumber];
@@ -409,6 +589,10 @@ class DepletionCalculation:
         '''Return MCNP tally number used for transmutation constants.''';
         return self.transmuteTallyNumber;
     ###
+    def GetOrigenStagingPath(self):
+        '''Return directory under which ORIGEN tapes are staged.''';
+        return self.origenStagingPath;
+    ###
     def GetOrigen2LibMts(self, lib):
         '''Return ORIGEN2 sub-library MT #s.''';
         return self.GetOrigen2Lib2Mts()[lib % 10];
@@ -437,6 +621,13 @@ class DepletionCalculation:
         '''Return previously performed fuel temperature calculations.''';
         return self.previousFuelTemperatureCalculations;
     ###
+    def GetTransmuteTimeInterval(self):
+        '''Return time duration of each transmute calculation within current depletion step.''';
+        if not hasattr(self, 'transmuteTimeInterval') or self.transmuteTimeInterval is None:
+            return self.GetDepletionStepTimeInterval();
+        ###
+        return self.transmuteTimeInterval;
+    ###
     def GetTransportIteration(self):
         '''Return index of transport iterations.''';
         if not hasattr(self, 'transportIteration'):
@@ -448,10 +639,18 @@ class DepletionCalculation:
         '''Return list of isotopes present in MCNP xsdir.''';
         return self.xsDirZaids;
     ###
+    def GetXsLibraryLines(self):
+        '''Return lines of the ORIGEN2 default one-group microscopic cross-section library.''';
+        return self.xsLibraryLines;
+    ###
     def GetZa2WattsPerMole(self):
         '''Return dictionarty mapping isotope to its decay heat per mole.''';
         return self.za2WattsPerMole;
     ###
+    def GetZam2XsLibrarySlots(self):
+        '''Return dictionary mapping isotope to its (sub-library, line index) slots within the default cross-section library.''';
+        return self.zam2XsLibrarySlots;
+    ###
     # Depletion methods
     ###
     def PopulateDepletionSteps(self):
@@ -570,6 +769,90 @@ class DepletionCalculation:
         ###
         return;
     ###
+    def AdaptDepletionSteps(self, transportOutputFile):
+        '''Resize remaining depletion steps from relative changes in multiplication factor and inventories over current depletion step.''';
+        if self.GetIsDecayStep() or self.GetIsPickleTransmute() or not self.GetDepletionStepTimeInterval():
+            return;
+        ###
+        # Steps can only be resized for a constant burn rate
+        ###
+        isPowerMode = self.GetParameter('isPowerMode');
+        burnRate = self.GetParameter(['depletionFlux', 'depletionPower'][isPowerMode]);
+        if burnRate is None:
+            Warning('Adaptive depletion steps require a single depletion {}'.format(['flux', 'power'][isPowerMode]));
+            return;
+        ###
+        # Remaining burn steps, followed by a terminal decay step if requested
+        ###
+        depletionStepTimeIntervals = self.GetParameter('depletionStepTimeIntervals');
+        numberOfDecaySteps = int(bool(self.GetParameter('depletionTerminalDecayTime')));
+        timeLeft = sum(depletionStepTimeIntervals[self.GetDepletionStep(offset = +1) : len(self) - numberOfDecaySteps]);
+        if timeLeft <= 0:
+            return;
+        ###
+        # Relative change in multiplication factor since the previous transport
+        ###
+        multiplicationFactorChange = 0;
+        if self.GetAppendedDepletionCalculationPickle() is not None:
+            multiplicationFactors = [multiplicationFactor for multiplicationFactor in self.GetAppendedDepletionCalculationPickle().multiplicationFactors if multiplicationFactor is not None];
+            if multiplicationFactors:
+                multiplicationFactorChange = abs(SafeDivide(float(transportOutputFile.GetMultiplicationFactor()), float(multiplicationFactors[-1])) - 1);
+        ###
+        # Largest relative change in the system inventory of key isotopes over this depletion step
+        ###
+        zams = self.GetParameter('adaptiveInventoryZams') or adaptiveInventoryZams;
+        zam2BeginningMoles = {zam : 0 for zam in zams};
+        zam2EndMoles = {zam : 0 for zam in zams};
+        for cellNumber, origenCalculation in self.GetCellNumber2OrigenCalculation().items():
+            for zam, moles in self.GetCellNumber2Zam2Moles()[cellNumber].items():
+                if zam in zam2BeginningMoles:
+                    zam2BeginningMoles[zam] += moles;
+            for zaid, moles in origenCalculation.GetZaid2Moles().items():
+                zam = Zaid2Zam(zaid);
+                if zam in zam2EndMoles:
+                    zam2EndMoles[zam] += moles;
+        inventoryChange = max([abs(SafeDivide(zam2EndMoles[zam], zam2BeginningMoles[zam]) - 1) for zam in zams if zam2BeginningMoles[zam]] + [0]);
+        ###
+        # Grow the next step while both changes are well within tolerance, and shrink it once either exceeds tolerance;
+        # Limit it to the minimum and maximum burnup or fluence steps
+        ###
+        errorRatio = max(SafeDivide(multiplicationFactorChange, self.GetParameter('adaptiveMultiplicationFactorTolerance')), SafeDivide(inventoryChange, self.GetParameter('adaptiveInventoryTolerance')));
+        if errorRatio > 1:
+            factor = 0.5;
+        elif errorRatio < 0.5:
+            factor = 2;
+        else:
+            factor = 1;
+        ###
+        if isPowerMode:
+            days2Step = SafeDivide(burnRate, self.GetOriginalTransportFile().GetHeavyMetalMT());
+            minimumStep, maximumStep = self.GetParameter('minimumBurnupStep'), self.GetParameter('maximumBurnupStep');
+        else:
+            days2Step = burnRate;
+            minimumStep, maximumStep = self.GetParameter('minimumFluenceStep'), self.GetParameter('maximumFluenceStep');
+        timeStep = min(max(self.GetDepletionStepTimeInterval() * factor, SafeDivide(minimumStep, days2Step)), SafeDivide(maximumStep, days2Step));
+        ###
+        # Refill the remaining time;
+        # Don't burn beyond what is left!
+        ###
+        timeSteps = [];
+        while timeLeft > epsilon:
+            timeSteps.append(min(timeStep, timeLeft));
+            timeLeft -= timeSteps[-1];
+        ###
+        PrintNow('> Adapting remaining depletion steps after {} (Δk/k = {:.2E}, ΔN/N = {:.2E}): {:d} step(s) of {:.5E} days'.format(self.GetDepletionString(), multiplicationFactorChange, inventoryChange, len(timeSteps), timeStep));
+        ###
+        # Replace remaining time intervals and burn rates, keeping the terminal decay step
+        ###
+        key = ['depletionStepFluxes', 'depletionStepPowers'][isPowerMode];
+        numberOfSteps = self.GetDepletionStep(offset = +1);
+        mocDownInputFile.parameters['depletionStepTimeIntervals'] = depletionStepTimeIntervals[ : numberOfSteps] + timeSteps + depletionStepTimeIntervals[len(self) - numberOfDecaySteps : ];
+        mocDownInputFile.parameters[key] = self.GetParameter(key)[ : numberOfSteps] + [burnRate] * len(timeSteps) + self.GetParameter(key)[len(self) - numberOfDecaySteps : ];
+        ###
+        mocDownInputFile.parameters['depletionStepTimeEnds'] = [sum(self.GetParameter('depletionStepTimeIntervals')[ : index]) for index in range(len(self) + 1)];
+        ###
+        return;
+    ###
     def Deplete(self):
         '''Execute MocDown depletion.''';
         PrintNow('> {} will perform {} depletion step(s)'.format(__file__, len(self)));
@@ -607,6 +890,10 @@ class DepletionCalculation:
                 self.cellNumber2OrigenCalculation = {cellNumber : depletionStepPickle.GetCellNumberOrigenCalculation(cellNumber) for cellNumber in depletionStepPickle.GetBurnCells()};
                 self.depletionStep2CellNumber2DecayPower[self.GetDepletionStep(offset = +1)] = depletionStepPickle.GetCellNumber2NextDecayPower();
                 ###
+                # Append the unpickled step to the depletion calculation pickle
+                ###
+                self.AppendDepletionCalculationPickle();
+                ###
                 # Increment depletion step
                 ###
                 self.IncrementDepletionStep();
@@ -619,13 +906,23 @@ class DepletionCalculation:
             ###
             transportFile = self.TransportConvergence();
             ###
-            # Transmute calculation
+            # Transmute calculation;
+            # Maybe with a predictor-corrector
+            ###
+            if self.GetParameter('isPredictorMode') and not self.GetIsDecayStep() and not self.GetIsPickleTransmute() and self.GetDepletionStepTimeInterval():
+                self.PredictorCorrector(transportFile, GetCurrentWorkingDirectory() + '/');
+            else:
+                self.TransmuteThreads(transportFile, GetCurrentWorkingDirectory() + '/');
             ###
-            self.TransmuteThreads(transportFile, GetCurrentWorkingDirectory() + '/');
+            # Maybe resize remaining depletion steps
+            ###
+            if self.GetParameter('adaptDepletionSteps'):
+                self.AdaptDepletionSteps(transportFile);
             ###
             # Pickle depletion object after every depletion step for restarts, recycles, and plotting
             ###
             self.PickleDepletionStep(transportFile);
+            transportFile.Close();
             ###
             # Increment depletion step
             ###
@@ -638,6 +935,7 @@ class DepletionCalculation:
         # Pickle depletion object -- post-transmute, but pre-transport
         ###
         self.PickleDepletionStep(McnpInputFile(self.GetFileName('i', withoutTH = (self.GetDepletionStep() >= len(self)))));
+        self.WaitForPickles(isShutdown = True);
         ###
         PrintNow('> {} has completed all {} depletion step(s)'.format(__file__, len(self)));
         ###
@@ -669,54 +967,28 @@ class DepletionCalculation:
             3 : (102, 16, 107, 103),
         };
         ###
-        # Read default decay, photon, and cross-section libraries
+        # Read default decay, photon, and cross-section libraries;
+        # Libraries and their parsed contents are shared by every depletion calculation until they are modified
         ###
-        for defaultLibrary in ('defaultDecayLibrary', 'defaultPhotonLibrary', 'defaultXsLibrary'):
-            setattr(self, defaultLibrary, ReadFile(self.GetParameter('origenLibraryPathTemplate').format(self.GetParameter(defaultLibrary)), display = self.GetDisplayFiles()));
+        defaultLibrary2FileName = {defaultLibrary : self.GetParameter('origenLibraryPathTemplate').format(self.GetParameter(defaultLibrary)) for defaultLibrary in ('defaultDecayLibrary', 'defaultPhotonLibrary', 'defaultXsLibrary')};
+        for defaultLibrary, fileName in defaultLibrary2FileName.items():
+            setattr(self, defaultLibrary, ReadOrigenLibrary(fileName, display = self.GetDisplayFiles()));
         ###
         # Maybe populate molar decay heat conversions
         ###
         self.za2WattsPerMole = {};
         if self.GetIncludeDecayHeat():
-            iuConversion = {
-                '1' : 1,
-                '2' : 1 / 60,
-                '3' : 1 / 60 / 60,
-                '4' : 1 / 60 / 60 / 24,
-                '5' : 1 / 60 / 60 / 24 / daysPerYear,
-                '6' : 0,
-                '7' : 1 / 60 / 60 / 24 / daysPerYear / 1e3,
-                '8' : 1 / 60 / 60 / 24 / daysPerYear / 1e6,
-                '9' : 1 / 60 / 60 / 24 / daysPerYear / 1e9,
-            };
-            logOfTwo = NaturalLogarithm(2);
-            ###
-            for match in ReCompile(r'^ *\d {2,3}([\d]{5,7}) +(\d) +([\d\.e+\- ]{9}).+\n[\d ]{20}([\d\.e+\- ]{9} ){3}', 2 | 8).finditer(self.GetDefaultDecayLibrary()):
-                zam, iu, thalf, qrec = match.groups();
-                ###
-                self.za2WattsPerMole[Zaid2Za(Zam2Zaid(int(float(zam)), ''))] = logOfTwo * SafeDivide(iuConversion[iu], float(thalf.replace(' ', ''))) * float(qrec.replace(' ', '')) * joulePerMev * (avogadrosNumber * 1e24);
+            self.za2WattsPerMole = ReadOrigenLibrary(defaultLibrary2FileName['defaultDecayLibrary'], ParseOrigenDecayLibrary, display = self.GetDisplayFiles());
         ###
         # Initiate cell # -> decay powers (delayed β's and γ's);
         # Assume that only burn cells have appreciable decay heat
         ###
         self.depletionStep2CellNumber2DecayPower = {self.GetDepletionStep(offset = 0) : {cellNumber : self.GetOriginalTransportFile().GetCellNumberDecayPower(cellNumber, self.GetZa2WattsPerMole()) for cellNumber in self.GetBurnCells()}};
         ###
-        # Populate cross-section library metastable fractions
-        ###
-        def HelperExcited(*args):
-            return SafeDivide(args[2], args[0] + args[2]), SafeDivide(args[3], args[1] + args[3]);
-        ###
-        libs = set(int(float(lib)) for lib in ReCompile(r'^ *(\d{1,3}) +', 2 | 8).findall(self.GetDefaultXsLibrary()));
+        # Populate cross-section library metastable fractions;
+        # Tokenize cross-section library into lines and (lib, zam, line index) slots
         ###
-        self.lib2Zams = {};
-        self.lib2Zam2Excite = {};
-        for lib in libs:
-            self.lib2Zams[lib] = [];
-            self.lib2Zam2Excite[lib] = {};
-            for match in ReCompile(r'^ *{} +(\d{{5,7}}) +([\d\.e+\-]+) +([\d\.e+\-]+) +[\d\.e+\-]+ +[\d\.e+\-]+ +([\d\.e+\-]+) +([\d\.e+\-]+) + [\d\.e+\-]+ *$'.format(lib), 2 | 8).finditer(self.GetDefaultXsLibrary()):
-                zam = int(float(match.group(1)));
-                self.lib2Zams[lib].append(zam);
-                self.lib2Zam2Excite[lib][zam] = HelperExcited(*(float(group.replace(' ', '')) for group in match.groups()[1 : ]));
+        self.lib2Zams, self.lib2Zam2Excite, self.xsLibraryLines, self.zam2XsLibrarySlots = ReadOrigenLibrary(defaultLibrary2FileName['defaultXsLibrary'], ParseOrigenXsLibrary, display = self.GetDisplayFiles());
         ###
         # Populate xsdir cross-section zaids
         ###
@@ -736,6 +1008,10 @@ class DepletionCalculation:
         ###
         self.transmuteTallyNumber = 4;
         ###
+        # Start transport and transmute command runner
+        ###
+        self.commandRunner = CommandRunner(maximumConcurrency = self.GetParameter('numberOfOrigenThreads'), retries = self.GetParameter('commandRetries'));
+        ###
         return;
     ###
     def TryUnpickle(self):
@@ -748,13 +1024,19 @@ class DepletionCalculation:
         ###
         if self.GetIsRestart() or self.GetIsPickleTransmute():
             ###
-            extension = 'pkl';
-            if self.GetParameter('compressPickles'):
-                extension += '.gz';
+            # Pickles still being written must land before they are read
             ###
-            if Exists('{}.{}'.format(self.GetFileName(withoutTH = True), extension)):
+            self.WaitForPickles();
+            ###
+            if Exists(PickleFileName(self.GetFileName(withoutTH = True), self.GetParameters())):
                 self.depletionStep2DepletionStepPickle[self.GetDepletionStep()] = self.UnpickleDepletionStep();
                 ###
+                # Adaptive depletion steps are resumed from the schedule in effect when the pickle was written
+                ###
+                if self.GetParameter('adaptDepletionSteps'):
+                    for key in ('depletionStepFluxes', 'depletionStepPowers', 'depletionStepTimeEnds', 'depletionStepTimeIntervals'):
+                        mocDownInputFile.parameters[key] = list(self.GetDepletionStepPickle().GetParameters()[key]);
+                ###
                 if self.GetDepletionStepPickle().GetParameters() != self.GetParameters():
                     Warning('{} input parameters do not match that of the pickle'.format(__file__));
         ###
@@ -805,6 +1087,11 @@ class DepletionCalculation:
             ###
             self.PrepareTransport(transportFile);
             ###
+            # The previous transport iteration's output is no longer needed
+            ###
+            if transportFile is not None:
+                transportFile.Close();
+            ###
             # Run tranport calculation;
             # Parse results
             ###
@@ -1027,20 +1314,26 @@ class DepletionCalculation:
         ###
         return;
     ###
-    def Transport(self):
-        '''Execute transport.''';
+    def CleanUpTransport(self):
+        '''Remove transport output files and maybe copy MCNP source, before each transport attempt.''';
         ###
         # Ensure necessary files do/don't exist
         ###
         AssertFileExists(self.GetFileName('i'));
-        for extension in ('o', 'src', 'tpe'):
+        for extension in ('mesh', 'o', 'src', 'tpe'):
             RemoveFile(self.GetFileName(extension), display = self.GetDisplayFiles());
         ###
         # Maybe copy MCNP source to .src
         ###
         sourceFileName = self.GetParameter('mcnpSourceFileName');
         if Exists(sourceFileName):
-            CopyFile(sourceFileName, self.GetFileName('src'), display = GetDisplayFiles());
+            CopyFile(sourceFileName, self.GetFileName('src'), display = self.GetDisplayFiles());
+        ###
+        return;
+    ###
+    def Transport(self):
+        '''Execute transport.''';
+        self.CleanUpTransport();
         ###
         if self.GetIsDecayStep() or self.GetIsPickleTransmute():
             ###
@@ -1058,7 +1351,7 @@ class DepletionCalculation:
                 # Transport is requested;
                 # Execute MCNP
                 ###
-                SystemCall(self.GetParameter('mcnpRunCommand').format(executable = self.GetParameter('mcnpExecutablePath'), baseName = self.GetFileName(), xsdir = self.GetParameter('mcnpXsdirPath')));
+                self.GetCommandRunner().Run(self.GetParameter('mcnpRunCommand').format(executable = self.GetParameter('mcnpExecutablePath'), baseName = self.GetFileName(), xsdir = self.GetParameter('mcnpXsdirPath')), timeout = self.GetParameter('mcnpTimeout'), cleanUp = self.CleanUpTransport);
             ###
             # Parse transport output file
             ###
@@ -1150,7 +1443,104 @@ class DepletionCalculation:
         ###
         return;
     ###
-    def TransmuteThreads(self, transportOutputFile, currentDir):
+    def PredictorCorrector(self, transportOutputFile, currentDir):
+        '''Execute transmute with a constant-extrapolation predictor and linear-interpolation corrector (CE/LI).''';
+        predictorSteps = self.GetParameter('numberOfPredictorSteps');
+        correctorSteps = self.GetParameter('numberOfCorrectorSteps');
+        ###
+        # Beginning-of-step inventories, coupling calculations, and decay powers are kept for the corrector and pickle
+        ###
+        cellNumber2OrigenCalculation = self.GetCellNumber2OrigenCalculation();
+        coolantDensityCalculations = self.GetCoolantDensityCalculations();
+        fuelTemperatureCalculations = self.GetFuelTemperatureCalculations();
+        cellNumber2DecayPower = self.depletionStep2CellNumber2DecayPower[self.GetDepletionStep()];
+        ###
+        # Predictor:
+        # Transmute the whole step with beginning-of-step cross-sections and burn rates
+        ###
+        PrintNow('> Predicting {} with {:d} transmute substep(s)'.format(self.GetDepletionString(), predictorSteps));
+        self.PopulateTransportMicros(transportOutputFile);
+        cellNumber2Micros, cellNumber2BurnRate = self.cellNumber2TransportMicros, self.cellNumber2TransportBurnRate;
+        ###
+        self.transmuteTimeInterval = self.GetDepletionStepTimeInterval() / predictorSteps;
+        for substep in range(predictorSteps):
+            self.TransmuteThreads(transportOutputFile, currentDir, isTransportPopulated = True);
+        ###
+        # Corrector transport of predicted end-of-step inventories, normalized with their decay powers
+        ###
+        PrintNow('> Correcting {} with {:d} transmute substep(s)'.format(self.GetDepletionString(), correctorSteps));
+        self.isCorrector = True;
+        self.depletionStep2CellNumber2DecayPower[self.GetDepletionStep()] = self.depletionStep2CellNumber2DecayPower[self.GetDepletionStep(offset = +1)];
+        ###
+        # The corrector transport input assigns its own single-zaid material and tally numbers;
+        # Those of the beginning-of-step transport are restored afterward
+        ###
+        materialNumber2Zaid, transmuteTallyNumber = self.materialNumber2Zaid, self.transmuteTallyNumber;
+        ###
+        correctorTransportFile = self.TransportConvergence();
+        self.PopulateTransportMicros(correctorTransportFile);
+        correctorTransportFile.Close();
+        correctorCellNumber2Micros, correctorCellNumber2BurnRate = self.cellNumber2TransportMicros, self.cellNumber2TransportBurnRate;
+        ###
+        self.isCorrector = False;
+        self.materialNumber2Zaid, self.transmuteTallyNumber = materialNumber2Zaid, transmuteTallyNumber;
+        self.depletionStep2CellNumber2DecayPower[self.GetDepletionStep()] = cellNumber2DecayPower;
+        self.coolantDensityCalculations, self.fuelTemperatureCalculations = coolantDensityCalculations, fuelTemperatureCalculations;
+        ###
+        # Corrector:
+        # Transmute the whole step again from beginning-of-step inventories;
+        # Cross-sections and burn rates are linearly interpolated to the midpoint of each substep
+        ###
+        def Interpolate(one, two, weight):
+            ###
+            # Keys absent from either end are held constant
+            ###
+            one, two = {**two, **one}, {**one, **two};
+            return {key : (1 - weight) * one[key] + weight * two[key] for key in one};
+        ###
+        self.cellNumber2OrigenCalculation = cellNumber2OrigenCalculation;
+        self.transmuteTimeInterval = self.GetDepletionStepTimeInterval() / correctorSteps;
+        for substep in range(correctorSteps):
+            weight = (substep + 0.5) / correctorSteps;
+            ###
+            self.cellNumber2TransportMicros = {cellNumber : Interpolate(cellNumber2Micros[cellNumber], correctorCellNumber2Micros[cellNumber], weight) for cellNumber in self.GetBurnCells()};
+            self.cellNumber2TransportBurnRate = Interpolate(cellNumber2BurnRate, correctorCellNumber2BurnRate, weight);
+            ###
+            self.TransmuteThreads(transportOutputFile, currentDir, isTransportPopulated = True);
+            ###
+            # Beginning-of-step moles are those input to the first substep
+            ###
+            if not substep:
+                cellNumber2Zam2Moles = self.GetCellNumber2Zam2Moles();
+        ###
+        self.cellNumber2Zam2Moles = cellNumber2Zam2Moles;
+        self.transmuteTimeInterval = None;
+        ###
+        # Pickle transmute replays a single transmute over the whole step;
+        # Pickled TAPE5s and TAPE9s span the whole step with step-averaged cross-sections and burn rates, rather than the last substep's
+        ###
+        if correctorSteps > 1:
+            self.cellNumber2TransportMicros = {cellNumber : Interpolate(cellNumber2Micros[cellNumber], correctorCellNumber2Micros[cellNumber], 0.5) for cellNumber in self.GetBurnCells()};
+            self.cellNumber2TransportBurnRate = Interpolate(cellNumber2BurnRate, correctorCellNumber2BurnRate, 0.5);
+            self.cellNumber2Micros = {};
+            ###
+            tmpDir = MakeTemporaryDirectory(display = self.GetDisplayFiles());
+            try:
+                for cellNumber in self.GetBurnCells():
+                    zam2Moles, self.cellNumber2Micros[cellNumber] = self.PrepareTransmute(transportOutputFile, transportOutputFile.FindCell(cellNumber), tmpDir, isStaged = True);
+                    ###
+                    # Replace tapes of a copy, leaving the live calculation intact
+                    ###
+                    origenCalculation = ShallowCopy(self.GetCellNumber2OrigenCalculation()[cellNumber]);
+                    origenCalculation.TAPE5 = ReadFile('{}TAPE5.INP'.format(tmpDir), display = self.GetDisplayFiles());
+                    origenCalculation.TAPE9 = ReadFile('{}TAPE9.INP'.format(tmpDir), display = self.GetDisplayFiles());
+                    self.cellNumber2OrigenCalculation[cellNumber] = origenCalculation;
+            finally:
+                RemoveTree(tmpDir, display = self.GetDisplayFiles());
+        ###
+        return;
+    ###
+    def TransmuteThreads(self, transportOutputFile, currentDir, isTransportPopulated = False):
         '''Execute transmute concurrently for each cell.''';
         ###
         # Kick out, if this is a transport-only simulation
@@ -1167,27 +1557,80 @@ class DepletionCalculation:
             ###
             return;
         ###
-        PrintNow('> Executing {:d} concurrent ORIGEN thread(s) for {}'.format(self.GetParameter('numberOfOrigenThreads'), self.GetDepletionString()));
         ###
-        # Multiple concurrent ORIGEN threads for each burn cell
+        # Extract transmutation cross-sections and burn rates for every burn cell at once, unless they were provided
+        ###
+        if not self.GetIsDecayStep() and not self.GetIsPickleTransmute() and not isTransportPopulated:
+            self.PopulateTransportMicros(transportOutputFile);
+        ###
+        isProcessPool = 'process' == self.GetParameter('origenExecutorType');
+        ###
+        PrintNow('> Executing {:d} concurrent ORIGEN {}(s) for {}'.format(self.GetParameter('numberOfOrigenThreads'), ['thread', 'process'][isProcessPool], self.GetDepletionString()));
+        ###
+        # Multiple concurrent ORIGEN threads or processes for each burn cell
         ###
         self.cellNumber2BurnRate = {};
         ###
+        # Stage ORIGEN tapes under the requested root (e.g., /dev/shm), if any, or the system temporary directory;
+        # The requested root is checked once per run
+        ###
+        if not hasattr(self, 'origenStagingPath'):
+            self.origenStagingPath = self.GetParameter('origenStagingPath');
+            if self.origenStagingPath is not None and (not IsDirectory(self.origenStagingPath) or not Access(self.origenStagingPath, W_OK)):
+                Warning('ORIGEN staging path `{}\' is not a writable directory; staging in the system temporary directory'.format(self.origenStagingPath));
+                self.origenStagingPath = None;
+        ###
         thread = 0;
         threads = len(self.GetBurnCells());
-        with Futures.ThreadPoolExecutor(max_workers = self.GetParameter('numberOfOrigenThreads')) as executor:
-            future2CellNumber = {executor.submit(self.TransmuteThread, cellNumber, transportOutputFile, currentDir) : cellNumber for cellNumber in self.GetBurnCells()};
+        if isProcessPool:
+            ###
+            # Forked worker processes inherit this depletion calculation and transport results;
+            # Each worker stages the ORIGEN executable and static libraries once, in its own scratch directory;
+            # Every worker scratch directory lives within one parent directory, so that workers which never receive a cell are removed too;
+            # Background pickle writes are finished first, as forking amid a writing thread is unsafe
             ###
-            for future in Futures.as_completed(future2CellNumber):
-                if future.exception() is not None:
-                    raise(future.exception());
+            self.WaitForPickles();
+            global transmuteProcessState;
+            processDir = MakeTemporaryDirectory(display = self.GetDisplayFiles(), root = self.GetOrigenStagingPath());
+            transmuteProcessState = (self, transportOutputFile, currentDir, processDir);
+            ###
+            executor = Futures.ProcessPoolExecutor(max_workers = self.GetParameter('numberOfOrigenThreads'), mp_context = GetMultiprocessingContext('fork'), initializer = TransmuteProcessInitialize);
+        else:
+            executor = Futures.ThreadPoolExecutor(max_workers = self.GetParameter('numberOfOrigenThreads'));
+        ###
+        try:
+            with executor:
+                if isProcessPool:
+                    future2CellNumber = {executor.submit(TransmuteProcess, cellNumber) : cellNumber for cellNumber in self.GetBurnCells()};
                 else:
-                    thread += 1;
-                    PrintNow('> Completed burning cell #{:d} (thread {:d} of {:d})'.format(future2CellNumber[future], thread, threads));
+                    future2CellNumber = {executor.submit(self.TransmuteThread, cellNumber, transportOutputFile, currentDir) : cellNumber for cellNumber in self.GetBurnCells()};
+                ###
+                for future in Futures.as_completed(future2CellNumber):
+                    if future.exception() is not None:
+                        raise(future.exception());
+                    else:
+                        thread += 1;
+                        PrintNow('> Completed burning cell #{:d} ({} {:d} of {:d})'.format(future2CellNumber[future], ['thread', 'process'][isProcessPool], thread, threads));
+        finally:
+            ###
+            # Remove worker scratch directories, whether or not every cell was burned
+            ###
+            if isProcessPool:
+                transmuteProcessState = None;
+                RemoveTree(processDir, display = self.GetDisplayFiles());
         ###
         # Extract and attach cell # -> Origen calculation, ZAm -> moles, micros
         ###
         cellNumber2Transmute = {cellNumber : future.result() for future, cellNumber in future2CellNumber.items()};
+        ###
+        if isProcessPool:
+            ###
+            # Burn rates were recorded within the worker processes
+            ###
+            for cellNumber, (transmute, cellBurnRate) in cellNumber2Transmute.items():
+                self.cellNumber2BurnRate[cellNumber] = cellBurnRate;
+            ###
+            cellNumber2Transmute = {cellNumber : transmute for cellNumber, (transmute, cellBurnRate) in cellNumber2Transmute.items()};
         self.cellNumber2OrigenCalculation, self.cellNumber2Zam2Moles, self.cellNumber2Micros = [{cellNumber : transmute[index] for cellNumber, transmute in cellNumber2Transmute.items()} for index in range(3)];
         ###
         # Populate decay heat (delayed β's and γ's)
@@ -1205,7 +1648,7 @@ class DepletionCalculation:
         ###
         # Move to temporary directory
         ###
-        tmpDir = MakeTemporaryDirectory(display = self.GetDisplayFiles());
+        tmpDir = MakeTemporaryDirectory(display = self.GetDisplayFiles(), root = self.GetOrigenStagingPath());
         ###
         # Write transmutation inputs;
         ###
@@ -1220,13 +1663,15 @@ class DepletionCalculation:
         ###
         origenCalculation.AttachMicros(micros);
         ###
+        # Copy tapes back, if requested;
         # Clean up files
         ###
+        self.RetainTapes(cellNumber, tmpDir, currentDir);
         self.CleanUpFiles(tmpDir);
         ###
         return origenCalculation, zam2Moles, micros;
     ###
-    def PrepareTransmute(self, transportOutputFile, cell, tmpDir = './'):
+    def PrepareTransmute(self, transportOutputFile, cell, tmpDir = './', isStaged = False):
         '''Prepare transmute calculation.''';
         PrintNow('> Writing transmute input for cell #{:d}'.format(cell.GetNumber()));
         ###
@@ -1234,19 +1679,17 @@ class DepletionCalculation:
         ###
         cellNumber = cell.GetNumber();
         ###
-        # origen (ORIGEN executable)
-        ###
-        SymbolicLink(self.GetParameter('origenExecutablePath'), '{}origen'.format(tmpDir), display = self.GetDisplayFiles());
+        # origen (ORIGEN executable);
+        # TAPE10.INP (default photon library)
         ###
-        # TAPE10.INP (default photon library):
+        if not isStaged:
+            self.StageTransmute(tmpDir);
         ###
         if self.GetIsPickleTransmute():
             ###
             # This is a pickle transmute cycle, so grab the unpickled TAPE10
             ###
             WriteFile('{}TAPE10.INP'.format(tmpDir), self.GetDepletionStepPickle().GetCellNumberTAPE10(cellNumber), display = self.GetDisplayFiles());
-        else:
-            WriteFile('{}TAPE10.INP'.format(tmpDir), self.GetDefaultPhotonLibrary(), display = self.GetDisplayFiles());
         ###
         # TAPE4.INP (.pch punch card):
         # Cell moles
@@ -1263,7 +1706,9 @@ class DepletionCalculation:
             ###
             zam2Moles = {Za2Zam(za) : moles for za, moles in cell.GetZa2Moles().items()};
         ###
-        WriteFile('{}TAPE4.INP'.format(tmpDir), '\n'.join(origenPunchCardTemplate.format(lib = lib % 10, zam = zam, moles = zam2Moles[zam]) for lib, zams in sorted(self.GetLib2Zams().items()) for zam in zams if zam in zam2Moles) + '\n0 0 0 0', display = self.GetDisplayFiles());
+        # Punch isotopes in library file order, which sub-library isotope sets do not keep
+        ###
+        WriteFile('{}TAPE4.INP'.format(tmpDir), '\n'.join(origenPunchCardTemplate.format(lib = lib % 10, zam = zam, moles = zam2Moles[zam]) for lib, zam2Excite in sorted(self.lib2Zam2Excite.items()) for zam in zam2Excite if zam in zam2Moles) + '\n0 0 0 0', display = self.GetDisplayFiles());
         ###
         # TAPE9.INP (default decay and modified cross-section library):
         # Cell microscopic cross-sections
@@ -1296,36 +1741,25 @@ class DepletionCalculation:
                     ###
                     return [multipliers[index] * micros[(zam, mts[index])] for index in range(-4, 2)];
                 ###
-                # Extract transmutation cross-sections
+                # Grab this cell's row of transmutation cross-sections
                 ###
-                tallyNumber = self.GetTransmuteTallyNumber();
-                tally = next(tally for tally in transportOutputFile.GetTallys('fm4') if tallyNumber == tally.GetNumber());
-                micros = {(Zaid2Zam(self.GetMaterialNumberZaid(materialNumber)), reactionNumber) : transportOutputFile.GetCellNumberMicroscopicCrossSection(cellNumber, materialNumber, reactionNumber) for materialNumber, reactionNumber in (tallyBin[2 : ] for tallyBin in tally.GetMultiplierBins() if cellNumber == tallyBin[0]) if materialNumber};
+                micros = self.GetCellNumberTransportMicros(cellNumber);
                 ###
                 cellZams = set(zam for zam, reactionNumber in micros);
                 ###
-                reXs = ReCompile(r'^ *(\d+) +(\d+)');
-                xsLibraryLines = [];
-                for line in self.GetDefaultXsLibrary().split('\n'):
-                    match = reXs.search(line);
-                    ###
-                    # Kick out if format line
-                    ###
-                    if match is None:
-                        xsLibraryLines.append(line);
-                        ###
+                # Fill only the library slots of this cell's isotopes
+                ###
+                xsLibraryLines = list(self.GetXsLibraryLines());
+                for zam in cellZams:
+                    try:
+                        slots = self.GetZam2XsLibrarySlots()[zam];
+                    except KeyError:
                         continue;
                     ###
-                    lib, zam = match.groups();
-                    ###
-                    zam = int(float(zam));
-                    if zam in cellZams:
-                        lib = int(float(lib));
+                    for lib, slot in slots:
                         mts = self.GetOrigen2LibMts(lib);
                         ###
-                        line = origenXsLibraryTemplate.format(lib = lib, zam = zam, sigma = HelperMicros(zam, micros, mts, self.GetLibZamExcite(lib, zam)));
-                    ###
-                    xsLibraryLines.append(line);
+                        xsLibraryLines[slot] = origenXsLibraryTemplate.format(lib = lib, zam = zam, sigma = HelperMicros(zam, micros, mts, self.GetLibZamExcite(lib, zam)));
                 ###
                 WriteFile('{}TAPE9.INP'.format(tmpDir), self.GetDefaultDecayLibrary() + '\n'.join(xsLibraryLines), display = self.GetDisplayFiles());
         ###
@@ -1354,19 +1788,9 @@ class DepletionCalculation:
                 ###
                 # Burn cell
                 ###
-                if self.GetParameter('isPowerMode'):
-                    ###
-                    # Extract ORIGEN power that matches flux magnitudes
-                    ###
-                    cellBurnRate = transportOutputFile.GetCellNumberOrigenPower(cellNumber, isOrigen2 = self.GetIsOrigen2());
-                    ###
-                    # Convert powers Wth -> MWth
-                    ###
-                    cellBurnRate *= 1e-6;
-                else:
-                    cellBurnRate = float(transportOutputFile.GetCellNumberScalarFlux(cellNumber));
+                cellBurnRate = self.GetCellNumberTransportBurnRate(cellNumber);
             ###
-            timeLapse = self.GetDepletionStepTimeInterval();
+            timeLapse = self.GetTransmuteTimeInterval();
             timeSteps = len([line for line in origenInputFileTemplate.split('\n') if 'timeEnds' in line]);
             timeEnds = [timeLapse * (index + 1) / timeSteps for index in range(timeSteps)];
             ###
@@ -1376,6 +1800,57 @@ class DepletionCalculation:
         ###
         return zam2Moles, micros;
     ###
+    def PopulateTransportMicros(self, transportOutputFile):
+        '''Extract transmutation cross-sections for all burn cells in one pass over the transmute tally, and their burn rates.''';
+        tallyNumber = self.GetTransmuteTallyNumber();
+        ###
+        # Cell # x (material #, reaction #) cross-sections
+        ###
+        cellNumbers = list(self.GetBurnCells());
+        bins, micros = transportOutputFile.GetMicroscopicCrossSectionMatrix(cellNumbers, tallyNumber);
+        bin2Column = {tallyBin : column for column, tallyBin in enumerate(bins)};
+        ###
+        # Only bins which are tallied for a cell are kept for it
+        ###
+        cellNumber2Bins = {cellNumber : [] for cellNumber in cellNumbers};
+        for cellNumber, multiplier, materialNumber, reactionNumber in transportOutputFile.FindTally(tallyNumber, 'fm4').GetMultiplierBins():
+            if materialNumber and cellNumber in cellNumber2Bins:
+                cellNumber2Bins[cellNumber].append((materialNumber, reactionNumber));
+        ###
+        # Cell # -> (isotope, reaction #) -> cross-section
+        ###
+        self.cellNumber2TransportMicros = {};
+        for row, cellNumber in enumerate(cellNumbers):
+            self.cellNumber2TransportMicros[cellNumber] = {(Zaid2Zam(self.GetMaterialNumberZaid(materialNumber)), reactionNumber) : float(micros[row, bin2Column[(materialNumber, reactionNumber)]]) for materialNumber, reactionNumber in cellNumber2Bins[cellNumber]};
+        ###
+        # Cell # -> flux or power
+        ###
+        if self.GetParameter('isPowerMode'):
+            ###
+            # Extract ORIGEN power that matches flux magnitudes;
+            # Convert powers Wth -> MWth
+            ###
+            self.cellNumber2TransportBurnRate = {cellNumber : float(transportOutputFile.GetCellNumberOrigenPower(cellNumber, isOrigen2 = self.GetIsOrigen2())) * 1e-6 for cellNumber in cellNumbers};
+        else:
+            self.cellNumber2TransportBurnRate = {cellNumber : float(transportOutputFile.GetCellNumberScalarFlux(cellNumber)) for cellNumber in cellNumbers};
+        ###
+        return;
+    ###
+    def StageTransmute(self, tmpDir = './'):
+        '''Place files which are shared by every cell\'s transmute calculation.''';
+        ###
+        # origen (ORIGEN executable)
+        ###
+        SymbolicLink(self.GetParameter('origenExecutablePath'), '{}origen'.format(tmpDir), display = self.GetDisplayFiles());
+        ###
+        # TAPE10.INP (default photon library);
+        # Pickle transmute cycles write a TAPE10 for each cell
+        ###
+        if not self.GetIsPickleTransmute():
+            WriteFile('{}TAPE10.INP'.format(tmpDir), self.GetDefaultPhotonLibrary(), display = self.GetDisplayFiles());
+        ###
+        return;
+    ###
     def Transmute(self, cell, tmpDir = './', currentDir = ''):
         '''Execute ORIGEN2.''';
         PrintNow('> Burning cell #{:d} at {:10.5E} {:s} in `{:s}\''.format(cell.GetNumber(), self.GetCellNumberBurnRate(cell.GetNumber()), self.GetParameter('burnUnits'), tmpDir));
@@ -1387,7 +1862,7 @@ class DepletionCalculation:
         ###
         # Execute ORIGEN
         ###
-        SystemCall(self.GetParameter('origenRunCommand').format(tmpDir, currentDir));
+        self.GetCommandRunner().Run(self.GetParameter('origenRunCommand').format(tmpDir, currentDir), timeout = self.GetParameter('origenTimeout'));
         ###
         # Parse transmute results
         ###
@@ -1399,19 +1874,82 @@ class DepletionCalculation:
         ###
         self.depletionStep2DepletionStepPickle[self.GetDepletionStep()] = DepletionStepPickle('{}.{}'.format(self.GetFileName(withoutTH = True), 'pkl'), transportOutputFile, self);
         ###
+        # Append to the depletion calculation pickle as soon as the step is pickled
+        ###
+        self.AppendDepletionCalculationPickle();
+        ###
+        return;
+    ###
+    def SchedulePickle(self, function):
+        '''Write a depletion step pickle, in the background if requested.''';
+        if not self.GetParameter('backgroundPickling'):
+            function();
+            return;
+        ###
+        # A single writer keeps pickles in depletion step order
+        ###
+        if not hasattr(self, 'pickleExecutor'):
+            self.pickleExecutor = Futures.ThreadPoolExecutor(max_workers = 1);
+            self.pickleFutures = [];
+        self.pickleFutures.append(self.pickleExecutor.submit(function));
+        ###
+        return;
+    ###
+    def WaitForPickles(self, isShutdown = False):
+        '''Block until background pickle writes are complete, re-raising their errors.''';
+        if not hasattr(self, 'pickleExecutor'):
+            return;
+        ###
+        for future in self.pickleFutures:
+            future.result();
+        self.pickleFutures = [];
+        ###
+        # Raw transport text of written step pickles is released here, rather than by the writer thread
+        ###
+        for depletionStepPickle in self.depletionStep2DepletionStepPickle.values():
+            if depletionStepPickle is not None:
+                depletionStepPickle.ReleaseRaw();
+        ###
+        if isShutdown:
+            self.pickleExecutor.shutdown();
+            del(self.pickleExecutor, self.pickleFutures);
+        ###
+        return;
+    ###
+    def AppendDepletionCalculationPickle(self):
+        '''Append current depletion step to the depletion calculation pickle and release step pickles which are no longer needed.''';
+        ###
+        # Bulky per-step results are appended to a file, rather than held in memory until the end of depletion
+        ###
+        if self.GetAppendedDepletionCalculationPickle() is None:
+            self.appendedDepletionCalculationPickle = DepletionCalculationPickle(self, isCollate = False);
+        ###
+        self.GetAppendedDepletionCalculationPickle().AppendDepletionStep(self);
+        ###
+        # Only the current step pickle is referenced by the next depletion step
+        ###
+        for depletionStep in [depletionStep for depletionStep in self.depletionStep2DepletionStepPickle if depletionStep < self.GetDepletionStep()]:
+            del(self.depletionStep2DepletionStepPickle[depletionStep]);
+        ###
         return;
     ###
     def UnpickleDepletionStep(self):
         '''Un-serialized current depletion step.''';
         PrintNow('> Unpickling {}'.format(self.GetDepletionString()));
         ###
-        extension = 'pkl';
-        if self.GetParameter('compressPickles'):
-            extension += '.gz';
+        return DepletionStepPickle(PickleFileName(self.GetFileName(withoutTH = True), self.GetParameters()));
+    ###
+    def RetainTapes(self, cellNumber, tmpDir, currentDir):
+        '''Copy transmute files back to the working directory, if requested.''';
+        if not self.GetParameter('retainOrigenTapes'):
+            return;
+        ###
+        for tapeName in ['TAPE{:d}.INP'.format(tapeNumber) for tapeNumber in (3, 4, 5, 9, 10)] + ['TAPE{:d}.OUT'.format(tapeNumber) for tapeNumber in (6, 7, 11, 12, 13, 15, 16, 50)]:
+            CopyFile('{}{}'.format(tmpDir, tapeName), '{}{}.c{:d}.{}'.format(currentDir, self.GetFileName(), cellNumber, tapeName), display = self.GetDisplayFiles());
         ###
-        return DepletionStepPickle('{}.{}'.format(self.GetFileName(withoutTH = True), extension));
+        return;
     ###
-    def CleanUpFiles(self, tmpDir = None):
+    def CleanUpFiles(self, tmpDir = None, keepStaged = False):
         '''Remove transmute files.''';
         if tmpDir is None:
             ###
@@ -1421,16 +1959,20 @@ class DepletionCalculation:
                 RemoveFile(self.GetFileName(extension), display = self.GetDisplayFiles());
         else:
             ###
-            # Transmute files
+            # Transmute files;
+            # Staged files are kept for the next cell when requested
             ###
             for tapeNumber in (3, 4, 5, 9, 10):
+                if keepStaged and 10 == tapeNumber and not self.GetIsPickleTransmute():
+                    continue;
                 RemoveFile('{}TAPE{:d}.INP'.format(tmpDir, tapeNumber), display = self.GetDisplayFiles());
             ###
             for tapeNumber in (6, 7, 11, 12, 13, 15, 16, 50):
                 RemoveFile('{}TAPE{:d}.OUT'.format(tmpDir, tapeNumber), display = self.GetDisplayFiles());
             ###
-            RemoveFile('{}origen'.format(tmpDir), display = self.GetDisplayFiles());
-            RemoveDirectory(tmpDir, display = self.GetDisplayFiles());
+            if not keepStaged:
+                RemoveFile('{}origen'.format(tmpDir), display = self.GetDisplayFiles());
+                RemoveDirectory(tmpDir, display = self.GetDisplayFiles());
         ###
         return;
     ###
@@ -1456,25 +1998,18 @@ class DepletionCalculation:
 ###
 class DepletionCalculationPickle:
     '''Pickle for depletion calculation.''';
-    def __init__(self, args):
+    def __init__(self, args, isCollate = True):
         '''Construct a new instance.''';
         if isinstance(args, str):
             PrintNow('> Unpickling depletion calculation');
             ###
             fileName = args;
             ###
-            # Maybe gunzip;
+            # Maybe decompress;
             # Unpickle
             ###
             PrintNow('{} >>'.format(fileName));
-            try:
-                with open(fileName, 'rb') as f:
-                    ###
-                    pickle = UnPickle(f);
-            except UnpicklingError:
-                with GzipOpen(fileName, 'rb') as f:
-                    ###
-                    pickle = UnPickle(f);
+            pickle = UnpickleFile(fileName);
             ###
             # Transfer pickle attributes to instance
             ###
@@ -1483,134 +2018,48 @@ class DepletionCalculationPickle:
                     setattr(self, attribute, getattr(pickle, attribute));
                 except AttributeError:
                     Warning('The depletion calculation pickle was created with an older version of {}'.format(__file__));
+            ###
+            # Columnar history is saved alongside the pickle
+            ###
+            self.historyFileName = '{}.npz'.format(fileName[ : fileName.rindex('.pkl')]);
         ###
         else:
-            PrintNow('> Pickling depletion calculation');
-            ###
             depletionCalculation = args;
             ###
-            # Input parameters
-            ###
-            self.parameters = depletionCalculation.GetParameters();
-            ###
-            # Transport
+            # Append-only store, filled as depletion steps are pickled;
+            # Bulky per-step results are appended to a steps file, which is truncated here
             ###
-            self.cellNumber2Zaid2NumberDensitys = {};
-            self.cellNumber2Zaid2MassDensitys = {};
-            ###
-            self.multiplicationFactors = [];
-            self.multiplicationFactorSigmas = [];
-            self.neutronsPerFissions = [];
-            self.mevPerFissions = [];
-            self.sourceRates = [];
-            ###
-            self.cellNumber2DecayPowers = {};
-            self.cellNumber2FissionPowers = {};
-            self.cellNumber2PromptPowers = {};
-            self.cellNumber2ScalarFluxes = {};
-            self.cellNumber2ThermalPowers = {};
-            ###
-            # Transport convergence
+            if not isCollate:
+                self.PopulateContainers(depletionCalculation);
+                ###
+                self.stepsFileName = '{}.steps.pkl'.format(depletionCalculation.GetOriginalTransportFile().GetFileName());
+                RemoveFile(self.stepsFileName, display = depletionCalculation.GetDisplayFiles());
+                self.numberOfFiledSteps = 0;
+                ###
+                return;
             ###
-            self.coolantDensityCalculations = [];
-            self.fuelTemperatureCalculations = [];
+            PrintNow('> Pickling depletion calculation');
             ###
-            # Transmute
+            # Adopt depletion steps which were appended during depletion, reading back their bulky results;
+            # Otherwise, start from empty containers
             ###
-            self.cellNumber2BurnRates = {};
-            self.cellNumber2Micros = {};
-            self.cellNumber2OrigenFluxes = {};
-            self.cellNumber2OrigenPowers = {};
-            self.cellNumber2Zam2Moles = {};
+            appendedDepletionCalculationPickle = depletionCalculation.GetAppendedDepletionCalculationPickle();
+            if appendedDepletionCalculationPickle is None:
+                self.PopulateContainers(depletionCalculation);
+            else:
+                self.__dict__.update(appendedDepletionCalculationPickle.__dict__);
+                self.PopulateAppendedSteps(display = depletionCalculation.GetDisplayFiles());
             ###
-            # Iterate over depletion steps
+            # Iterate over remaining depletion steps
             ###
-            depletionCalculation.depletionStep = 0;
+            depletionCalculation.depletionStep = self.GetNumberOfAppendedSteps();
             while depletionCalculation.GetDepletionStep() <= len(depletionCalculation):
-                ###
-                # Extract depletion step pickle;
-                # Parse transport input file;
-                # Maybe parse transport output file
-                ###
-                depletionStepPickle = depletionCalculation.GetDepletionStepPickle();
-                ###
-                # Transport
-                ###
-                self.multiplicationFactors.append(depletionStepPickle.GetMultiplicationFactor());
-                self.multiplicationFactorSigmas.append(depletionStepPickle.GetMultiplicationFactorSigma());
-                self.neutronsPerFissions.append(depletionStepPickle.GetNeutronsPerFission());
-                self.mevPerFissions.append(depletionStepPickle.GetMevPerFission());
-                self.sourceRates.append(depletionStepPickle.GetSourceRate());
-                ###
-                # Transport convergence
-                ###
-                self.coolantDensityCalculations.append(depletionStepPickle.GetCoolantDensityCalculations());
-                self.fuelTemperatureCalculations.append(depletionStepPickle.GetFuelTemperatureCalculations());
-                ###
-                # Iterate over power cells for transport results
-                ###
-                for cellNumber in depletionStepPickle.GetPowerCells():
-                    ###
-                    # Instantiate cell lists
-                    ###
-                    if 0 == depletionCalculation.GetDepletionStep():
-                        self.cellNumber2Zaid2NumberDensitys[cellNumber] = [];
-                        self.cellNumber2Zaid2MassDensitys[cellNumber] = [];
-                        ###
-                        self.cellNumber2DecayPowers[cellNumber] = [];
-                        self.cellNumber2FissionPowers[cellNumber] = [];
-                        self.cellNumber2PromptPowers[cellNumber] = [];
-                        self.cellNumber2ScalarFluxes[cellNumber] = [];
-                        self.cellNumber2ThermalPowers[cellNumber] = [];
-                    ###
-                    self.cellNumber2Zaid2NumberDensitys[cellNumber].append(depletionStepPickle.GetCellNumberZaid2NumberDensity(cellNumber));
-                    self.cellNumber2Zaid2MassDensitys[cellNumber].append(depletionStepPickle.GetCellNumberZaid2MassDensity(cellNumber));
-                    ###
-                    self.cellNumber2DecayPowers[cellNumber].append(depletionStepPickle.GetCellNumberDecayPower(cellNumber));
-                    self.cellNumber2FissionPowers[cellNumber].append(depletionStepPickle.GetCellNumberFissionPower(cellNumber));
-                    self.cellNumber2PromptPowers[cellNumber].append(depletionStepPickle.GetCellNumberPromptPower(cellNumber));
-                    self.cellNumber2ScalarFluxes[cellNumber].append(depletionStepPickle.GetCellNumberScalarFlux(cellNumber));
-                    self.cellNumber2ThermalPowers[cellNumber].append(depletionStepPickle.GetCellNumberThermalPower(cellNumber));
-                ###
-                # Iterate over burn cells for transmute results
-                ###
-                for cellNumber in self.GetBurnCells():
-                    ###
-                    # Instantiate cell lists
-                    ###
-                    if 0 == depletionCalculation.GetDepletionStep():
-                        self.cellNumber2BurnRates[cellNumber] = [];
-                        self.cellNumber2Micros[cellNumber] = [];
-                        self.cellNumber2OrigenFluxes[cellNumber] = [];
-                        self.cellNumber2OrigenPowers[cellNumber] = [];
-                        self.cellNumber2Zam2Moles[cellNumber] = [];
-                    ###
-                    if depletionCalculation.GetDepletionStep() == len(depletionCalculation):
-                        burnRate = micros = None;
-                    else:
-                        burnRate = depletionStepPickle.GetCellNumberBurnRate(cellNumber);
-                        micros = depletionStepPickle.GetCellNumberMicros(cellNumber);
-                    ###
-                    if depletionCalculation.GetDepletionStep() == len(depletionCalculation) or depletionCalculation.GetDepletionStepTimeInterval() == 0:
-                        origenFlux = origenPower = None;
-                    else:
-                        origenFlux = depletionStepPickle.GetCellNumberOrigenFlux(cellNumber);
-                        origenPower = depletionStepPickle.GetCellNumberOrigenPower(cellNumber);
-                    zam2Moles = depletionStepPickle.GetCellNumberZam2Moles(cellNumber);
-                    ###
-                    self.cellNumber2BurnRates[cellNumber].append(burnRate);
-                    self.cellNumber2Micros[cellNumber].append(micros);
-                    self.cellNumber2OrigenFluxes[cellNumber].append(origenFlux);
-                    self.cellNumber2OrigenPowers[cellNumber].append(origenPower);
-                    self.cellNumber2Zam2Moles[cellNumber].append(zam2Moles);
+                self.AppendDepletionStep(depletionCalculation);
                 ###
                 # Increment depletion step
                 ###
                 depletionCalculation.IncrementDepletionStep();
             ###
-            self.powerCells = depletionStepPickle.GetPowerCells();
-            self.cellNumber2Volume = {cellNumber : depletionStepPickle.GetCellNumberVolume(cellNumber) for cellNumber in self.GetPowerCells()};
-            ###
             # Pickle
             ###
             self.Save(baseName = depletionCalculation.GetOriginalTransportFile().GetFileName(), display = depletionCalculation.GetDisplayFiles());
@@ -1621,6 +2070,13 @@ class DepletionCalculationPickle:
         ###
         return;
     ###
+    def __getstate__(self):
+        '''Return attributes to pickle, omitting the derived history.''';
+        state = dict(self.__dict__);
+        state.pop('history', None);
+        ###
+        return state;
+    ###
     def __len__(self):
         '''Return number of depletion steps.''';
         return len(self.GetParameter('depletionStepTimeIntervals')) + 1;
@@ -1628,22 +2084,26 @@ class DepletionCalculationPickle:
     def Save(self, baseName, display):
         '''Save to file.''';
         ###
+        # Columnar history
+        ###
+        self.PopulateHistory();
+        self.GetHistory().Save(baseName = baseName, display = display);
+        ###
+        # Release the in-memory history;
+        # It is sliced from file from now on
+        ###
+        self.historyFileName = '{}.npz'.format(baseName);
+        del(self.history);
+        ###
         # Pickle;
-        # Maybe gzip
+        # Maybe compress
         ###
-        extension = 'pkl';
-        if self.GetParameter('compressPickles'):
-            extension += '.gz';
+        extension = 'pkl' + PickleExtension(self.GetParameters());
         fileName = '{}.{}'.format(baseName, extension);
         ###
         RemoveFile(fileName, display = display);
         PrintNow('{} <<'.format(fileName));
-        if self.GetParameter('compressPickles'):
-            with GzipOpen(fileName, 'wb', compresslevel = 5) as f:
-                f.write(PickleString(self));
-        else:
-            with open(fileName, 'wb') as f:
-                Pickle(self, f);
+        PickleFile(fileName, self, self.GetParameters());
         ###
         return;
     ###
@@ -1673,6 +2133,16 @@ class DepletionCalculationPickle:
         '''Return filename.''';
         return self.fileName;
     ###
+    def GetHistory(self):
+        '''Return columnar depletion history, read from file when saved alongside the pickle.''';
+        if not hasattr(self, 'history'):
+            if hasattr(self, 'historyFileName') and Exists(self.historyFileName):
+                self.history = DepletionHistory(self.historyFileName);
+            else:
+                self.PopulateHistory();
+        ###
+        return self.history;
+    ###
     def GetFIMAs(self):
         '''Return list of FIMAs.''';
         heavyMetalMoles = [sum(moles for cellNumber in self.GetBurnCells() for zam, moles in self.cellNumber2Zam2Moles[cellNumber][depletionStep].items() if ZaIsActinide(Zam2Za(zam))) for depletionStep in range(len(self))];
@@ -1687,6 +2157,17 @@ class DepletionCalculationPickle:
         '''Return list of multiplication factors.''';
         return self.multiplicationFactors;
     ###
+    def GetNumberOfAppendedSteps(self):
+        '''Return number of depletion steps appended.''';
+        return len(self.multiplicationFactors);
+    ###
+    def GetStepsFileName(self):
+        '''Return name of the file to which bulky step results are appended, if any.''';
+        if not hasattr(self, 'stepsFileName'):
+            return None;
+        ###
+        return self.stepsFileName;
+    ###
     def GetMultiplicationFactorSigmas(self):
         '''Return list of multiplication factors standard deviations.''';
         return self.multiplicationFactorSigmas;
@@ -1746,17 +2227,360 @@ class DepletionCalculationPickle:
     ###
     def GetZa2Moles(self):
         '''Get list of dictionaries mapping isotope to mole.''';
-        za2Moles = [];
-        for depletionStep in range(len(self)):
-            za2Moles.append({});
-            for cellNumber in self.GetBurnCells():
-                for zam, moles in self.cellNumber2Zam2Moles[cellNumber][depletionStep].items():
+        return [self.GetHistory().GetZa2Moles(depletionStep, self.GetBurnCells()) for depletionStep in range(len(self))];
+    ###
+    # Population methods
+    ###
+    def AppendDepletionStep(self, depletionCalculation):
+        '''Append results of the current depletion step.''';
+        assert(depletionCalculation.GetDepletionStep() == self.GetNumberOfAppendedSteps());
+        ###
+        # Extract depletion step pickle;
+        # Parse transport input file;
+        # Maybe parse transport output file
+        ###
+        depletionStepPickle = depletionCalculation.GetDepletionStepPickle();
+        ###
+        # Transport
+        ###
+        self.multiplicationFactors.append(depletionStepPickle.GetMultiplicationFactor());
+        self.multiplicationFactorSigmas.append(depletionStepPickle.GetMultiplicationFactorSigma());
+        self.neutronsPerFissions.append(depletionStepPickle.GetNeutronsPerFission());
+        self.mevPerFissions.append(depletionStepPickle.GetMevPerFission());
+        self.sourceRates.append(depletionStepPickle.GetSourceRate());
+        ###
+        # Bulky per-step results:
+        # Transport convergence, cell densities, microscopic cross-sections, and inventories
+        ###
+        stepRecord = {
+            'coolantDensityCalculations' : depletionStepPickle.GetCoolantDensityCalculations(),
+            'fuelTemperatureCalculations' : depletionStepPickle.GetFuelTemperatureCalculations(),
+            'cellNumber2Zaid2NumberDensitys' : {cellNumber : depletionStepPickle.GetCellNumberZaid2NumberDensity(cellNumber) for cellNumber in depletionStepPickle.GetPowerCells()},
+            'cellNumber2Zaid2MassDensitys' : {cellNumber : depletionStepPickle.GetCellNumberZaid2MassDensity(cellNumber) for cellNumber in depletionStepPickle.GetPowerCells()},
+            'cellNumber2Micros' : {},
+            'cellNumber2Zam2Moles' : {},
+        };
+        ###
+        # Iterate over power cells for transport results
+        ###
+        for cellNumber in depletionStepPickle.GetPowerCells():
+            ###
+            # Instantiate cell lists
+            ###
+            if 0 == depletionCalculation.GetDepletionStep():
+                self.cellNumber2DecayPowers[cellNumber] = [];
+                self.cellNumber2FissionPowers[cellNumber] = [];
+                self.cellNumber2PromptPowers[cellNumber] = [];
+                self.cellNumber2ScalarFluxes[cellNumber] = [];
+                self.cellNumber2ThermalPowers[cellNumber] = [];
+            ###
+            self.cellNumber2DecayPowers[cellNumber].append(depletionStepPickle.GetCellNumberDecayPower(cellNumber));
+            self.cellNumber2FissionPowers[cellNumber].append(depletionStepPickle.GetCellNumberFissionPower(cellNumber));
+            self.cellNumber2PromptPowers[cellNumber].append(depletionStepPickle.GetCellNumberPromptPower(cellNumber));
+            self.cellNumber2ScalarFluxes[cellNumber].append(depletionStepPickle.GetCellNumberScalarFlux(cellNumber));
+            self.cellNumber2ThermalPowers[cellNumber].append(depletionStepPickle.GetCellNumberThermalPower(cellNumber));
+        ###
+        # Iterate over burn cells for transmute results
+        ###
+        for cellNumber in self.GetBurnCells():
+            ###
+            # Instantiate cell lists
+            ###
+            if 0 == depletionCalculation.GetDepletionStep():
+                self.cellNumber2BurnRates[cellNumber] = [];
+                self.cellNumber2OrigenFluxes[cellNumber] = [];
+                self.cellNumber2OrigenPowers[cellNumber] = [];
+            ###
+            if depletionCalculation.GetDepletionStep() == len(depletionCalculation):
+                burnRate = micros = None;
+            else:
+                burnRate = depletionStepPickle.GetCellNumberBurnRate(cellNumber);
+                micros = depletionStepPickle.GetCellNumberMicros(cellNumber);
+            ###
+            if depletionCalculation.GetDepletionStep() == len(depletionCalculation) or depletionCalculation.GetDepletionStepTimeInterval() == 0:
+                origenFlux = origenPower = None;
+            else:
+                origenFlux = depletionStepPickle.GetCellNumberOrigenFlux(cellNumber);
+                origenPower = depletionStepPickle.GetCellNumberOrigenPower(cellNumber);
+            ###
+            self.cellNumber2BurnRates[cellNumber].append(burnRate);
+            self.cellNumber2OrigenFluxes[cellNumber].append(origenFlux);
+            self.cellNumber2OrigenPowers[cellNumber].append(origenPower);
+            ###
+            stepRecord['cellNumber2Micros'][cellNumber] = micros;
+            stepRecord['cellNumber2Zam2Moles'][cellNumber] = depletionStepPickle.GetCellNumberZam2Moles(cellNumber);
+        ###
+        # Append bulky results to the steps file, if any;
+        # Otherwise, hold them in memory
+        ###
+        if self.GetStepsFileName() is None:
+            self.AppendStepRecord(stepRecord);
+        else:
+            with open(self.GetStepsFileName(), 'ab') as f:
+                Pickle(stepRecord, f);
+            self.numberOfFiledSteps += 1;
+        ###
+        self.powerCells = depletionStepPickle.GetPowerCells();
+        self.cellNumber2Volume = {cellNumber : depletionStepPickle.GetCellNumberVolume(cellNumber) for cellNumber in self.GetPowerCells()};
+        ###
+        # Columnar history is now stale
+        ###
+        if hasattr(self, 'history'):
+            del(self.history);
+        ###
+        return;
+    ###
+    def PopulateContainers(self, depletionCalculation):
+        '''Populate empty containers for depletion step results.''';
+        ###
+        # Input parameters
+        ###
+        self.parameters = depletionCalculation.GetParameters();
+        ###
+        # Transport
+        ###
+        self.cellNumber2Zaid2NumberDensitys = {};
+        self.cellNumber2Zaid2MassDensitys = {};
+        ###
+        self.multiplicationFactors = [];
+        self.multiplicationFactorSigmas = [];
+        self.neutronsPerFissions = [];
+        self.mevPerFissions = [];
+        self.sourceRates = [];
+        ###
+        self.cellNumber2DecayPowers = {};
+        self.cellNumber2FissionPowers = {};
+        self.cellNumber2PromptPowers = {};
+        self.cellNumber2ScalarFluxes = {};
+        self.cellNumber2ThermalPowers = {};
+        ###
+        # Transport convergence
+        ###
+        self.coolantDensityCalculations = [];
+        self.fuelTemperatureCalculations = [];
+        ###
+        # Transmute
+        ###
+        self.cellNumber2BurnRates = {};
+        self.cellNumber2Micros = {};
+        self.cellNumber2OrigenFluxes = {};
+        self.cellNumber2OrigenPowers = {};
+        self.cellNumber2Zam2Moles = {};
+        ###
+        return;
+    ###
+    def AppendStepRecord(self, stepRecord):
+        '''Append bulky results of a depletion step.''';
+        for attribute in ('coolantDensityCalculations', 'fuelTemperatureCalculations'):
+            getattr(self, attribute).append(stepRecord[attribute]);
+        ###
+        for attribute in ('cellNumber2Micros', 'cellNumber2Zaid2MassDensitys', 'cellNumber2Zaid2NumberDensitys', 'cellNumber2Zam2Moles'):
+            cellNumber2Values = getattr(self, attribute);
+            for cellNumber, value in stepRecord[attribute].items():
+                try:
+                    cellNumber2Values[cellNumber].append(value);
+                except KeyError:
+                    cellNumber2Values[cellNumber] = [value];
+        ###
+        return;
+    ###
+    def PopulateAppendedSteps(self, display):
+        '''Read bulky results of depletion steps back from the steps file, then remove it.''';
+        if self.GetStepsFileName() is None:
+            return;
+        ###
+        PrintNow('{} >>'.format(self.GetStepsFileName()));
+        with open(self.GetStepsFileName(), 'rb') as f:
+            for index in range(self.numberOfFiledSteps):
+                self.AppendStepRecord(UnPickle(f));
+        ###
+        RemoveFile(self.GetStepsFileName(), display = display);
+        del(self.stepsFileName, self.numberOfFiledSteps);
+        ###
+        return;
+    ###
+    def PopulateHistory(self):
+        '''Populate columnar depletion history from pickled attributes.''';
+        self.history = DepletionHistory(self);
+        ###
+        return;
+###
+# Columnar depletion history
+###
+class DepletionHistory:
+    '''Dense arrays of depletion results indexed by (step, cell, isotope).''';
+    def __init__(self, args):
+        '''Construct a new instance.''';
+        if isinstance(args, str):
+            ###
+            # Arrays are read from the .npz archive one column at a time, upon request
+            ###
+            fileName = args;
+            PrintNow('{} >>'.format(fileName));
+            self.arrayFile = LoadArrays(fileName);
+            self.key2Column = {};
+        else:
+            depletionCalculationPickle = args;
+            self.arrayFile = None;
+            ###
+            def HelperFloats(values):
+                return [[NaN, value][value is not None] for value in values];
+            ###
+            # Axes
+            ###
+            burnCellNumbers = sorted(depletionCalculationPickle.cellNumber2Zam2Moles);
+            powerCellNumbers = sorted(depletionCalculationPickle.cellNumber2DecayPowers);
+            zams = sorted(set(zam for zam2Moles in depletionCalculationPickle.cellNumber2Zam2Moles.values() for zam2Mole in zam2Moles for zam in zam2Mole));
+            numberOfSteps = max([len(depletionCalculationPickle.multiplicationFactors)] + [len(zam2Moles) for zam2Moles in depletionCalculationPickle.cellNumber2Zam2Moles.values()]);
+            ###
+            self.key2Column = {
+                'burnCellNumbers' : Array(burnCellNumbers, dtype = int),
+                'powerCellNumbers' : Array(powerCellNumbers, dtype = int),
+                'zams' : Array(zams, dtype = int),
+            };
+            ###
+            # Step columns
+            ###
+            for key in ('mevPerFissions', 'multiplicationFactorSigmas', 'multiplicationFactors', 'neutronsPerFissions', 'sourceRates'):
+                values = HelperFloats(getattr(depletionCalculationPickle, key));
+                self.key2Column[key] = Array(values + [NaN] * (numberOfSteps - len(values)), dtype = float);
+            ###
+            # (step, cell) columns
+            ###
+            for key, cellNumbers in (('burnRates', burnCellNumbers), ('origenFluxes', burnCellNumbers), ('origenPowers', burnCellNumbers), ('decayPowers', powerCellNumbers), ('fissionPowers', powerCellNumbers), ('promptPowers', powerCellNumbers), ('scalarFluxes', powerCellNumbers), ('thermalPowers', powerCellNumbers)):
+                column = Zeros((numberOfSteps, len(cellNumbers))) + NaN;
+                cellNumber2Values = getattr(depletionCalculationPickle, 'cellNumber2' + key[0].upper() + key[1 : ], {});
+                for cellIndex, cellNumber in enumerate(cellNumbers):
                     try:
-                        za2Moles[depletionStep][Zam2Za(zam)] += moles;
+                        values = HelperFloats(cellNumber2Values[cellNumber]);
                     except KeyError:
-                        za2Moles[depletionStep][Zam2Za(zam)] = moles;
+                        continue;
+                    column[ : len(values), cellIndex] = values;
+                self.key2Column[key] = column;
+            ###
+            # (step, cell, isotope) moles;
+            # Isotopes absent from an inventory hold NaN, unlike those with zero moles;
+            # Steps without inventories for a cell are flagged as unpopulated
+            ###
+            zam2Index = {zam : index for index, zam in enumerate(zams)};
+            moles = Zeros((numberOfSteps, len(burnCellNumbers), len(zams))) + NaN;
+            isPopulated = Zeros((numberOfSteps, len(burnCellNumbers)), dtype = bool);
+            for cellIndex, cellNumber in enumerate(burnCellNumbers):
+                for depletionStep, zam2Mole in enumerate(depletionCalculationPickle.cellNumber2Zam2Moles[cellNumber]):
+                    isPopulated[depletionStep, cellIndex] = bool(zam2Mole);
+                    for zam, mole in zam2Mole.items():
+                        moles[depletionStep, cellIndex, zam2Index[zam]] = mole;
+            self.key2Column['moles'] = moles;
+            self.key2Column['isPopulated'] = isPopulated;
+            ###
+            self.key2Column['volumes'] = Array([depletionCalculationPickle.cellNumber2Volume[cellNumber] for cellNumber in powerCellNumbers], dtype = float);
+        ###
+        return;
+    ###
+    def __len__(self):
+        '''Return number of depletion steps.''';
+        return len(self.GetColumn('multiplicationFactors'));
+    ###
+    def Save(self, baseName, display):
+        '''Save to file.''';
+        fileName = '{}.npz'.format(baseName);
+        ###
+        RemoveFile(fileName, display = display);
+        PrintNow('{} <<'.format(fileName));
+        SaveArrays(fileName, **self.key2Column);
+        ###
+        return;
+    ###
+    # Generic getter methods
+    ###
+    def GetBurnCellNumbers(self):
+        '''Return cells which are depleted.''';
+        return self.GetColumn('burnCellNumbers');
+    ###
+    def GetCellNumberPopulatedSteps(self, cellNumber):
+        '''Return depletion steps which hold inventories for a cell.''';
+        return NonZero(self.GetColumn('isPopulated')[:, self.GetCellIndices([cellNumber])[0]])[0];
+    ###
+    def GetCellIndices(self, cellNumbers, key = 'burnCellNumbers'):
+        '''Return column indices of cells.''';
+        cellNumber2Index = {cellNumber : index for index, cellNumber in enumerate(self.GetColumn(key).tolist())};
+        ###
+        return [cellNumber2Index[cellNumber] for cellNumber in cellNumbers];
+    ###
+    def GetColumn(self, key):
+        '''Return a column array, reading it from file once.''';
+        try:
+            return self.key2Column[key];
+        except KeyError:
+            self.key2Column[key] = self.arrayFile[key];
+        ###
+        return self.key2Column[key];
+    ###
+    def GetMoles(self, depletionSteps = None, cellNumbers = None, zams = None):
+        '''Return moles sliced by depletion step, cell, and isotope, with NaN for isotopes absent from an inventory.''';
+        moles = self.GetColumn('moles');
+        numberOfSteps, numberOfCells, numberOfZams = moles.shape;
+        ###
+        if depletionSteps is None:
+            depletionSteps = range(numberOfSteps);
+        ###
+        if cellNumbers is None:
+            cellIndices = range(numberOfCells);
+        else:
+            cellIndices = self.GetCellIndices(cellNumbers);
+        ###
+        if zams is None:
+            zamIndices = range(numberOfZams);
+        else:
+            zamIndices = self.GetZamIndices(zams);
+        ###
+        return moles[MeshIndex(list(depletionSteps), list(cellIndices), list(zamIndices))];
+    ###
+    def GetMultiplicationFactors(self):
+        '''Return multiplication factors, with NaN for steps without transport.''';
+        return self.GetColumn('multiplicationFactors');
+    ###
+    def GetMultiplicationFactorSigmas(self):
+        '''Return multiplication factor standard deviations, with NaN for steps without transport.''';
+        return self.GetColumn('multiplicationFactorSigmas');
+    ###
+    def GetPowerCellNumbers(self):
+        '''Return cells which are dense enough to provide power.''';
+        return self.GetColumn('powerCellNumbers');
+    ###
+    def GetTransportSteps(self):
+        '''Return depletion steps with transport results.''';
+        return NonZero(~IsNan(self.GetMultiplicationFactors()))[0];
+    ###
+    def GetZa2Moles(self, depletionStep, cellNumbers = None):
+        '''Return dictionary mapping isotope to moles summed over cells for a depletion step.''';
+        cellMoles = self.GetMoles([depletionStep], cellNumbers)[0];
+        ###
+        za2Moles = {};
+        for zam, moles, isPresent in zip(self.GetZams().tolist(), Nan2Num(cellMoles).sum(axis = 0).tolist(), (~IsNan(cellMoles)).any(axis = 0).tolist()):
+            ###
+            # Kick out isotopes absent from these cells;
+            # Isotopes with zero moles are kept
+            ###
+            if not isPresent:
+                continue;
+            ###
+            try:
+                za2Moles[Zam2Za(zam)] += moles;
+            except KeyError:
+                za2Moles[Zam2Za(zam)] = moles;
         ###
         return za2Moles;
+    ###
+    def GetZamIndices(self, zams):
+        '''Return column indices of isotopes.''';
+        zam2Index = {zam : index for index, zam in enumerate(self.GetZams().tolist())};
+        ###
+        return [zam2Index[zam] for zam in zams];
+    ###
+    def GetZams(self):
+        '''Return isotopes.''';
+        return self.GetColumn('zams');
 ###
 # Depletion step dump
 ###
@@ -1772,8 +2596,7 @@ class DepletionStepPickle:
             ###
             # General
             ###
-            if depletionCalculation.GetParameter('compressPickles'):
-                fileName += '.gz';
+            fileName += PickleExtension(depletionCalculation.GetParameters());
             self.fileName = fileName;
             self.powerCells = transportFile.GetPowerCells();
             self.cellNumber2Volume = {cellNumber : transportFile.FindCell(cellNumber).GetVolume() for cellNumber in self.GetPowerCells()};
@@ -1800,6 +2623,44 @@ class DepletionStepPickle:
             self.cellNumber2Micros = cellNumber2Micros;
             self.cellNumber2Zam2Moles = cellNumber2Zam2Moles;
             ###
+            # Libraries shared by cells (TAPE9 and TAPE10) are stored once, content-addressed by digest;
+            # Each cell's TAPE9 is stored as its substituted lines of the default decay and cross-section library
+            ###
+            self.tapeDigest2Blob = {};
+            self.cellNumber2TapeKeys = {};
+            self.cellNumber2Tapes = {};
+            if cellNumber2OrigenCalculation is not None:
+                defaultLibraryLines = (depletionCalculation.GetDefaultDecayLibrary() + depletionCalculation.GetDefaultXsLibrary()).split('\n');
+                defaultLibraryDigest = self.InternTapeBlob('\n'.join(defaultLibraryLines));
+                ###
+                self.cellNumber2OrigenCalculation = {};
+                for cellNumber, origenCalculation in cellNumber2OrigenCalculation.items():
+                    ###
+                    # Calculations which were themselves unpickled no longer carry their tapes
+                    ###
+                    if origenCalculation.GetTAPE9() is None:
+                        tape9Key = None;
+                    else:
+                        lines = origenCalculation.GetTAPE9().split('\n');
+                        if len(lines) == len(defaultLibraryLines):
+                            tape9Key = (defaultLibraryDigest, {slot : line for slot, (line, defaultLine) in enumerate(zip(lines, defaultLibraryLines)) if line != defaultLine});
+                        else:
+                            tape9Key = (self.InternTapeBlob(origenCalculation.GetTAPE9()), {});
+                    ###
+                    if origenCalculation.GetTAPE10() is None:
+                        tape10Key = None;
+                    else:
+                        tape10Key = self.InternTapeBlob(origenCalculation.GetTAPE10());
+                    ###
+                    self.cellNumber2TapeKeys[cellNumber] = (tape9Key, tape10Key);
+                    self.cellNumber2Tapes[cellNumber] = {tapeName : getattr(origenCalculation, tapeName) for tapeName in ('TAPE4', 'TAPE5', 'TAPE6', 'TAPE7')};
+                    ###
+                    # Pickle a copy without the tapes, leaving the live calculation intact
+                    ###
+                    origenCalculation = ShallowCopy(origenCalculation);
+                    origenCalculation.TAPE4 = origenCalculation.TAPE5 = origenCalculation.TAPE6 = origenCalculation.TAPE7 = origenCalculation.TAPE9 = origenCalculation.TAPE10 = None;
+                    self.cellNumber2OrigenCalculation[cellNumber] = origenCalculation;
+            ###
             # Transport input
             ###
             self.transportInputRaw = transportFile.GetInputRaw();
@@ -1831,17 +2692,22 @@ class DepletionStepPickle:
                 self.cellNumber2PromptPower = {cellNumber : depletionCalculation.GetCellNumberThermalPower(transportFile, cellNumber, includeDecayHeat = False) for cellNumber in self.GetPowerCells()};
                 self.cellNumber2ThermalPower = {cellNumber : depletionCalculation.GetCellNumberThermalPower(transportFile, cellNumber, includeDecayHeat = True) for cellNumber in self.GetPowerCells()};
             ###
-            # Pickle;
-            # Maybe gzip
+            # Pickle sections, then small metadata;
+            # Maybe compress
             ###
-            RemoveFile(fileName, display = depletionCalculation.GetDisplayFiles());
-            PrintNow('{} <<'.format(fileName));
-            if depletionCalculation.GetParameter('compressPickles'):
-                with GzipOpen(fileName, 'wb', compresslevel = 5) as f:
-                    f.write(PickleString(self));
-            else:
-                with open(fileName, 'wb') as f:
-                    Pickle(self, f);
+            sectionedAttributes = set(attribute for attributes in depletionStepPickleSection2Attributes.values() for attribute in attributes);
+            fileName2Contents = [(self.GetSectionFileName(section), {attribute : getattr(self, attribute) for attribute in attributes}) for section, attributes in depletionStepPickleSection2Attributes.items()];
+            ###
+            metadata = DepletionStepPickle.__new__(DepletionStepPickle);
+            metadata.__dict__.update({attribute : value for attribute, value in self.__dict__.items() if attribute not in sectionedAttributes});
+            fileName2Contents.append((fileName, metadata));
+            ###
+            # Contents are snapshotted above, so writing them may overlap the next depletion step;
+            # Raw transport text is released only once it is written, and always by the main thread
+            ###
+            depletionCalculation.SchedulePickle(Partial(self.SaveSections, fileName2Contents, depletionCalculation));
+            if not depletionCalculation.GetParameter('backgroundPickling'):
+                self.ReleaseRaw();
         ###
         elif 1 == len(args):
             ###
@@ -1849,29 +2715,44 @@ class DepletionStepPickle:
             ###
             fileName, = args;
             ###
-            # Maybe gunzip;
+            # Maybe decompress;
             # Unpickle
             ###
             PrintNow('{} >>'.format(fileName));
-            try:
-                with open(fileName, 'rb') as f:
-                    ###
-                    pickle = UnPickle(f);
-            except UnpicklingError:
-                with GzipOpen(fileName, 'rb') as f:
-                    ###
-                    pickle = UnPickle(f);
+            pickle = UnpickleFile(fileName);
             ###
-            # Transfer pickle attributes to instance
+            # Transfer pickle metadata attributes to instance
             ###
-            for attribute in ('cellNumber2BurnRate', 'cellNumber2DecayPower', 'cellNumber2FissionPower', 'cellNumber2NextDecayPower', 'cellNumber2Micros', 'cellNumber2OrigenCalculation', 'cellNumber2PromptPower', 'cellNumber2ScalarFlux', 'cellNumber2ThermalPower', 'cellNumber2Volume', 'cellNumber2Zaid2NumberDensity', 'cellNumber2Zaid2MassDensity', 'cellNumber2Zam2Moles', 'coolantDensityCalculations', 'fileName', 'fuelTemperatureCalculations', 'parameters', 'mevPerFission', 'multiplicationFactor', 'multiplicationFactorSigma', 'neutronsPerFission', 'powerCells', 'sourceRate', 'transportInputRaw', 'transportOutputRaw', 'xsDirZaids'):
+            for attribute in ('cellNumber2BurnRate', 'cellNumber2DecayPower', 'cellNumber2FissionPower', 'cellNumber2NextDecayPower', 'cellNumber2PromptPower', 'cellNumber2ScalarFlux', 'cellNumber2ThermalPower', 'cellNumber2Volume', 'coolantDensityCalculations', 'fileName', 'fuelTemperatureCalculations', 'parameters', 'mevPerFission', 'multiplicationFactor', 'multiplicationFactorSigma', 'neutronsPerFission', 'powerCells', 'sourceRate', 'xsDirZaids'):
                 try:
                     setattr(self, attribute, getattr(pickle, attribute));
                 except AttributeError:
                     Warning('The depletion step pickle was created with an older version of {}'.format(__file__));
+            ###
+            # Sections are loaded upon first access;
+            # Pickles created before sectioning hold every attribute
+            ###
+            self.fileName = fileName;
+            for attributes in depletionStepPickleSection2Attributes.values():
+                for attribute in attributes:
+                    if attribute in pickle.__dict__:
+                        setattr(self, attribute, pickle.__dict__[attribute]);
         ###
         return;
     ###
+    def __getattr__(self, attribute):
+        '''Load the section holding an attribute upon its first access.''';
+        for section, attributes in depletionStepPickleSection2Attributes.items():
+            if attribute in attributes:
+                self.LoadSection(section);
+                ###
+                try:
+                    return self.__dict__[attribute];
+                except KeyError:
+                    break;
+        ###
+        raise AttributeError(attribute);
+    ###
     # Generic getter methods
     ###
     def GetBurnCells(self):
@@ -1924,27 +2805,60 @@ class DepletionStepPickle:
     ###
     def GetCellNumberTAPE4(self, cellNumber):
         '''Return ORIGEN TAPE4 of a cell for this depletion step.''';
-        return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE4();
+        return self.GetCellNumberTape(cellNumber, 'TAPE4');
     ###
     def GetCellNumberTAPE5(self, cellNumber):
         '''Return ORIGEN TAPE5 of a cell for this depletion step.''';
-        return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE5();
+        return self.GetCellNumberTape(cellNumber, 'TAPE5');
     ###
     def GetCellNumberTAPE6(self, cellNumber):
         '''Return ORIGEN TAPE6 of a cell for this depletion step.''';
-        return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE6();
+        return self.GetCellNumberTape(cellNumber, 'TAPE6');
     ###
     def GetCellNumberTAPE7(self, cellNumber):
         '''Return ORIGEN TAPE7 of a cell for this depletion step.''';
-        return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE7();
+        return self.GetCellNumberTape(cellNumber, 'TAPE7');
     ###
     def GetCellNumberTAPE9(self, cellNumber):
         '''Return ORIGEN TAPE9 of a cell for this depletion step.''';
-        return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE9();
+        if not hasattr(self, 'cellNumber2TapeKeys'):
+            return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE9();
+        ###
+        tape9Key, tape10Digest = self.GetCellNumberTapeKeys(cellNumber);
+        if tape9Key is None:
+            return None;
+        ###
+        digest, slot2Line = tape9Key;
+        if not slot2Line:
+            return self.GetTapeBlob(digest);
+        ###
+        lines = self.GetTapeBlob(digest).split('\n');
+        for slot, line in slot2Line.items():
+            lines[slot] = line;
+        ###
+        return '\n'.join(lines);
     ###
     def GetCellNumberTAPE10(self, cellNumber):
         '''Return ORIGEN TAPE10 of a cell for the depletion step.''';
-        return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE10();
+        if not hasattr(self, 'cellNumber2TapeKeys'):
+            return self.GetCellNumberOrigenCalculation(cellNumber).GetTAPE10();
+        ###
+        tape9Key, digest = self.GetCellNumberTapeKeys(cellNumber);
+        if digest is None:
+            return None;
+        ###
+        return self.GetTapeBlob(digest);
+    ###
+    def GetCellNumberTape(self, cellNumber, tapeName):
+        '''Return an ORIGEN tape of a cell for this depletion step.''';
+        if not hasattr(self, 'cellNumber2Tapes'):
+            return getattr(self.GetCellNumberOrigenCalculation(cellNumber), tapeName);
+        ###
+        return self.cellNumber2Tapes[cellNumber][tapeName];
+    ###
+    def GetCellNumberTapeKeys(self, cellNumber):
+        '''Return digests (and substituted lines) of ORIGEN TAPE9 and TAPE10 of a cell for this depletion step.''';
+        return self.cellNumber2TapeKeys[cellNumber];
     ###
     def GetCellNumberThermalPower(self, cellNumber):
         '''Return cell thermal power for this depletion step.''';
@@ -2018,13 +2932,83 @@ class DepletionStepPickle:
         '''Return text from MCNP output file for this depletion step.''';
         return self.transportInputRaw;
     ###
-    def GetTransportOutputRaw(self):
-        '''Return text from MCNP input file for this depletion step.''';
-        return self.transportOutputRaw;
+    def GetTransportOutputRaw(self):
+        '''Return text from MCNP input file for this depletion step.''';
+        return self.transportOutputRaw;
+    ###
+    def GetSourceRate(self):
+        '''Return system total neutron source rate for this depletion step.''';
+        return self.sourceRate;
+    ###
+    def GetSectionFileName(self, section):
+        '''Return filename of a pickle section.''';
+        head, tail = self.GetFileName().rsplit('.pkl', 1);
+        ###
+        return '{}.{}.pkl{}'.format(head, section, tail);
+    ###
+    def GetTapeBlob(self, digest):
+        '''Return ORIGEN tape text for a content digest.''';
+        return self.tapeDigest2Blob[digest];
+    ###
+    # Population methods
+    ###
+    def InternTapeBlob(self, tapeBlob):
+        '''Store ORIGEN tape text once, keyed by its content digest.''';
+        digest = Sha1(tapeBlob.encode()).hexdigest();
+        self.tapeDigest2Blob[digest] = tapeBlob;
+        ###
+        return digest;
+    ###
+    def LoadSection(self, section):
+        '''Load attributes of a pickle section.''';
+        fileName = self.GetSectionFileName(section);
+        if not Exists(fileName):
+            return;
+        ###
+        # Maybe decompress;
+        # Unpickle
+        ###
+        PrintNow('{} >>'.format(fileName));
+        attribute2Value = UnpickleFile(fileName);
+        ###
+        self.__dict__.update(attribute2Value);
+        ###
+        return;
+    ###
+    def ReleaseRaw(self):
+        '''Release raw transport text, which is reloaded only if requested.''';
+        ###
+        # Pickles created before sectioning have nothing to reload it from
+        ###
+        if not Exists(self.GetSectionFileName('raw')):
+            return;
+        ###
+        for attribute in depletionStepPickleSection2Attributes['raw']:
+            try:
+                del(self.__dict__[attribute]);
+            except KeyError:
+                pass;
+        ###
+        return;
+    ###
+    def SaveSections(self, fileName2Contents, depletionCalculation):
+        '''Pickle contents of every section.''';
+        for fileName, contents in fileName2Contents:
+            self.SaveSection(fileName, contents, depletionCalculation);
+        ###
+        return;
     ###
-    def GetSourceRate(self):
-        '''Return system total neutron source rate for this depletion step.''';
-        return self.sourceRate;
+    def SaveSection(self, fileName, contents, depletionCalculation):
+        '''Pickle contents of a section.''';
+        ###
+        # Pickle;
+        # Maybe compress
+        ###
+        RemoveFile(fileName, display = depletionCalculation.GetDisplayFiles());
+        PrintNow('{} <<'.format(fileName));
+        PickleFile(fileName, contents, depletionCalculation.GetParameters());
+        ###
+        return;
 ###
 # Material composition
 ###
@@ -2178,9 +3162,6 @@ class MocDownInputFile:
     ###
     def __len__(self):
         '''Return number of depletion steps.''';
-        if self.GetParameter('isPredictorMode'):
-            return self.GetParameter('depletionStepTimeIntervals') * (self.GetParameter('numberOfPredictorSteps') + self.GetParameter('numberOfCorrectorSteps'));
-        ###
         return len(self.GetParameter('depletionStepTimeIntervals'));
     ###
     def __str__(self):
@@ -2253,22 +3234,30 @@ class MocDownInputFile:
         ###
         self.parameters = {
             # T/F
+            'adaptDepletionSteps' : False,
+            'backgroundPickling' : False,
             'compressPickles' : True,
             'forceDecayTransport' : False,
             'includeDecayHeat' : True,
             'recycleToEquilibrium' : False,
+            'retainOrigenTapes' : False,
             'updateCoolantDensities' : False,
             'updateFuelTemperatures' : False,
             # #
+            'commandRetries' : 0,
             'numberOfPredictorSteps' : 0,
             'numberOfCorrectorSteps' : 0,
             'numberOfOrigenThreads' : 1,
+            'pickleCompressionLevel' : 5,
             # #.#
+            'adaptiveInventoryTolerance' : 5e-2,
+            'adaptiveMultiplicationFactorTolerance' : 500e-5,
             'depletionTerminalDecayTime' : None, # [years]
             'depletionFlux' : None, # [n/cm²·s]
             'depletionPower' : None, # [MWth]
             'depletionTime' : None, # [days]
             'isotopicsConvergenceTolerance' : 1e-5,
+            'mcnpTimeout' : None, # [s]
             'maximumBurnupStep' : 5e3, # [MWd/MTHM]
             'maximumFluenceStep' : 8e21, # [n/cm²] # FIXME Pick reasonable numbers!
             'minimumBurnupStep' : 2e2, # [MWd/MTHM]
@@ -2276,8 +3265,11 @@ class MocDownInputFile:
             'minimumFluenceStep' : 3e20, # [n/cm²] # FIXME Pick reasonable numbers!
             'minimumIsotopeCutoff' : 1e-8,
             'multiplicationFactorConvergenceTolerance' : 100e-5,
+            'origenTimeout' : None, # [s]
             # ''.lower()
             'isotopicsConvergenceNormType' : 'inf',
+            'origenExecutorType' : 'thread',
+            'pickleCompressor' : 'gzip',
             # ''
             'defaultDecayLibrary' : 'decay',
             'defaultPhotonLibrary' : 'gxuo2brm',
@@ -2287,8 +3279,10 @@ class MocDownInputFile:
             'mcnpXsdirPath' : '/usr/local/LANL/MCNP_BINDATA/xsdir',
             'origenExecutablePath' : '/usr/local/ORIGEN/bin/o2_fast',
             'origenLibraryPathTemplate' : '/usr/local/ORIGEN/libs/{}.lib',
+            'origenStagingPath' : None,
             'qValueMethod' : 'origens',
             # [#]
+            'adaptiveInventoryZams' : [],
             'burnCells' : [],
             # [#.#]
             'depletionStepFluxes' : [], # [n/cm²·s]
@@ -2334,22 +3328,30 @@ class MocDownInputFile:
         ###
         self.converters = {
             # T/F
+            'adaptDepletionSteps' : Bool,
+            'backgroundPickling' : Bool,
             'compressPickles' : Bool,
             'forceDecayTransport' : Bool,
             'includeDecayHeat' : Bool,
             'recycleToEquilibrium' : Bool,
+            'retainOrigenTapes' : Bool,
             'updateCoolantDensities' : Bool,
             'updateFuelTemperatures' : Bool,
             # #
+            'commandRetries' : Int,
             'numberOfPredictorSteps' : Int,
             'numberOfCorrectorSteps'  : Int,
             'numberOfOrigenThreads' : Int,
+            'pickleCompressionLevel' : Int,
             # #.#
+            'adaptiveInventoryTolerance' : Float,
+            'adaptiveMultiplicationFactorTolerance' : Float,
             'depletionTerminalDecayTime' : Float,
             'depletionFlux' : Float,
             'depletionPower' : Float,
             'depletionTime' : Float,
             'isotopicsConvergenceTolerance' : Float,
+            'mcnpTimeout' : Float,
             'maximumBurnupStep' : Float,
             'maximumFluenceStep' : Float,
             'minimumBurnupStep' : Float,
@@ -2357,8 +3359,11 @@ class MocDownInputFile:
             'minimumFluenceStep' : Float,
             'minimumIsotopeCutoff' : Float,
             'multiplicationFactorConvergenceTolerance' : Float,
+            'origenTimeout' : Float,
             # ''.lower()
             'isotopicsConvergenceNormType' : Lower,
+            'origenExecutorType' : Lower,
+            'pickleCompressor' : Lower,
             # ''
             'defaultDecayLibrary' : Return,
             'defaultPhotonLibrary' : Return,
@@ -2368,8 +3373,10 @@ class MocDownInputFile:
             'mcnpXsdirPath' : Return,
             'origenExecutablePath' : Return,
             'origenLibraryPathTemplate' : Return,
+            'origenStagingPath' : Return,
             'qValueMethod' : Return,
             # [#]
+            'adaptiveInventoryZams' : ListInt,
             'burnCells' : ListInt,
             # [#.#]
             'depletionStepFluxes' : ListFloat,
@@ -2505,6 +3512,7 @@ class McnpCard:
     def __init__(self, raw):
         '''Construct a new instance.''';
         self.raw = raw;
+        self.span = None;
         ###
         self.Populate();
         return;
@@ -2532,6 +3540,10 @@ class McnpCard:
         '''Return number.''';
         return self.number;
     ###
+    def GetSpan(self):
+        '''Return (start, end) offsets of this instance within its input text.''';
+        return self.span;
+    ###
     # Regular expression builder
     ###
     def GetRegex(self):
@@ -2545,7 +3557,7 @@ class McnpCard:
         ###
         # Clean up spaces
         ###
-        output = ReCompile(r' +').sub(r'[\s&]+', output);
+        output = ReCompile(r' +').sub(r'[\\s&]+', output);
         ###
         return ReCompile(output);
     ###
@@ -2857,6 +3869,46 @@ class McnpTally(McnpCard):
         '''Return particles.''';
         return self.particles;
     ###
+    def GetResultIndex(self):
+        '''Return dictionary mapping (space, angle, multiplier bin) to result row, parsing results upon first access.''';
+        if not hasattr(self, 'resultIndex'):
+            self.PopulateResults(self.resultSource() or '');
+        return self.resultIndex;
+    ###
+    def GetResultRow(self, row):
+        '''Return tally result for a result row.''';
+        return TallyResult(self.resultEnergys, self.resultElements[row], self.resultVariances[row], float(self.resultTotalElements[row]), float(self.resultTotalVariances[row]));
+    ###
+    def GetResultRows(self, indices):
+        '''Return array of result rows for (space, angle, multiplier bin) indices; missing indices are -1.''';
+        resultIndex = self.GetResultIndex();
+        ###
+        return Array([resultIndex[index] if index in resultIndex else -1 for index in indices], dtype = int);
+    ###
+    def GetResults(self):
+        '''Return dictionary mapping (space, angle, multiplier bin) to tally result.''';
+        return {index : self.GetResultRow(row) for index, row in self.GetResultIndex().items()};
+    ###
+    def GetResultTotalElements(self, indices = None):
+        '''Return array of totals, optionally for (space, angle, multiplier bin) indices; missing indices are zero.''';
+        return self.HelperResultColumn('resultTotalElements', indices);
+    ###
+    def GetResultTotalVariances(self, indices = None):
+        '''Return array of total variances, optionally for (space, angle, multiplier bin) indices; missing indices are zero.''';
+        return self.HelperResultColumn('resultTotalVariances', indices);
+    ###
+    def HelperResultColumn(self, attribute, indices):
+        '''Gather a result column for (space, angle, multiplier bin) indices.''';
+        rows = self.GetResultRows(() if indices is None else indices);
+        column = getattr(self, attribute);
+        ###
+        if indices is None:
+            return column;
+        ###
+        # Missing indices have row -1, and are zeroed even where the column holds NaN or inf
+        ###
+        return Where(rows >= 0, column[rows], 0) if len(column) else Zeros(len(rows));
+    ###
     def GetResultString(self):
         '''Return result text.''';
         return self.resultString;
@@ -2897,7 +3949,7 @@ class McnpTally(McnpCard):
             index[jndex[kndex]] = args[kndex];
         index = tuple(index);
         ###
-        return self.results[index];
+        return self.GetResultRow(self.GetResultIndex()[index]);
     ###
     # Population methods
     ###
@@ -2944,9 +3996,10 @@ class McnpTally(McnpCard):
         except AttributeError:
             energys = [];
         ###
-        # Build empty results array
+        # Build empty results index and columns
         ###
-        self.results = {};
+        self.resultIndex = {};
+        tallyResults = [];
         ###
         for block in iter(ReCompile('^ $', 2 | 8).split(self.GetResultString())[1 : ]):
             ###
@@ -2977,7 +4030,41 @@ class McnpTally(McnpCard):
             if self.mnemonic not in ('fm4', 'fm5') and multiplierBin is not None and len(multiplierBin) > 1:
                 continue;
             ###
-            self.results[(space, angle, multiplierBin)] = TallyResult(reNumerics.finditer(block), len(energys));
+            self.resultIndex[(space, angle, multiplierBin)] = len(tallyResults);
+            tallyResults.append(TallyResult(reNumerics.finditer(block), len(energys)));
+        ###
+        # Pack results into contiguous columns;
+        # Rows are bins, indexed by (space, angle, multiplier bin), and columns are energys
+        ###
+        numberOfRows = len(tallyResults);
+        numberOfEnergys = len(energys);
+        ###
+        self.resultEnergys = Zeros(numberOfEnergys);
+        self.resultElements, self.resultVariances = (Zeros((numberOfRows, numberOfEnergys)) for index in range(2));
+        self.resultTotalElements, self.resultTotalVariances = (Zeros(numberOfRows) for index in range(2));
+        ###
+        for row, tallyResult in enumerate(tallyResults):
+            if numberOfEnergys > 1:
+                self.resultEnergys[ : ] = tallyResult.GetEnergys();
+                self.resultElements[row, : ] = tallyResult.GetElements();
+                self.resultVariances[row, : ] = tallyResult.GetVariances();
+            ###
+            # Blocks without a total are left zero-valued
+            ###
+            if hasattr(tallyResult, 'totalElement'):
+                self.resultTotalElements[row] = tallyResult.GetTotalElement();
+                self.resultTotalVariances[row] = tallyResult.GetTotalVariance();
+        ###
+        return;
+    ###
+    def PopulateResultSource(self, resultSource):
+        '''Attach a callable which returns tally output text, to be parsed upon first access.''';
+        self.resultSource = resultSource;
+        ###
+        # Discard previously parsed results
+        ###
+        if hasattr(self, 'resultIndex'):
+            del(self.resultIndex);
         ###
         return;
     ###
@@ -3259,6 +4346,10 @@ class McnpInputFile:
         '''Return list of cells.''';
         return self.cells;
     ###
+    def GetCellNumber2Cell(self):
+        '''Return dictionary mapping cell number to cell.''';
+        return self.cellNumber2Cell;
+    ###
     def GetCellNumbers(self):
         '''Return list of cell numbers.''';
         return self.cellNumbers;
@@ -3326,6 +4417,10 @@ class McnpInputFile:
         '''Return list of material numbers.''';
         return self.materialNumbers;
     ###
+    def GetMaterialNumber2Material(self):
+        '''Return dictionary mapping material number to material.''';
+        return self.materialNumber2Material;
+    ###
     def GetMode(self):
         '''Return particle mode (n, p, or np).''';
         return ''.join(str(self.GetNamedCard('mode')).split()[1 : ]).lower();
@@ -3369,6 +4464,10 @@ class McnpInputFile:
         '''Return list of surface cards.''';
         return self.surfaces;
     ###
+    def GetSurfaceNumber2Surface(self):
+        '''Return dictionary mapping surface number to surface.''';
+        return self.surfaceNumber2Surface;
+    ###
     def GetSurfaceBlock(self):
         '''Return block of surface cards.''';
         return self.surfaceBlock;
@@ -3384,9 +4483,20 @@ class McnpInputFile:
     def GetTallys(self, mnemonic = None):
         '''Return list of tally cards.''';
         if mnemonic is not None:
-            return (tally for tally in self.GetTallys() if tally.GetMnemonic() == mnemonic);
+            try:
+                return iter(self.mnemonic2Tallys[mnemonic]);
+            except KeyError:
+                return iter(());
         return self.tallys;
     ###
+    def GetTallyNumber2Tallys(self):
+        '''Return dictionary mapping tally number to tallys.''';
+        return self.tallyNumber2Tallys;
+    ###
+    def GetZaid2SingleZaidMaterialNumber(self):
+        '''Return dictionary mapping isotope to single-isotope material number.''';
+        return self.zaid2SingleZaidMaterialNumber;
+    ###
     def GetZa2Moles(self):
         '''Return dictionary mapping isotope to system total moles.''';
         za2Moles = {};
@@ -3399,11 +4509,17 @@ class McnpInputFile:
                         za2Moles[za] = moles;
         return za2Moles;
     ###
+    # Algorithmic methods
+    ###
+    def Close(self):
+        '''Do nothing, as input is read rather than mapped; transport files of decay and pickle-transmute steps are closed as those of transport steps.''';
+        return;
+    ###
     # Constructed getter methods
     ###
     def FindCell(self, cellNumber):
         '''Find a cell by cell number.''';
-        return self.GetCells()[self.GetCellNumbers().index(cellNumber)];
+        return self.GetCellNumber2Cell()[cellNumber];
     ###
     def FindCellMaterial(self, cellNumber):
         '''Find a cell material by cell number.''';
@@ -3420,8 +4536,9 @@ class McnpInputFile:
         if not cell:
             return;
         ###
-        surfaceNumbers = (abs(surfaceNumber) for surfaceNumber in cell.GetSurfaceNumbers());
-        return (surface for surface in self.GetSurfaces() if surface.GetNumber() in surfaceNumbers);
+        surfaceNumber2Surface = self.GetSurfaceNumber2Surface();
+        surfaceNumbers = sorted(set(abs(surfaceNumber) for surfaceNumber in cell.GetSurfaceNumbers()));
+        return (surfaceNumber2Surface[surfaceNumber] for surfaceNumber in surfaceNumbers if surfaceNumber in surfaceNumber2Surface);
     ###
     def FindLeafCells(self, cells):
         '''Find cells contained within a cell.''';
@@ -3435,7 +4552,7 @@ class McnpInputFile:
                     ###
                     # Grab child nodes
                     ###
-                    leafCells.extend(self.FindLeafCells(childCell for childCell in self.GetCells() if childCell.GetUniverse() == cell.GetFillUniverse()));
+                    leafCells.extend(self.FindLeafCells(self.FindUniverseCells(cell.GetFillUniverse())));
                 else:
                     ###
                     # Grab current node
@@ -3450,7 +4567,7 @@ class McnpInputFile:
     def FindMaterial(self, materialNumber):
         '''Find a material by material number.''';
         if 0 != materialNumber:
-            return self.GetMaterials()[self.GetMaterialNumbers().index(materialNumber)];
+            return self.GetMaterialNumber2Material()[materialNumber];
     ###
     def FindRootCells(self, cells):
         '''Find cells which contain a cell.''';
@@ -3464,7 +4581,7 @@ class McnpInputFile:
                     ###
                     # Grab parent nodes
                     ###
-                    rootCells.extend(self.FindRootCells(parentCell for parentCell in self.GetCells() if parentCell.GetFillUniverse() == cell.GetUniverse()));
+                    rootCells.extend(self.FindRootCells(self.FindFillUniverseCells(cell.GetUniverse())));
                 else:
                     ###
                     # Grab current nodes
@@ -3478,10 +4595,41 @@ class McnpInputFile:
     ###
     def FindSingleZaidMaterialNumber(self, zaid):
         '''Find material number which contains a single isotope.''';
-        for material in self.GetMaterials():
-            if material.GetIsSingleIsotope():
-                if zaid in material.GetZaids():
-                    return material.GetNumber();
+        zaid2SingleZaidMaterialNumber = self.GetZaid2SingleZaidMaterialNumber();
+        if zaid in zaid2SingleZaidMaterialNumber:
+            return zaid2SingleZaidMaterialNumber[zaid];
+    ###
+    def FindSurface(self, surfaceNumber):
+        '''Find a surface by surface number.''';
+        return self.GetSurfaceNumber2Surface()[abs(surfaceNumber)];
+    ###
+    def FindTally(self, tallyNumber, mnemonic = None):
+        '''Find a tally by tally number and, optionally, mnemonic.''';
+        try:
+            tallys = self.GetTallyNumber2Tallys()[tallyNumber];
+        except KeyError:
+            return;
+        ###
+        if mnemonic is None:
+            return tallys[0];
+        ###
+        for tally in tallys:
+            if tally.GetMnemonic() == mnemonic:
+                return tally;
+    ###
+    def FindUniverseCells(self, universe):
+        '''Find cells which belong to a universe.''';
+        try:
+            return self.universe2Cells[universe];
+        except KeyError:
+            return [];
+    ###
+    def FindFillUniverseCells(self, fillUniverse):
+        '''Find cells which are filled by a universe.''';
+        try:
+            return self.fillUniverse2Cells[fillUniverse];
+        except KeyError:
+            return [];
     ###
     # Input card stripping methods
     ###
@@ -3531,10 +4679,6 @@ class McnpInputFile:
         self.cells = [McnpCell(cellCard) for cellCard in self.GetCellCards()[1 : ]];
         self.cellNumbers = [cell.GetNumber() for cell in self.GetCells()];
         ###
-        # Populate cell heirarchy
-        ###
-        self.PopulateCellHeirarchy();
-        ###
         # Populate surfaces
         ###
         self.surfaces = [McnpSurface(surfaceCard) for surfaceCard in self.GetSurfaceCards()];
@@ -3543,6 +4687,14 @@ class McnpInputFile:
         ###
         self.PopulateDataCards();
         ###
+        # Populate cell, surface, material, and tally number indices
+        ###
+        self.PopulateIndices();
+        ###
+        # Populate cell heirarchy
+        ###
+        self.PopulateCellHeirarchy();
+        ###
         # Populate cell material attributes
         ###
         self.PopulateCellMaterialAttributes();
@@ -3572,7 +4724,7 @@ class McnpInputFile:
         ###
         # Build childCell -> parentCells
         ###
-        cell2ParentCells = {childCell : [parentCell for parentCell in self.GetCells() if childCell.GetUniverse() if parentCell.GetFillUniverse() == childCell.GetUniverse()] for childCell in self.GetCells()};
+        cell2ParentCells = {childCell : [parentCell for parentCell in self.FindFillUniverseCells(childCell.GetUniverse()) if childCell.GetUniverse()] for childCell in self.GetCells()};
         ###
         # Populated leafCell -> ... -> rootCell paths
         # Depth-first searches are performed, ascending from each leafCell
@@ -3915,6 +5067,53 @@ class McnpInputFile:
                     continue;
         return;
     ###
+    def PopulateIndices(self):
+        '''Populate dictionaries for constant-time card lookups.''';
+        ###
+        # Cell # -> cell;
+        # Universe -> cells;
+        # Fill universe -> cells
+        ###
+        self.cellNumber2Cell = {cell.GetNumber() : cell for cell in self.GetCells()};
+        self.universe2Cells = {};
+        self.fillUniverse2Cells = {};
+        for cell in self.GetCells():
+            for universe, universe2Cells in ((cell.GetUniverse(), self.universe2Cells), (cell.GetFillUniverse(), self.fillUniverse2Cells)):
+                if not universe:
+                    continue;
+                try:
+                    universe2Cells[universe].append(cell);
+                except KeyError:
+                    universe2Cells[universe] = [cell];
+        ###
+        # Surface # -> surface
+        ###
+        self.surfaceNumber2Surface = {surface.GetNumber() : surface for surface in self.GetSurfaces()};
+        ###
+        # Material # -> material;
+        # Zaid -> single-isotope material #, the first of which is kept
+        ###
+        self.materialNumber2Material = {material.GetNumber() : material for material in self.GetMaterials()};
+        self.zaid2SingleZaidMaterialNumber = {};
+        for material in reversed(self.GetMaterials()):
+            if material.GetIsSingleIsotope():
+                for zaid in material.GetZaids():
+                    self.zaid2SingleZaidMaterialNumber[zaid] = material.GetNumber();
+        ###
+        # Tally # -> tallys;
+        # Mnemonic -> tallys
+        ###
+        self.tallyNumber2Tallys = {};
+        self.mnemonic2Tallys = {};
+        for tally in self.GetTallys():
+            for key, key2Tallys in ((tally.GetNumber(), self.tallyNumber2Tallys), (tally.GetMnemonic(), self.mnemonic2Tallys)):
+                try:
+                    key2Tallys[key].append(tally);
+                except KeyError:
+                    key2Tallys[key] = [tally];
+        ###
+        return;
+    ###
     def PopulateCellMaterialAttributes(self):
         '''Populate the many named data card types.''';
         ###
@@ -4094,7 +5293,8 @@ class McnpInputFile:
     ###
     def AppendNewputCard(self, card):
         '''Append a card to input.''';
-        self.newputRaw += '\n{}'.format(str(card).strip());
+        self.newputAppendedCards.append('\n{}'.format(str(card).strip()));
+        self.newputRaw = None;
         ###
         return;
     ###
@@ -4112,11 +5312,40 @@ class McnpInputFile:
     ###
     def GetNewputRaw(self):
         '''Return new input text.''';
+        if self.newputRaw is None:
+            self.SpliceNewput();
         return self.newputRaw;
     ###
+    def PopulateCardSpans(self):
+        '''Locate cell and material cards within the input text.''';
+        inputRaw = self.GetInputRaw();
+        ###
+        # Cards are searched for in the order they were parsed;
+        # Cards out of order are searched for from the beginning;
+        # Cards not found (e.g., interrupted by comments) are left without spans
+        ###
+        cursor = 0;
+        for card in self.GetCells() + self.GetMaterials():
+            regex = card.GetRegex();
+            ###
+            match = regex.search(inputRaw, cursor);
+            if match is not None:
+                cursor = match.end();
+            else:
+                match = regex.search(inputRaw);
+            ###
+            if match is not None:
+                card.span = match.span();
+        ###
+        self.areCardSpansPopulated = True;
+        ###
+        return;
+    ###
     def ResetNewput(self):
         '''Revert new input text to original text.''';
         self.newputRaw = self.GetInputRaw();
+        self.newputAppendedCards = [];
+        self.newputReplacedCards = {};
         ###
         return;
     ###
@@ -4125,10 +5354,44 @@ class McnpInputFile:
         if not hasattr(self, 'newputRaw'):
             self.ResetNewput();
         ###
+        if not hasattr(self, 'areCardSpansPopulated'):
+            self.PopulateCardSpans();
+        ###
         if newCard:
             newCard = '\n{}'.format(str(newCard).strip());
         ###
-        self.newputRaw = oldCard.GetRegex().sub(newCard, self.GetNewputRaw());
+        # Replacements are deferred until new input text is requested
+        ###
+        self.newputReplacedCards[id(oldCard)] = (oldCard, newCard);
+        self.newputRaw = None;
+        ###
+        return;
+    ###
+    def SpliceNewput(self):
+        '''Apply deferred card replacements and appendages to the original text in a single pass.''';
+        inputRaw = self.GetInputRaw();
+        ###
+        # Splice located cards in order of appearance
+        ###
+        spanReplacements = sorted((oldCard.GetSpan(), newCard) for oldCard, newCard in self.newputReplacedCards.values() if oldCard.GetSpan() is not None);
+        ###
+        pieces = [];
+        cursor = 0;
+        for (start, end), newCard in spanReplacements:
+            pieces.append(inputRaw[cursor : start]);
+            pieces.append(newCard or '');
+            cursor = end;
+        pieces.append(inputRaw[cursor : ]);
+        ###
+        newputRaw = ''.join(pieces);
+        ###
+        # Fall back to regular expressions for cards without spans (e.g., named cards)
+        ###
+        for oldCard, newCard in self.newputReplacedCards.values():
+            if oldCard.GetSpan() is None:
+                newputRaw = oldCard.GetRegex().sub(newCard, newputRaw);
+        ###
+        self.newputRaw = newputRaw + ''.join(self.newputAppendedCards);
         ###
         return;
     ###
@@ -4148,7 +5411,10 @@ class McnpOutputFile:
         '''Construct a new instance.''';
         self.fileName = fileName;
         ###
-        self.outputRaw = ReadFile(self.GetFileName(), display = not bool(arguments.isQuiet));
+        # Map output rather than read it;
+        # Sections are decoded only as they are needed
+        ###
+        self.outputMap = MapFile(self.GetFileName(), display = not bool(arguments.isQuiet));
         ###
         self.Populate();
         ###
@@ -4177,8 +5443,35 @@ class McnpOutputFile:
         return self.fileName;
     ###
     def GetOutputRaw(self):
-        '''Return text.''';
-        return self.outputRaw;
+        '''Return raw bytes, copied straight from the map without decoding.''';
+        return self.outputMap[ : ];
+    ###
+    def GetOutputSection(self, section, key = None):
+        '''Return text for an indexed output section.''';
+        spans = self.GetSection2Spans()[section];
+        if key is not None:
+            try:
+                spans = spans[key];
+            except KeyError:
+                return;
+        ###
+        return ''.join(self.outputMap[start : end].decode('utf-8', 'ignore') for start, end in spans);
+    ###
+    def GetSection2Spans(self):
+        '''Return dictionary mapping output section to page spans.''';
+        return self.section2Spans;
+    ###
+    # Algorithmic methods
+    ###
+    def Close(self):
+        '''Unmap output; sections and tally results can no longer be decoded.''';
+        ###
+        # Empty files are not mapped
+        ###
+        if isinstance(self.outputMap, MemoryMap):
+            self.outputMap.close();
+        ###
+        return;
     ###
     def GetMevPerFission(self):
         '''Return effective MeV per fission.''';
@@ -4295,6 +5588,45 @@ class McnpOutputFile:
         ###
         return SafeDivide(reactionsPerN, scalarFlux);
     ###
+    def GetMicroscopicCrossSectionMatrix(self, cellNumbers, tallyNumber):
+        '''Derive one-group microscopic cross-sections for cells and the (material, reaction) bins of a cell flux multiplier tally.''';
+        tally = self.FindTally(tallyNumber, 'fm4');
+        ###
+        # Unique (material #, reaction #) bins, in order of appearance
+        ###
+        bin2Column = {};
+        for cellNumber, multiplier, materialNumber, reactionNumber in tally.GetMultiplierBins():
+            if materialNumber and (materialNumber, reactionNumber) not in bin2Column:
+                bin2Column[(materialNumber, reactionNumber)] = len(bin2Column);
+        bins = list(bin2Column);
+        ###
+        # Ignore the possibility of leaf cells;
+        # The first cell flux tally containing each cell is used
+        # [n/cm²·sn]
+        ###
+        indices = [(cellNumber, None, None) for cellNumber in cellNumbers];
+        scalarFluxes = Zeros(len(cellNumbers));
+        isFound = Zeros(len(cellNumbers), dtype = bool);
+        for fluxTally in self.GetTallys('f4'):
+            isNew = (fluxTally.GetResultRows(indices) >= 0) & ~isFound;
+            scalarFluxes[isNew] = fluxTally.GetResultTotalElements(indices)[isNew];
+            isFound |= isNew;
+        ###
+        # Ignore the possibility of non-unity multipliers;
+        # reactionNumber = -6 is synonymous with reactionNumber = 18
+        # [rxn/sn·N]
+        ###
+        indices = [(cellNumber, None, (materialNumber, [reactionNumber, -6][18 == reactionNumber])) for cellNumber in cellNumbers for materialNumber, reactionNumber in bins];
+        reactionsPerN = tally.GetResultTotalElements(indices).reshape((len(cellNumbers), len(bins)));
+        ###
+        # Cells without flux have null cross-sections
+        ###
+        micros = Zeros((len(cellNumbers), len(bins)));
+        isFlux = scalarFluxes != 0;
+        micros[isFlux, : ] = reactionsPerN[isFlux, : ] / scalarFluxes[isFlux, None];
+        ###
+        return bins, micros;
+    ###
     def GetCellNumberParticlePower(self, cellNumber, mnemonic = 'f6'):
         '''Return prompt power for a cell.''';
         power = 0;
@@ -4450,9 +5782,13 @@ class McnpOutputFile:
     def Populate(self):
         '''Populate.''';
         ###
+        # Populate output page index
+        ###
+        self.PopulateSectionIndex();
+        ###
         # Populate mcnp input file
         ###
-        self.mcnpInputFile = McnpInputFile(self.GetFileName(), self.GetOutputRaw());
+        self.mcnpInputFile = McnpInputFile(self.GetFileName(), self.GetOutputSection('input'));
         ###
         # Populate pointers to mcnp input file methods
         ###
@@ -4477,6 +5813,7 @@ class McnpOutputFile:
             'FindLeafCells',
             'FindMaterial',
             'FindSingleZaidMaterialNumber',
+            'FindTally',
             'GetCells',
             'GetFissionCells',
             'GetInputRaw',
@@ -4503,17 +5840,11 @@ class McnpOutputFile:
     def PopulateTallyResults(self):
         '''Populate tally results.''';
         ###
-        # Parse tally results
+        # Attach tally result sources;
+        # Tally results are parsed upon first access
         ###
-        tallyBlocks = ['1{}'.format(block) for block in ReCompile(r'^1', 2 | 8).split(self.GetOutputRaw()) if 'tally ' == block[ : 6] and 'f' != block[6]];
         for tally in self.GetTallys():
-            reTally = ReCompile(r'^1tally *{}'.format(tally.GetNumber()), 2 | 8);
-            ###
-            for tallyBlock in tallyBlocks:
-                if reTally.search(tallyBlock):
-                    tally.PopulateResults(tallyBlock);
-                    ###
-                    break;
+            tally.PopulateResultSource(Partial(self.GetOutputSection, 'tally', tally.GetNumber()));
         ###
         return;
     ###
@@ -4522,7 +5853,9 @@ class McnpOutputFile:
         ###
         # Kick out if multiplication results don't exist
         ###
-        if not ReCompile(r'final estimated', 2 | 8).search(self.GetOutputRaw()):
+        kcodeBlock = self.GetOutputSection('kcode');
+        ###
+        if not kcodeBlock:
             Warning('Transport output does not contain multiplication factor results');
             ###
             self.neutronsPerFission = self.multiplicationFactor = self.multiplicationFactorSigma = self.mevPerFission = None;
@@ -4530,11 +5863,11 @@ class McnpOutputFile:
         ###
         # Neutrons per fission
         ###
-        self.neutronsPerFission = float(ReCompile(r'the average number of neutrons produced per fission = ([\d\.]{5})', 2 | 8).search(self.GetOutputRaw()).group(1));
+        self.neutronsPerFission = float(ReCompile(r'the average number of neutrons produced per fission = ([\d\.]{5})', 2 | 8).search(kcodeBlock).group(1));
         ###
         # Multiplication factor and its counting uncertainty
         ###
-        multiplicationFactor, multiplicationFactorSigma = ReCompile(r'the final estimated.+([\d\.]{7}) with an estimated.+([\d\.]{7})', 2 | 8).search(self.GetOutputRaw()).groups();
+        multiplicationFactor, multiplicationFactorSigma = ReCompile(r'the final estimated.+([\d\.]{7}) with an estimated.+([\d\.]{7})', 2 | 8).search(kcodeBlock).groups();
         ###
         self.multiplicationFactor = float(multiplicationFactor);
         self.multiplicationFactorSigma = float(multiplicationFactorSigma);
@@ -4548,6 +5881,40 @@ class McnpOutputFile:
         ###
         return;
     ###
+    def PopulateSectionIndex(self):
+        '''Index output pages for the input echo, tallys, and multiplication results in a single pass.''';
+        outputMap = self.outputMap;
+        ###
+        # Page offsets;
+        # Pages begin with a `1' in the first column
+        ###
+        starts = [match.start() for match in ReCompile(rb'^1', 8).finditer(outputMap)];
+        spans = list(zip(starts, starts[1 : ] + [len(outputMap)]));
+        ###
+        # Input echo pages, tally pages (sans fluctuation charts), and multiplication results pages
+        ###
+        section2Spans = {'input' : [], 'tally' : {}, 'kcode' : []};
+        reTally = ReCompile(rb'1tally +(\d+)', 2);
+        reKcode = ReCompile(rb'final estimated|neutrons produced per fission', 2);
+        ###
+        for start, end in spans:
+            header = outputMap[start : start + 32].lower();
+            ###
+            if header.startswith(b'1mcnp'):
+                section2Spans['input'].append((start, end));
+            elif header.startswith(b'1tally ') and b'f' != header[7 : 8]:
+                match = reTally.match(header);
+                if match is not None:
+                    tallyNumber = int(match.group(1));
+                    if tallyNumber not in section2Spans['tally']:
+                        section2Spans['tally'][tallyNumber] = [(start, end)];
+            elif reKcode.search(outputMap, start, end):
+                section2Spans['kcode'].append((start, end));
+        ###
+        self.section2Spans = section2Spans;
+        ###
+        return;
+    ###
     def PopulateSourceRate(self, sourceRate):
         '''Attach system total neutron source rate.''';
         self.sourceRate = sourceRate;
@@ -5223,10 +6590,11 @@ class RecycleCalculation:
         ###
         transportFileName = arguments.transportFileName;
         moveFiles = [transportFileName, 'transport.log', 'transmute.log'];
-        moveFiles.extend(fileName for extension in ('i', 'o', 'pkl', 'gz') for fileName in Glob('{}*.{}'.format(transportFileName, extension)));
+        extensions = ['i', 'npz', 'o'] + ['pkl' + pickleExtension for pickleExtension in pickleCompressor2Extension.values()];
+        moveFiles.extend(fileName for extension in extensions for fileName in Glob('{}*.{}'.format(transportFileName, extension)));
         if '.' in transportFileName:
             removeExtension = transportFileName.split('.')[-1];
-            moveFiles.extend(fileName for extension in ('i', 'o', 'pkl', 'gz') for fileName in Glob('{}*.{}'.format(transportFileName.replace(removeExtension, ''), extension)));
+            moveFiles.extend(fileName for extension in extensions for fileName in Glob('{}*.{}'.format(transportFileName.replace(removeExtension, ''), extension)));
         ###
         for moveFile in sorted(set(moveFiles), reverse = True):
             MoveFile(moveFile, '{}{}'.format(directoryName, moveFile), display = self.GetDisplayFiles());
@@ -5644,7 +7012,7 @@ def ImportLibraries(mocDownInputFile):
         # Attach functions and variables
         ###
         currentModule = Modules[__name__];
-        for variableName in ('Array', 'Exponent', 'LinearInterpolate', 'McnpInputFile', 'Nan2Num', 'NaturalLogarithm', 'NonZero', 'PrintNow', 'Warning', 'WordArrange', 'WriteFile', 'ZaIsActinide', 'Zeros', 'avogadrosNumber', 'epsilon', 'mocDownInputFile'):
+        for variableName in ('Arange', 'Array', 'Concatenate', 'Exponent', 'Futures', 'GetMultiprocessingContext', 'LinearInterpolate', 'Maximum', 'McnpInputFile', 'Minimum', 'Nan2Num', 'NaturalLogarithm', 'NonZero', 'PrintNow', 'Warning', 'Where', 'WordArrange', 'WriteFile', 'ZaIsActinide', 'Zeros', 'avogadrosNumber', 'epsilon', 'mocDownInputFile'):
             variable = getattr(currentModule, variableName);
             setattr(module, variableName, variable);
 ###
@@ -5737,14 +7105,39 @@ def MakeDirectory(directoryName, display = True):
 ###
 # Make temporary directory
 ###
-def MakeTemporaryDirectory(display = True):
+def MakeTemporaryDirectory(display = True, root = None):
     '''Make temporary directory.''';
-    directoryName = LibMakeTemporaryDirectory() + '/';
+    directoryName = LibMakeTemporaryDirectory(dir = root) + '/';
     if display:
         PrintNow('{} ^^'.format(directoryName));
     ###
     return directoryName;
 ###
+# Memory-map file
+###
+def MapFile(fileName, display = True):
+    '''Memory-map and return read-only ascii file.''';
+    try:
+        AssertFileExists(fileName);
+    except OSError:
+        seconds = 3;
+        if display:
+            PrintNow('> File `{}\' does not exist ... waiting {:d} seconds and checking again ...'.format(fileName, seconds));
+        Sleep(seconds);
+        ###
+        AssertFileExists(fileName);
+    ###
+    with open(fileName, 'rb') as f:
+        if display:
+            PrintNow('{} >>'.format(fileName));
+        ###
+        # Empty files cannot be mapped
+        ###
+        if not FileStatus(fileName).st_size:
+            return b'';
+        ###
+        return MemoryMap(f.fileno(), 0, access = ACCESS_READ);
+###
 # Move file
 ###
 def MoveFile(pathOne, pathTwo, display = True):
@@ -5773,6 +7166,142 @@ def NumericStringKey(string):
     ###
     return output;
 ###
+# Parse molar decay heat conversions of an ORIGEN decay library
+###
+def ParseOrigenDecayLibrary(raw):
+    '''Return isotope -> molar decay heat [W/mol] of an ORIGEN decay library.''';
+    za2WattsPerMole = {};
+    iuConversion = {
+        '1' : 1,
+        '2' : 1 / 60,
+        '3' : 1 / 60 / 60,
+        '4' : 1 / 60 / 60 / 24,
+        '5' : 1 / 60 / 60 / 24 / daysPerYear,
+        '6' : 0,
+        '7' : 1 / 60 / 60 / 24 / daysPerYear / 1e3,
+        '8' : 1 / 60 / 60 / 24 / daysPerYear / 1e6,
+        '9' : 1 / 60 / 60 / 24 / daysPerYear / 1e9,
+    };
+    logOfTwo = NaturalLogarithm(2);
+    ###
+    for match in ReCompile(r'^ *\d {2,3}([\d]{5,7}) +(\d) +([\d\.e+\- ]{9}).+\n[\d ]{20}([\d\.e+\- ]{9} ){3}', 2 | 8).finditer(raw):
+        zam, iu, thalf, qrec = match.groups();
+        ###
+        za2WattsPerMole[Zaid2Za(Zam2Zaid(int(float(zam)), ''))] = logOfTwo * SafeDivide(iuConversion[iu], float(thalf.replace(' ', ''))) * float(qrec.replace(' ', '')) * joulePerMev * (avogadrosNumber * 1e24);
+    ###
+    return za2WattsPerMole;
+###
+# Parse isotopes, metastable fractions, and line slots of an ORIGEN cross-section library
+###
+def ParseOrigenXsLibrary(raw):
+    '''Return lib -> isotopes, lib -> isotope -> metastable fractions, lines, and isotope -> (lib, line index) slots of an ORIGEN cross-section library.''';
+    def HelperExcited(*args):
+        return SafeDivide(args[2], args[0] + args[2]), SafeDivide(args[3], args[1] + args[3]);
+    ###
+    # Tokenize cross-section library into lines and (lib, zam, line index) slots in a single pass;
+    # Each cell's TAPE9 only substitutes the slots of its transport-updated isotopes;
+    # Lines are matched once for their lib, zam, and, if a cross-section line, metastable cross-sections
+    ###
+    reXs = ReCompile(r'^ *(\d{1,3}) +(?:(\d+)(?: +([\d\.e+\-]+) +([\d\.e+\-]+) +[\d\.e+\-]+ +[\d\.e+\-]+ +([\d\.e+\-]+) +([\d\.e+\-]+) + [\d\.e+\-]+ *$)?)?', 2);
+    xsLibraryLines = raw.split('\n');
+    lib2Zams = {};
+    lib2Zam2Excite = {};
+    zam2XsLibrarySlots = {};
+    for slot, line in enumerate(xsLibraryLines):
+        match = reXs.match(line);
+        ###
+        # Kick out if format line
+        ###
+        if match is None:
+            continue;
+        ###
+        lib, zam, *sigmas = match.groups();
+        lib = int(lib);
+        if lib not in lib2Zams:
+            lib2Zams[lib] = set();
+            lib2Zam2Excite[lib] = {};
+        ###
+        # Kick out if title line
+        ###
+        if zam is None:
+            continue;
+        ###
+        zam, isXs = int(zam), 5 <= len(zam) <= 7 and sigmas[0] is not None;
+        try:
+            zam2XsLibrarySlots[zam].append((lib, slot));
+        except KeyError:
+            zam2XsLibrarySlots[zam] = [(lib, slot)];
+        ###
+        # Populate cross-section library metastable fractions
+        ###
+        if isXs:
+            lib2Zams[lib].add(zam);
+            lib2Zam2Excite[lib][zam] = HelperExcited(*(float(sigma) for sigma in sigmas));
+    ###
+    return lib2Zams, lib2Zam2Excite, xsLibraryLines, zam2XsLibrarySlots;
+###
+# Requested pickle compressor
+###
+def PickleCompressor(parameters):
+    '''Return the requested pickle compressor.''';
+    if not parameters['compressPickles']:
+        return 'none';
+    ###
+    # Pickles created with an older version only knew of gzip
+    ###
+    try:
+        compressor = parameters['pickleCompressor'];
+    except KeyError:
+        compressor = 'gzip';
+    ###
+    if compressor not in pickleCompressor2Extension:
+        Warning('Unknown pickle compressor `{}\'; using gzip'.format(compressor));
+        compressor = 'gzip';
+    ###
+    return compressor;
+###
+# Pickle file extension of the requested compressor
+###
+def PickleExtension(parameters):
+    '''Return file extension of the requested pickle compressor.''';
+    return pickleCompressor2Extension[PickleCompressor(parameters)];
+###
+# Pickle to file, streaming through the requested compressor
+###
+def PickleFile(fileName, contents, parameters):
+    '''Serialize contents to a file, streaming through the requested compressor.''';
+    compressor = PickleCompressor(parameters);
+    try:
+        level = parameters['pickleCompressionLevel'];
+    except KeyError:
+        level = 5;
+    ###
+    if 'gzip' == compressor:
+        f = GzipOpen(fileName, 'wb', compresslevel = level);
+    elif 'lzma' == compressor:
+        f = LzmaOpen(fileName, 'wb', preset = level);
+    else:
+        f = open(fileName, 'wb');
+    ###
+    with f:
+        Pickle(contents, f);
+    ###
+    return;
+###
+# Existing pickle file name, whichever compressor wrote it
+###
+def PickleFileName(baseName, parameters):
+    '''Return name of an existing pickle, preferring the requested compressor\'s extension, or else that of the requested compressor.''';
+    extensions = [PickleExtension(parameters)];
+    extensions.extend(extension for extension in pickleCompressor2Extension.values() if extension not in extensions);
+    ###
+    for extension in extensions:
+        fileName = '{}.pkl{}'.format(baseName, extension);
+        if Exists(fileName):
+            return fileName;
+    ###
+    return '{}.pkl{}'.format(baseName, extensions[0]);
+###
 # Print now
 ###
 def PrintNow(*arguments, sep = '\n'):
@@ -5986,6 +7515,25 @@ def ReadFile(fileName, display = True, size = -1):
     ###
     return raw.decode('utf-8', 'ignore');
 ###
+# Read ORIGEN library, or its parsed contents, from the cache
+###
+def ReadOrigenLibrary(fileName, parser = None, display = True):
+    '''Read and return ORIGEN library, or its contents parsed by a function, reusing them until the library is modified.''';
+    AssertFileExists(fileName);
+    key = (fileName, GetModificationTime(fileName));
+    ###
+    try:
+        parser2Contents = origenLibraryCache[key];
+    except KeyError:
+        parser2Contents = origenLibraryCache[key] = {None : ReadFile(fileName, display = display)};
+    ###
+    try:
+        return parser2Contents[parser];
+    except KeyError:
+        parser2Contents[parser] = parser(parser2Contents[None]);
+    ###
+    return parser2Contents[parser];
+###
 # Read xsdir from DATAPATH
 ###
 def ReadXsDir(path = None, display = True):
@@ -6084,6 +7632,35 @@ def SymbolicLink(pathOne, pathTwo, display = True):
     ###
     return;
 ###
+# Transmute a burn cell within a forked worker process
+###
+def TransmuteProcess(cellNumber):
+    '''Transmute a burn cell within a forked worker process.''';
+    depletionCalculation, transportOutputFile, currentDir = transmuteProcessState[ : 3];
+    cell = transportOutputFile.FindCell(cellNumber);
+    ###
+    # Scratch directory and its shared files persist across this worker's cells
+    ###
+    zam2Moles, micros = depletionCalculation.PrepareTransmute(transportOutputFile, cell, transmuteProcessDirectory, isStaged = True);
+    origenCalculation = depletionCalculation.Transmute(cell, transmuteProcessDirectory, currentDir);
+    ###
+    origenCalculation.AttachMicros(micros);
+    ###
+    depletionCalculation.RetainTapes(cellNumber, transmuteProcessDirectory, currentDir);
+    depletionCalculation.CleanUpFiles(transmuteProcessDirectory, keepStaged = True);
+    ###
+    return (origenCalculation, zam2Moles, micros), depletionCalculation.cellNumber2BurnRate[cellNumber];
+###
+# Make and stage the scratch directory of a forked worker process
+###
+def TransmuteProcessInitialize():
+    '''Make and stage the scratch directory of a forked worker process.''';
+    global transmuteProcessDirectory;
+    transmuteProcessDirectory = MakeTemporaryDirectory(display = transmuteProcessState[0].GetDisplayFiles(), root = transmuteProcessState[3]);
+    transmuteProcessState[0].StageTransmute(transmuteProcessDirectory);
+    ###
+    return;
+###
 # Find a unique integer, given a number of digits and container of forbidden integers
 ###
 def UniqueDigits(numberOfDigits, forbiddenNumbers):
@@ -6093,6 +7670,25 @@ def UniqueDigits(numberOfDigits, forbiddenNumbers):
         if output not in forbiddenNumbers:
             return output;
 ###
+# Unpickle from file, detecting its compressor
+###
+def UnpickleFile(fileName):
+    '''Deserialize contents of a file, detecting its compressor from its leading bytes.''';
+    with open(fileName, 'rb') as f:
+        magic = f.read(8);
+    ###
+    if magic.startswith(pickleCompressor2Magic['gzip']):
+        f = GzipOpen(fileName, 'rb');
+    elif magic.startswith(pickleCompressor2Magic['lzma']):
+        f = LzmaOpen(fileName, 'rb');
+    else:
+        f = open(fileName, 'rb');
+    ###
+    with f:
+        contents = UnPickle(f);
+    ###
+    return contents;
+###
 # Arrange words of a given format within columns
 ###
 def WordArrange(words, format = '', columnNumber = 80, prefix = '', indent = 5):
@@ -6132,8 +7728,8 @@ def WriteCsvFile(fileName, *iterables):
 # Write ascii file
 ###
 def WriteFile(fileName, raw, display = True):
-    '''Write ascii file.''';
-    with open(fileName, 'w') as f:
+    '''Write ascii file, from text or raw bytes.''';
+    with open(fileName, ['w', 'wb'][isinstance(raw, bytes)]) as f:
         if display:
             PrintNow('{} <<'.format(fileName));
         f.write(raw);
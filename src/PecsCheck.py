@@ -165,27 +165,16 @@ class PECSDepletion(DepletionCalculation):
         ###
         self.parameters = depletionCalculationPickle.parameters;
         ###
-        # Read default decay, photon, and cross-section libraries
+        # Read default decay, photon, and cross-section libraries;
+        # Libraries and their parsed contents are shared by every depletion calculation until they are modified
         ###
-        for defaultLibrary in ('defaultDecayLibrary', 'defaultPhotonLibrary', 'defaultXsLibrary'):
-            setattr(self, defaultLibrary, ReadFile(self.GetParameter('origenLibraryPathTemplate').format(self.GetParameter(defaultLibrary)), display = self.GetDisplayFiles()));
+        defaultLibrary2FileName = {defaultLibrary : self.GetParameter('origenLibraryPathTemplate').format(self.GetParameter(defaultLibrary)) for defaultLibrary in ('defaultDecayLibrary', 'defaultPhotonLibrary', 'defaultXsLibrary')};
+        for defaultLibrary, fileName in defaultLibrary2FileName.items():
+            setattr(self, defaultLibrary, ReadOrigenLibrary(fileName, display = self.GetDisplayFiles()));
         ###
         # Populate cross-section library metastable fractions
         ###
-        def HelperExcited(*args):
-            return SafeDivide(args[2], args[0] + args[2]), SafeDivide(args[3], args[1] + args[3]);
-        ###
-        libs = set(int(float(lib)) for lib in ReCompile(r'^ *(\d{1,3}) +', 2 | 8).findall(self.GetDefaultXsLibrary()));
-        ###
-        self.lib2Zams = {};
-        self.lib2Zam2Excite = {};
-        for lib in libs:
-            self.lib2Zams[lib] = [];
-            self.lib2Zam2Excite[lib] = {};
-            for match in ReCompile(r'^ *{} +(\d{{5,7}}) +([\d\.e+\-]+) +([\d\.e+\-]+) +[\d\.e+\-]+ +[\d\.e+\-]+ +([\d\.e+\-]+) +([\d\.e+\-]+) + [\d\.e+\-]+ *$'.format(lib), 2 | 8).finditer(self.GetDefaultXsLibrary()):
-                zam = int(float(match.group(1)));
-                self.lib2Zams[lib].append(zam);
-                self.lib2Zam2Excite[lib][zam] = HelperExcited(*(float(group.replace(' ', '')) for group in match.groups()[1 : ]));
+        self.lib2Zams, self.lib2Zam2Excite, self.xsLibraryLines, self.zam2XsLibrarySlots = ReadOrigenLibrary(defaultLibrary2FileName['defaultXsLibrary'], ParseOrigenXsLibrary, display = self.GetDisplayFiles());
         ###
         # Populate xsdir cross-section zaids
         ###
@@ -206,6 +195,10 @@ class PECSDepletion(DepletionCalculation):
         ###
         self.cellNumber2OrigenCalculation = None;
         ###
+        # Start transmute command runner
+        ###
+        self.commandRunner = CommandRunner(maximumConcurrency = self.GetParameter('numberOfOrigenThreads'), retries = self.GetParameter('commandRetries'));
+        ###
         return;
     ###
     def TransmuteThreads(self, currentDir):
@@ -280,7 +273,9 @@ class PECSDepletion(DepletionCalculation):
         ###
         zam2Moles = self.GetCellNumberZam2Moles(cellNumber);
         ###
-        WriteFile('{}TAPE4.INP'.format(tmpDir), '\n'.join(origenPunchCardTemplate.format(lib = lib % 10, zam = zam, moles = zam2Moles[zam]) for lib, zams in sorted(self.GetLib2Zams().items()) for zam in zams if zam in zam2Moles) + '\n0 0 0 0', display = self.GetDisplayFiles());
+        # Punch isotopes in library file order, which sub-library isotope sets do not keep
+        ###
+        WriteFile('{}TAPE4.INP'.format(tmpDir), '\n'.join(origenPunchCardTemplate.format(lib = lib % 10, zam = zam, moles = zam2Moles[zam]) for lib, zam2Excite in sorted(self.lib2Zam2Excite.items()) for zam in zam2Excite if zam in zam2Moles) + '\n0 0 0 0', display = self.GetDisplayFiles());
         ###
         # TAPE9.INP (default decay and modified cross-section library):
         # Cell microscopic cross-sections
@@ -365,7 +360,7 @@ class PECSDepletion(DepletionCalculation):
         ###
         # Execute ORIGEN
         ###
-        SystemCall(self.GetParameter('origenRunCommand').format(tmpDir, currentDir));
+        self.GetCommandRunner().Run(self.GetParameter('origenRunCommand').format(tmpDir, currentDir), timeout = self.GetParameter('origenTimeout'));
         ###
         # Parse transmute results
         ###
@@ -507,27 +502,29 @@ DepletionCalculationPickle.__sub__ = McnpInputFile.__sub__;
 ###
 def GetZa2Moles(self, cellNumbers = None, endOfCycle = False):
     '''Override dicionary mapping isotope to moles.''';
-    cellNumber2Zam2Moles = self.cellNumber2Zam2Moles;
+    history = self.GetHistory();
     ###
     if cellNumbers is None:
-        cellNumbers = cellNumber2Zam2Moles.keys();
+        cellNumbers = history.GetBurnCellNumbers().tolist();
     ###
     za2Moles = {};
     ###
-    for cellNumber, zam2Moles in cellNumber2Zam2Moles.items():
+    for cellNumber in history.GetBurnCellNumbers().tolist():
         ###
         # Kick out cell #'s which are not requested
         ###
         if cellNumber not in cellNumbers:
             continue;
         ###
-        zam2Mole = [zam2Mole for zam2Mole in zam2Moles if zam2Mole][0 - endOfCycle];
+        # First (or last) depletion step holding inventories for this cell
+        ###
+        depletionStep = history.GetCellNumberPopulatedSteps(cellNumber)[0 - endOfCycle];
         ###
-        for zam, moles in zam2Mole.items():
+        for za, moles in history.GetZa2Moles(depletionStep, [cellNumber]).items():
             try:
-                za2Moles[Zam2Za(zam)] += moles;
+                za2Moles[za] += moles;
             except KeyError:
-                za2Moles[Zam2Za(zam)] = moles;
+                za2Moles[za] = moles;
     ###
     return za2Moles;
 ###
@@ -608,6 +605,7 @@ def ProcessFuel(self, previousPickle):
     # Recharge cells
     ###
     currentPickle.cellNumber2Zam2Moles = {cellNumber : [{Za2Zam(za) : moles for za, moles in za2ChargeMoles.items()}] for cellNumber, za2ChargeMoles in cellNumber2Za2ChargeMoles.items()};
+    currentPickle.PopulateHistory();
     ###
     return currentPickle;
 ###
@@ -644,7 +642,7 @@ if __name__ == '__main__':
     ###
     # MocDown depletion calculation pickle
     ###
-    arguments.pickleFileName = '{}.pkl.gz'.format(arguments.transportFileName);
+    arguments.pickleFileName = PickleFileName(arguments.transportFileName, mocDownInputFile.GetParameters());
     ###
     # Find equilibrium
     ###
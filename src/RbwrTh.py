@@ -5,16 +5,23 @@
 ###
 
 if 'Offline' in __file__.split('/')[-1].replace('.py', ''):
-    from MocDown import Array,\
+    from MocDown import Arange,\
+                        Array,\
                         Class,\
+                        Concatenate,\
                         Exponent,\
+                        Futures,\
+                        GetMultiprocessingContext,\
                         LinearInterpolate,\
+                        Maximum,\
                         McnpInputFile,\
+                        Minimum,\
                         MocDownInputFile,\
                         Nan2Num,\
                         NaturalLogarithm,\
                         NonZero,\
                         PrintNow,\
+                        Where,\
                         WordArrange,\
                         WriteFile,\
                         ZaIsActinide,\
@@ -22,6 +29,18 @@ if 'Offline' in __file__.split('/')[-1].replace('.py', ''):
                         avogadrosNumber,\
                         epsilon;
 
+###
+### Constants
+###
+
+###
+# Saturated steam property tables, keyed by interpolation tolerance, and exact saturated and inlet steam properties, keyed by state;
+# Shared by every boiling calculation, as pressure and inlet temperature rarely change
+###
+tolerance2SaturationTable = {};
+pressure2SaturationProperties = {};
+pressureTemperature2InletProperties = {};
+
 ###
 ### Custom classes
 ###
@@ -178,7 +197,7 @@ class BoilingCalculation:
 ###
 class Steam:
     '''Steam thermodynamic properties.''';
-    def __init__(self, pressure, temperature, massFlowRate, heatedDiameter, hydraulicDiameter, flowArea):
+    def __init__(self, pressure, temperature, massFlowRate, heatedDiameter, hydraulicDiameter, flowArea, tableTolerance = 0):
         '''Construct a new instance.''';
         ###
         # Import IAPWS97 steam properties library
@@ -221,35 +240,16 @@ class Steam:
         ###
         self.massFlux = self.massFlowRate / self.flowArea;
         ###
-        # Sub-cooled, saturated liquid, and saturated vapor
-        ###
-        inlet  = iapws.IAPWS97(P = self.pressure, T = self.temperature);
-        liquid = iapws.IAPWS97(P = self.pressure, x = 0);
-        vapor  = iapws.IAPWS97(P = self.pressure, x = 1);
+        # Sub-cooled inlet:
+        # Mass density [kg/m³], specific enthalpy [kJ/kg], and dynamic viscosity [Pa·s]
         ###
-        # Mass density [kg/m³]
+        self.densityInlet, self.enthalpyInlet, self.dynamicViscosityInlet = InletSteamProperties(self.pressure, self.temperature);
         ###
-        self.densityInlet   = inlet.rho;
-        self.densityLiquid  = liquid.rho;
-        self.densityVapor   = vapor.rho;
+        # Saturated liquid and saturated vapor:
+        # Mass density [kg/m³], specific enthalpy [kJ/kg], surface tension [N/m], and dynamic viscosity [Pa·s]
         ###
-        # Specific enthalpy [kJ/kg]
-        ###
-        self.enthalpyInlet  = inlet.h;
-        self.enthalpyLiquid = liquid.h;
-        self.enthalpyVapor  = vapor.h;
-        ###
-        # Surface tension [N/m]
-        ###
-        self.surfaceTension = liquid.sigma;
-        ###
-        # Dynamic viscosity [Pa·s]
-        ###
-        liquid = iapws.IAPWS97(P = self.pressure, T = liquid.T - 1e-9);
-        vapor  = iapws.IAPWS97(P = self.pressure, T = vapor.T + 1e-9);
-        self.dynamicViscosityInlet        = inlet.mu;
-        self.dynamicViscosityLiquid       = liquid.mu;
-        self.dynamicViscosityVapor        = vapor.mu;
+        for attribute, value in SaturatedSteamProperties(self.pressure, tableTolerance).items():
+            setattr(self, attribute, value);
         ###
         return;
     ###
@@ -287,6 +287,96 @@ class Steam:
 ### Custom functions
 ###
 
+###
+# Exact saturated steam properties
+###
+def ExactSaturatedSteamProperties(pressures):
+    '''Return saturated liquid and vapor properties at an array of pressures.''';
+    ###
+    # Import IAPWS97 steam properties library
+    ###
+    import iapws;
+    ###
+    # Saturated liquid and saturated vapor;
+    # Viscosities are probed just off of the saturation line, where they are defined
+    ###
+    liquid = iapws.IAPWS97_array(pressures, x = 0, properties = ('T', 'rho', 'h', 'sigma'));
+    vapor  = iapws.IAPWS97_array(pressures, x = 1, properties = ('rho', 'h'));
+    ###
+    return {
+        'densityLiquid' : liquid['rho'],
+        'densityVapor' : vapor['rho'],
+        'enthalpyLiquid' : liquid['h'],
+        'enthalpyVapor' : vapor['h'],
+        'surfaceTension' : liquid['sigma'],
+        'dynamicViscosityLiquid' : iapws.IAPWS97_array(pressures, T = liquid['T'] - 1e-9, properties = ('mu',))['mu'],
+        'dynamicViscosityVapor' : iapws.IAPWS97_array(pressures, T = liquid['T'] + 1e-9, properties = ('mu',))['mu'],
+    };
+###
+# Inlet steam properties
+###
+def InletSteamProperties(pressure, temperature):
+    '''Return inlet mass density, specific enthalpy, and dynamic viscosity, reusing them until pressure or temperature change.''';
+    try:
+        return pressureTemperature2InletProperties[(pressure, temperature)];
+    except KeyError:
+        ###
+        # Import IAPWS97 steam properties library
+        ###
+        import iapws;
+        ###
+        inlet = iapws.IAPWS97(P = pressure, T = temperature);
+        pressureTemperature2InletProperties[(pressure, temperature)] = inlet.rho, inlet.h, inlet.mu;
+    ###
+    return pressureTemperature2InletProperties[(pressure, temperature)];
+###
+# Saturated steam properties
+###
+def SaturatedSteamProperties(pressure, tolerance = 0):
+    '''Return saturated liquid and vapor properties, interpolated from a table within a relative tolerance if requested.''';
+    ###
+    # Kick out exact properties if no tolerance is requested or if pressure is not tabulated
+    ###
+    if tolerance > 0:
+        minimumPressure, maximumPressure, attribute2Spline = SaturationTable(tolerance);
+    if tolerance <= 0 or not minimumPressure <= pressure <= maximumPressure:
+        try:
+            return pressure2SaturationProperties[pressure];
+        except KeyError:
+            pressure2SaturationProperties[pressure] = {attribute : float(values[0]) for attribute, values in ExactSaturatedSteamProperties([pressure]).items()};
+        ###
+        return pressure2SaturationProperties[pressure];
+    ###
+    return {attribute : float(spline(NaturalLogarithm(pressure))) for attribute, spline in attribute2Spline.items()};
+###
+# Saturated steam property table
+###
+def SaturationTable(tolerance, minimumPressure = 0.1, maximumPressure = 16):
+    '''Return pressure bounds [MPa] and saturated property splines over log-pressure, refined until their relative error is below a tolerance.''';
+    try:
+        return tolerance2SaturationTable[tolerance];
+    except KeyError:
+        from numpy import abs as AbsoluteValue, geomspace as GeometricSpace, sqrt as SquareRoot;
+        from scipy.interpolate import CubicSpline;
+        ###
+        # Double the number of pressure intervals until spline errors at their midpoints are within tolerance
+        ###
+        numberOfPressures = 17;
+        while True:
+            pressures = GeometricSpace(minimumPressure, maximumPressure, numberOfPressures);
+            attribute2Spline = {attribute : CubicSpline(NaturalLogarithm(pressures), values) for attribute, values in ExactSaturatedSteamProperties(pressures).items()};
+            ###
+            midpoints = SquareRoot(pressures[: -1] * pressures[1 :]);
+            error = max((AbsoluteValue(attribute2Spline[attribute](NaturalLogarithm(midpoints)) / values - 1)).max() for attribute, values in ExactSaturatedSteamProperties(midpoints).items());
+            assert(error == error);
+            if error <= tolerance:
+                break;
+            ###
+            numberOfPressures = 2 * numberOfPressures - 1;
+        ###
+        tolerance2SaturationTable[tolerance] = minimumPressure, maximumPressure, attribute2Spline;
+    ###
+    return tolerance2SaturationTable[tolerance];
 ###
 # Library-specific MocDown input parameters
 ###
@@ -298,6 +388,7 @@ def GetLibraryParametersConverters(self):
     parameters = {
         # #
         'criticalPowerRatioFallbackIndex' : 41,
+        'numberOfThermalHydraulicProcesses' : 1,
         # #.#
         # #
         'coolantDensityDampingCoefficient' : 1,
@@ -308,6 +399,7 @@ def GetLibraryParametersConverters(self):
         'coolantInletTemperature' : 555.71, # [K]
         'coolantMassFlowRate' : 29.68, # [kg/s]
         'criticalPowerRatioLimit' : 1.3,
+        'steamTableTolerance' : 1e-6, # Relative; 0 evaluates saturated steam properties exactly
         'thermalHydraulicConvergenceTolerance' : 5e-2,
         # ''.lower()
         'criticalPowerRatioCorrelation' : 'm-cise',
@@ -355,6 +447,7 @@ def GetLibraryParametersConverters(self):
     converters = {
         # #
         'criticalPowerRatioFallbackIndex' : Int,
+        'numberOfThermalHydraulicProcesses' : Int,
         # #.#
         'coolantDensityDampingCoefficient' : Float,
         'coolantFlowArea' : Float,
@@ -364,6 +457,7 @@ def GetLibraryParametersConverters(self):
         'coolantInletTemperature' : Float,
         'coolantMassFlowRate' : Float,
         'criticalPowerRatioLimit' : Float,
+        'steamTableTolerance' : Float,
         'thermalHydraulicConvergenceTolerance' : Float,
         # ''.lower()
         'criticalPowerRatioCorrelation' : Lower,
@@ -540,11 +634,12 @@ def MultiBatchCoreKeffEoc(self):
     ###
     # Extract coarse times, keffs, and powers
     ###
-    coarseIndex = [index for index in range(len(self)) if self.GetDepletionCalculationPickle().multiplicationFactors[index] is not None];
+    history = self.GetDepletionCalculationPickle().GetHistory();
+    coarseIndex = [index for index in history.GetTransportSteps().tolist() if index < len(self)];
     ###
     coarseTimes = [self.GetParameter('depletionStepTimeEnds')[index] for index in coarseIndex];
     coarsePowers = [self.GetParameter('depletionStepPowers')[index] for index in coarseIndex];
-    coarseKeffs = [self.GetDepletionCalculationPickle().multiplicationFactors[index] for index in coarseIndex];
+    coarseKeffs = history.GetMultiplicationFactors()[coarseIndex].tolist();
     ###
     # Construct core keffs from coarse keffs (which may or may not coincide with batch keffs)
     # Right now, it is assumed that each batch produces the same power
@@ -788,67 +883,41 @@ def VoidFractionLPG(steam, quality):
     ###
     boundary = 2.34 - 1.07 * (g * sigma * rholv / rhol ** 2.) ** 0.25;
     ###
+    # Determine flow regimes;
+    # Bubbly (0), annular (1), or churn/slug (2)
+    ###
+    regime = Where(jl > boundary, 0, Where(jgst > 1, 1, 2));
+    ###
     # Instantiate void fraction
     ###
-    alpha = Array([0.] * len(quality));
+    alpha = Zeros(len(quality));
     ###
-    # Iterate over spatial regions
+    # Fixed-point iteration of every spatial region simultaneously;
+    # Regions are frozen once converged
     ###
-    for index in range(len(x)):
+    indexs = Arange(len(x));
+    while len(indexs):
+        previous = alpha[indexs];
+        regimes = regime[indexs];
         ###
-        # Determine flow regime
+        # Bubbly, annular, and churn/slug drift-flux parameters
         ###
-        if jl[index] > boundary:
-            regime = 0;
-        elif jgst[index] > 1:
-            regime = 1;
-        else:
-            regime = 2;
-        ###
-        # Use value of prior cell as a first guess for the void fraction, if it exists
-        ###
-        if index:
-            alpha[index] = alpha[index - 1];
-        ###
-        # Fixed-point iteration
-        ###
-        difference = epsilon;
-        while difference >= epsilon:
-            previous = alpha[index];
-            if 0 == regime:
-                ###
-                # Bubbly
-                ###
-                C0 = 1.;
-                Vvj = 1.53 * (1. - alpha[index]) ** 2. * (g * sigma * rholv / rhol ** 2.) ** 0.25;
-            elif 1 == regime:
-                ###
-                # Annular
-                ###
-                C0 = 1. + (1. - alpha[index]) / (alpha[index] + 4. * (rhov / rhol) ** 0.5);
-                Vvj = (C0 - 1.) * (g * De * rholv * (1 - alpha[index]) / (0.015 * rhol)) ** 0.5;
-            elif 2 == regime:
-                ###
-                # Churn/slug
-                ###
-                C0 = 1.2 - 0.2 * (rhov / rhol) ** 0.5 * (1. - Exponent(-18. * alpha[index]));
-                Vvj = 0.33 * (g * sigma * rholv / rhov ** 2.) ** 0.25;
-            ###
-            alpha[index] = VoidFractionDriftFlux(x = x[index], rhol = rhol, rhov = rhov, G = G, C0 = C0, Vvj = Vvj);
-            ###
-            difference = abs(previous - alpha[index]);
+        C0 = Where(0 == regimes, 1., Where(1 == regimes, 1. + (1. - previous) / (previous + 4. * (rhov / rhol) ** 0.5), 1.2 - 0.2 * (rhov / rhol) ** 0.5 * (1. - Exponent(-18. * previous))));
+        Vvj = Where(0 == regimes, 1.53 * (1. - previous) ** 2. * (g * sigma * rholv / rhol ** 2.) ** 0.25, Where(1 == regimes, (C0 - 1.) * (g * De * rholv * (1 - previous) / (0.015 * rhol)) ** 0.5, 0.33 * (g * sigma * rholv / rhov ** 2.) ** 0.25));
         ###
-        # Smooth discontinuities between flow-regimes
+        alpha[indexs] = VoidFractionDriftFlux(x = x[indexs], rhol = rhol, rhov = rhov, G = G, C0 = C0, Vvj = Vvj);
         ###
-        if 0 == regime:
-            alphaBubbly = alpha[index];
-        elif 1 == regime:
-            try:
-                alpha[index] = max(alpha[index], alphaSlug);
-            except UnboundLocalError:
-                alpha[index] = max(alpha[index], alphaBubbly);
-        elif 2 == regime:
-            alphaSlug = alpha[index];
+        indexs = indexs[abs(previous - alpha[indexs]) >= epsilon];
+    ###
+    # Smooth discontinuities between flow-regimes;
+    # Annular void fractions are bounded by that of the latest churn/slug region, or else the latest bubbly region
+    ###
+    slices = Arange(len(x));
+    latestSlug = Maximum.accumulate(Where(2 == regime, slices, -1));
+    latestBubbly = Maximum.accumulate(Where(0 == regime, slices, -1));
+    latest = Where(latestSlug >= 0, latestSlug, latestBubbly);
+    annular = NonZero((1 == regime) & (latest >= 0))[0];
+    alpha[annular] = Maximum(alpha[annular], alpha[latest[annular]]);
     ###
     # Return drift-flux void fraction
     ###
@@ -880,12 +949,12 @@ def VoidFractionChexalLellouche(steam, quality):
     Rel = G * (1 - x) * De / mul;
     Rev = G *  x * De / muv;
     ###
-    B1 = Array([min(0.8, 1 / (1 + Exponent(-max(Rel[index], Rev[index]) / 6e4))) for index in range(len(x))]);
+    B1 = Minimum(0.8, 1 / (1 + Exponent(-Maximum(Rel, Rev) / 6e4)));
     K0 = B1 + (1 - B1) * rhovOl ** 0.25;
     r = (1 + 1.57 * rhovOl) / (1 - B1);
     C1 = 4 * Pcrit ** 2. / P / (Pcrit - P);
     ###
-    C3 = Array([max(0.5, 2 * Exponent(-abs(Rel[index]) / 6e4)) for index in range(len(x))]);
+    C3 = Maximum(0.5, 2 * Exponent(-abs(Rel) / 6e4));
     C5 = (150 * rhovOl) ** 0.5;
     if 1 / rhovOl <= 18:
         C2 = 0.4757 * (-NaturalLogarithm(rhovOl)) ** 0.7;
@@ -901,31 +970,25 @@ def VoidFractionChexalLellouche(steam, quality):
     else:
         C4 = 1 / (1 - Exponent(-C5 / (1 - C5)));
     ###
-    # Instantiate void fraction
+    # Instantiate void fraction;
+    # Use the homogeneous void fraction, an upper bound, as a first guess
     ###
-    alpha = Array([0.] * len(quality));
+    alpha = VoidFractionDriftFlux(x = x, rhol = rhol, rhov = rhov, G = G, C0 = 1, Vvj = 0);
     ###
-    # Iterate over spatial regions
+    # Fixed-point iteration of every spatial region simultaneously;
+    # Regions are frozen once converged
     ###
-    for index in range(len(x)):
+    indexs = Arange(len(x));
+    while len(indexs):
+        previous = alpha[indexs];
+        C9 = (1 - previous) ** B1[indexs];
+        Vvj = 2 ** 0.5 * (g * sigma * rholv / rhol ** 2.) ** 0.25 * C2 * C3[indexs] * C4 * C9;
+        L = (1 - Exponent(-C1 * previous)) / (1 - Exponent(-C1));
+        C0 = L / (K0[indexs] + (1 - K0[indexs]) * previous ** r[indexs]);
         ###
-        # Use value of prior cell as a first guess for the void fraction, if it exists
+        alpha[indexs] = VoidFractionDriftFlux(x = x[indexs], rhol = rhol, rhov = rhov, G = G, C0 = C0, Vvj = Vvj);
         ###
-        if index:
-            alpha[index] = alpha[index - 1];
-        ###
-        # Fixed-point iteration
-        ###
-        difference = epsilon;
-        while difference >= epsilon:
-            previous = alpha[index];
-            C9 = (1 - alpha[index]) ** B1[index];
-            Vvj = 2 ** 0.5 * (g * sigma * rholv / rhol ** 2.) ** 0.25 * C2 * C3[index] * C4 * C9;
-            L = (1 - Exponent(-C1 * alpha[index])) / (1 - Exponent(-C1));
-            C0 = L / (K0[index] + (1 - K0[index]) * alpha[index] ** r[index]);
-            ###
-            alpha[index] = VoidFractionDriftFlux(x = x[index], rhol = rhol, rhov = rhov, G = G, C0 = C0, Vvj = Vvj);
-            difference = abs(previous - alpha[index]);
+        indexs = indexs[abs(previous - alpha[indexs]) >= epsilon];
     ###
     # Return drift-flux void fraction
     ###
@@ -950,7 +1013,7 @@ def CriticalPowerRatioMITCISE4(steam, axialPowers, flowLengths, endIndex):
     Pcrit = steam.criticalPressure;
     hfg = steam.enthalpyVapor - steam.enthalpyLiquid;
     dhsub = steam.enthalpyLiquid - steam.enthalpyInlet;
-    Pz = Array([axialPower for axialPower in axialPowers]);
+    Pz = Array(axialPowers);
     dz = flowLengths;
     ###
     # Define correlation limits
@@ -997,18 +1060,17 @@ def CriticalPowerRatioMITCISE4(steam, axialPowers, flowLengths, endIndex):
     else:
         a = (1 - P / Pcrit) / (0.7 * G / 1000.) ** (1. / 3.);
     ###
-    # Iterate over spatial regions
+    # Accumulate boiling lengths and thermal powers of spatial regions past the onset of boiling;
+    # Thermal powers start from the power before the onset of boiling
+    ###
+    boilingSlice = slice(onsetIndex + 1, endIndex);
+    boilingLength = Array(dz[boilingSlice]).cumsum();
+    thermalPower = Concatenate((Pz[ : onsetIndex], Pz[boilingSlice])).cumsum()[onsetIndex : ];
     ###
     criticalQuality = Zeros(Pz.shape);
     criticalPowerRatio = Zeros(Pz.shape);
-    boilingLength = 0;
-    thermalPower = sum(Pz[ : onsetIndex]);
-    for index in range(onsetIndex + 1, endIndex):
-        boilingLength += dz[index];
-        thermalPower += Pz[index];
-        ###
-        criticalQuality[index] = (De / Dh) * a / (1 + b / boilingLength);
-        criticalPowerRatio[index] = mdot * hfg * criticalQuality[index] / thermalPower;
+    criticalQuality[boilingSlice] = (De / Dh) * a / (1 + b / boilingLength);
+    criticalPowerRatio[boilingSlice] = mdot * hfg * criticalQuality[boilingSlice] / thermalPower;
     ###
     return criticalQuality, criticalPowerRatio;
 ###
@@ -1041,21 +1103,17 @@ def PressureDropTwoPhase(steam, quality, voidFraction, massDensity, flowLengths,
     ###
     vm = Nan2Num(x ** 2. / rhov / alpha + (1 - x) ** 2. / rhov / (1 - alpha));
     flo = 0.079 * (G * De / mul) ** -0.25;
+    dz = Array(dz);
     ###
-    # Iterate over spatial regions
+    # Accumulate spatial region increments;
+    # Acceleration;
+    # Gravitational;
+    # Frictional
     ###
-    dP = Zeros(x.shape);
-    for index in range(1, len(x)):
-        ###
-        # Accumulate;
-        # Acceleration;
-        # Gravitational;
-        # Frictional
-        ###
-        dP[index] = dP[index - 1] + \
-                    G ** 2. * (vm[index] - vm[index - 1]) + \
-                    g * 0.5 * (dz[index - 1] + dz[index]) * 0.5 * (rhomix[index - 1] + rhomix[index]) + \
-                    2. * flo * G ** 2. / De / rhol * 0.5 * (dz[index - 1] + dz[index]) * 0.5 * (phi2[index - 1] + phi2[index]);
+    dP = Concatenate(([0.], \
+                      G ** 2. * (vm[1 : ] - vm[ : -1]) + \
+                      g * 0.5 * (dz[ : -1] + dz[1 : ]) * 0.5 * (rhomix[ : -1] + rhomix[1 : ]) + \
+                      2. * flo * G ** 2. / De / rhol * 0.5 * (dz[ : -1] + dz[1 : ]) * 0.5 * (phi2[ : -1] + phi2[1 : ]))).cumsum();
     ###
     return dP;
 ###
@@ -1110,215 +1168,47 @@ def RbwrThBoilingCalculation(self, transportOutputFile):
     ###
     # Extract steam properties
     ###
-    steam = Steam(pressure = self.GetParameter('coolantInletPressure'), temperature = self.GetParameter('coolantInletTemperature'), massFlowRate = self.GetParameter('coolantMassFlowRate'), heatedDiameter = self.GetParameter('coolantHeatedDiameter'), hydraulicDiameter = self.GetParameter('coolantHydraulicDiameter'), flowArea = self.GetParameter('coolantFlowArea'));
+    steam = Steam(pressure = self.GetParameter('coolantInletPressure'), temperature = self.GetParameter('coolantInletTemperature'), massFlowRate = self.GetParameter('coolantMassFlowRate'), heatedDiameter = self.GetParameter('coolantHeatedDiameter'), hydraulicDiameter = self.GetParameter('coolantHydraulicDiameter'), flowArea = self.GetParameter('coolantFlowArea'), tableTolerance = self.GetParameter('steamTableTolerance'));
     ###
     if self.GetIsVerbose():
         PrintNow(steam);
     ###
-    # Iterate over assemblies
+    # Assembly -> axial zone powers
     ###
-    assemblyIndex = 0;
-    assemblyIndex2VoidFractionCalculation = {};
-    for assembly in assemblys:
-        ###
-        # Extract original water densities
-        ###
-        cellNumbers = [cool for fuels2Cools in assembly for cools in fuels2Cools.values() for cool in cools];
-        cellNumber2PreviousMassDensity = {cellNumber : transportOutputFile.FindCell(cellNumber).GetMassDensity() for cellNumber in cellNumbers + self.GetParameter('coolantBypassCells')};
-        ###
-        # Build axial power list;
-        # Coolant is heated by fuels AND by cools
-        ###
-        axialZones = len(assembly);
-        axialPowers = [sum(cellNumber2ThermalPower[fuel] for fuels in fuels2Cools for fuel in fuels if fuel not in fuels2Cools[fuels]) + sum(cellNumber2ThermalPower[cool] for cools in fuels2Cools.values() for cool in cools) for fuels2Cools in assembly];
-        ###
-        # Distribute missing powers
-        ###
-        allFuels = {fuel for fuels2Cools in assembly for fuels in fuels2Cools for fuel in fuels};
-        allCools = {cool for fuels2Cools in assembly for cools in fuels2Cools.values() for cool in cools};
-        missingCellNumbers = set(cellNumber2ThermalPower.keys()) - (allFuels | allCools);
-        if missingCellNumbers:
-            missingPower = sum(cellNumber2ThermalPower[cellNumber] for cellNumber in missingCellNumbers);
-            PrintNow('> Distributing {:.0f} Wth from cell #\'s {:s} among {:d} cells in assembly #{:d}'.format(missingPower, ' '.join(str(missingCellNumber) for missingCellNumber in missingCellNumbers), axialZones, assemblyIndex));
-            missingPower /= axialZones;
-            axialPowers = [axialPower + missingPower for axialPower in axialPowers];
-        ###
-        # Slice axial power array;
-        ###
-        zoneSlices = 500;
-        axialPowers = Array([axialPower / zoneSlices for axialPower in axialPowers for index in range(zoneSlices)]);
-        ###
-        # Convert axial powers Wth -> kWth
-        ###
-        axialPowers /= 1e3;
-        ###
-        # Initialize axial quality, void fraction, and density
-        ###
-        axialQualitys = Zeros(axialPowers.shape);
-        axialVoidFractions = Zeros(axialPowers.shape);
-        axialMassDensitys = Zeros(axialPowers.shape);
-        ###
-        # Determine the locations of the onset of boiling and end of heating
-        ###
-        onsetIndex = NonZero(axialPowers.cumsum() / steam.massFlowRate >= (steam.enthalpyLiquid - steam.enthalpyInlet))[0][0];
-        ###
-        for endIndex in range(len(assembly)):
-            fuels2Cools = assembly[-(endIndex + 1)];
-            if set(next(fuels for fuels in fuels2Cools)) != set(next(cools for cools in fuels2Cools.values())):
-                break;
-            endIndex = None;
-        ###
-        if endIndex is None:
-            endIndex = 0;
-        endIndex = (axialZones - endIndex) * zoneSlices;
-        ###
-        onePhaseSlice = slice(0, onsetIndex);
-        twoPhaseSlice = slice(onsetIndex, axialZones * zoneSlices);
-        ###
-        # Calculate axial qualities
-        ###
-        latentHeat = steam.enthalpyVapor - steam.enthalpyLiquid;
-        axialQualitys[twoPhaseSlice] = Array([axialPowers[twoPhaseSlice] / steam.massFlowRate / latentHeat]).cumsum();
-        ###
-        # Calculate axial void fractions
-        ###
-        voidFractionCorrelation = self.GetParameter('voidFractionCorrelation');
-        ###
-        if voidFractionCorrelation in ('bestion', ):
-            VoidFractionCorrelation = VoidFractionBestion;
-        elif voidFractionCorrelation in ('lpg', 'bestest', 'liao'):
-            VoidFractionCorrelation = VoidFractionLPG;
-        elif voidFractionCorrelation in ('relap', ):
-            VoidFractionCorrelation = VoidFractionRELAP;
-        elif voidFractionCorrelation in ('hom', 'homogeneous'):
-            VoidFractionCorrelation = VoidFractionHomogeneous;
-        elif voidFractionCorrelation in ('zivi', ):
-            VoidFractionCorrelation = VoidFractionZivi;
-        elif voidFractionCorrelation in ('wallis', ):
-            VoidFractionCorrelation = VoidFractionWallis;
-        elif voidFractionCorrelation in ('lm', 'lockhart', 'martinelli'):
-            VoidFractionCorrelation = VoidFractionLM;
-        elif voidFractionCorrelation in ('thom', ):
-            VoidFractionCorrelation = VoidFractionThom;
-        elif voidFractionCorrelation in ('baroczy', ):
-            VoidFractionCorrelation = VoidFractionBaroczy;
-        else:
-            raise ValueError('Void fraction correlation `{}\' is unrecognized'.format(voidFractionCorrelation));
-        axialVoidFractions[twoPhaseSlice] = VoidFractionCorrelation(steam, axialQualitys[twoPhaseSlice]);
-        ###
-        # Calculate axial mass densitys
-        # Linearly interpolate density until boiling onset
-        ###
-        axialMassDensitys[onePhaseSlice] = steam.densityInlet + Array([(index / onsetIndex) * (steam.densityLiquid - steam.densityInlet) for index in range(onsetIndex)]);
-        axialMassDensitys[twoPhaseSlice] = axialVoidFractions[twoPhaseSlice] * steam.densityVapor + (1 - axialVoidFractions[twoPhaseSlice]) * steam.densityLiquid;
-        ###
-        # Construct slice flow lengths
-        ###
-        flowLengths = [flowLength / zoneSlices for flowLength in self.GetParameter('coolantFlowLengths') for index in range(zoneSlices)];
-        ###
-        # Calculate critical quality and critical power ratio
-        ###
-        criticalPowerRatioCorrelation = self.GetParameter('criticalPowerRatioCorrelation');
-        ###
-        if criticalPowerRatioCorrelation in ('m-cise', ):
-            CriticalPowerRatioCorrelation = CriticalPowerRatioMITCISE4;
-        elif criticalPowerRatioCorrelation in ('h-cise', ):
-            CriticalPowerRatioCorrelation = CriticalPowerRatioHitachiCISE4;
-        else:
-            raise ValueError('Critical power ratio correlation `{}\' is unrecognized'.format(criticalPowerRatioCorrelation));
-        axialCriticalQualitys, axialCriticalPowerRatios = CriticalPowerRatioCorrelation(steam, axialPowers, flowLengths, endIndex);
-        ###
-        # Determine the minimum critical power ratio, its quality, and its location
-        ###
-        from numpy import nanargmin as NanArgMin;
-        ###
-        CPR = Array([element for element in axialCriticalPowerRatios]);
-        CPR[NonZero(CPR == 0)] = None;
-        ###
-        # Find initial CPR peak to ignore
-        ###
-        for peakIndex in range(len(CPR) - 1):
-            if CPR[peakIndex + 1] < CPR[peakIndex]:
-                break;
-            ###
-            peakIndex = None;
-        if peakIndex is None:
-            ###
-            # If the CPR monotonically increases, fall back onto an a priori index
-            ###
-            Warning('There is no valid MCPR ... the CPR at the fallback location is chosen instead');
-            peakIndex = self.GetParameter('criticalPowerRatioFallbackIndex') * zoneSlices;
-        ###
-        troughIndex = peakIndex + NanArgMin(CPR[peakIndex : ]);
-        ###
-        minimumCriticalPowerRatio = axialCriticalPowerRatios[troughIndex];
-        minimumCriticalPowerRatioLocation = sum(flowLengths[ : troughIndex]);
-        minimumCriticalPowerRatioQuality = axialCriticalQualitys[troughIndex];
-        ###
-        # Calculate pressure drop
-        ###
-        pressureDropCorrelation = self.GetParameter('pressureDropCorrelation');
-        ###
-        if pressureDropCorrelation in ('epri', 'reddy', 'vipre', 'cobra'):
-            PressureDropCorrelation = PressureDropEPRI;
-        else:
-            raise ValueError('Pressure drop correlation `{}\' is unrecognized'.format(pressureDropCorrelation));
-        axialPressureDrops = PressureDropCorrelation(steam, axialQualitys, axialVoidFractions, axialMassDensitys, flowLengths);
-        ###
-        # Collapse axial power, quality, void fraction, density, and pressure drop arrays
-        ###
-        def Collapse(array, indexs, jndexs):
-            return Array([array[(index) * jndexs : (index + 1) * jndexs].mean() for index in range(indexs)]);
-        ###
-        axialPowers = Collapse(axialPowers, axialZones, zoneSlices) * zoneSlices;
-        axialQualitys = Collapse(axialQualitys, axialZones, zoneSlices);
-        axialVoidFractions = Collapse(axialVoidFractions, axialZones, zoneSlices);
-        axialMassDensitys = Collapse(axialMassDensitys, axialZones, zoneSlices);
-        axialPressureDrops = Collapse(axialPressureDrops, axialZones, zoneSlices);
-        finePositionCPRs = [(sum(flowLengths[ : index]), axialCriticalPowerRatios[index]) for index in range(len(axialCriticalPowerRatios))];
-        ###
-        # Convert axial power kWth -> Wth;
-        # Convert density kg/m³ -> g/cc;
-        # Convert pressure drop Pa -> MPa
-        ###
-        axialPowers *= 1e3;
-        axialMassDensitys /= 1e3;
-        axialPressureDrops /= 1e6;
-        ###
-        # Cell # -> mass density
-        ### # FIXME Fix for multiple coolant cells
-        cellNumber2MassDensity = {cellNumbers[index] : axialMassDensitys[index] for index in range(len(cellNumbers))};
-        ###
-        # Average previous and current water density estimates
-        ###
-        theta = self.GetParameter('coolantDensityDampingCoefficient');
-        for cellNumber, massDensity in cellNumber2MassDensity.items():
-            cellNumber2MassDensity[cellNumber] = theta * massDensity + (1 - theta) * cellNumber2PreviousMassDensity[cellNumber];
-        ###
-        # Set bypass density to that of the inlet
+    assemblyAxialPowers = AssemblyAxialPowers(cellNumber2ThermalPower, assemblys);
+    ###
+    # Solve assemblies, each independent given its axial powers;
+    # Multiple assemblies are solved concurrently within forked worker processes
+    ###
+    processes = min(self.GetParameter('numberOfThermalHydraulicProcesses'), len(assemblys));
+    if processes > 1:
+        PrintNow('> Executing {:d} concurrent boiling calculation processes for {:d} assemblies'.format(processes, len(assemblys)));
         ###
-        inletMassDensity = cellNumber2MassDensity[next(iter(cellNumbers))];
-        cellNumber2MassDensity.update({cellNumber : inletMassDensity for cellNumber in self.GetParameter('coolantBypassCells')});
+        # Forked worker processes inherit this depletion calculation, transport results, steam, and axial powers;
+        # Background pickle writes are finished first, as forking amid a writing thread is unsafe
         ###
-        # Calculate convergence norm
+        self.WaitForPickles();
+        global boilingProcessState;
+        boilingProcessState = (self, transportOutputFile, steam, assemblyAxialPowers);
         ###
-        relativeDifferences = Array([abs(cellNumber2MassDensity[cellNumber] / cellNumber2PreviousMassDensity[cellNumber] - 1) for cellNumber in cellNumbers + self.GetParameter('coolantBypassCells')]);
+        with Futures.ProcessPoolExecutor(max_workers = processes, mp_context = GetMultiprocessingContext('fork')) as executor:
+            assemblyCalculations = list(executor.map(BoilingProcess, range(len(assemblys))));
         ###
-        normType = self.GetParameter('thermalHydraulicConvergenceNormType');
-        if normType in ('1', 'one'):
-            norm = relativeDifferences.mean();
-            normCharacter = '1';
-        elif normType in ('2', 'two'):
-            norm = (relativeDifferences ** 2.).mean() ** 0.5;
-            normCharacter = '2';
-        elif normType in ('inf', 'infinite', 'infinity'):
-            norm = relativeDifferences.max();
-            normCharacter = '∞';
+        boilingProcessState = None;
+    else:
+        assemblyCalculations = [AssemblyBoilingCalculation(self, transportOutputFile, steam, assemblyAxialPowers, assemblyIndex) for assemblyIndex in range(len(assemblys))];
+    ###
+    # Report per-assembly convergence norms
+    ###
+    normType = self.GetParameter('thermalHydraulicConvergenceNormType');
+    tolerance = self.GetParameter('thermalHydraulicConvergenceTolerance');
+    ###
+    assemblyIndex2VoidFractionCalculation = {};
+    for assemblyIndex, (boilingCalculation, relativeDifferences) in enumerate(assemblyCalculations):
+        norm, normCharacter = ConvergenceNorm(relativeDifferences, normType);
         ###
         # If unconverged, signal transport file update
         ###
-        tolerance = self.GetParameter('thermalHydraulicConvergenceTolerance');
-        ###
         if norm > tolerance:
             PrintNow('> Coolant density {}-norm {:.1%} > {:.1%} ... assembly #{:d} needs updating for {}'.format(normCharacter, norm, tolerance, assemblyIndex, self.GetDepletionString()));
             ###
@@ -1328,15 +1218,252 @@ def RbwrThBoilingCalculation(self, transportOutputFile):
         else:
             PrintNow('> Coolant density {}-norm {:.1%} ≤ {:.1%} ... assembly #{:d} has converged for {}'.format(normCharacter, norm, tolerance, assemblyIndex, self.GetDepletionString()));
         ###
-        boilingCalculation = BoilingCalculation(cellNumbers = cellNumbers, cellNumber2PreviousMassDensity = cellNumber2PreviousMassDensity, cellNumber2MassDensity = cellNumber2MassDensity, axialPowers = axialPowers, axialQualitys = axialQualitys, axialVoidFractions = axialVoidFractions, finePositionCPRs = finePositionCPRs, minimumCriticalPowerRatio = minimumCriticalPowerRatio, minimumCriticalPowerRatioQuality = minimumCriticalPowerRatioQuality, minimumCriticalPowerRatioLocation = minimumCriticalPowerRatioLocation, criticalPowerRatioLimit = self.GetParameter('criticalPowerRatioLimit'), flowLengths = self.GetParameter('coolantFlowLengths'), axialPressureDrops = axialPressureDrops, transportOutputFile = transportOutputFile);
         if self.GetIsVerbose():
             PrintNow(boilingCalculation);
         ###
         assemblyIndex2VoidFractionCalculation[assemblyIndex] = boilingCalculation;
-        ###
-        assemblyIndex += 1;
-    ### # FIXME Multiple assemblies!?!
+    ###
+    # Merge per-assembly relative differences into a core-wide convergence norm
+    ###
+    if len(assemblyCalculations) > 1:
+        norm, normCharacter = ConvergenceNorm(Concatenate([relativeDifferences for boilingCalculation, relativeDifferences in assemblyCalculations]), normType);
+        PrintNow('> Coolant density {}-norm {:.1%} {} {:.1%} over {:d} assemblies for {}'.format(normCharacter, norm, '>' if norm > tolerance else '≤', tolerance, len(assemblyCalculations), self.GetDepletionString()));
+    ###
     return assemblyIndex2VoidFractionCalculation;
+###
+# Assembly axial zone powers
+###
+def AssemblyAxialPowers(cellNumber2ThermalPower, assemblys):
+    '''Return axial zone powers of each assembly, sharing powers of cells outside every assembly among all axial zones of the core.''';
+    ###
+    # Build axial power lists;
+    # Coolant is heated by fuels AND by cools
+    ###
+    assemblyAxialPowers = [[sum(cellNumber2ThermalPower[fuel] for fuels in fuels2Cools for fuel in fuels if fuel not in fuels2Cools[fuels]) + sum(cellNumber2ThermalPower[cool] for cools in fuels2Cools.values() for cool in cools) for fuels2Cools in assembly] for assembly in assemblys];
+    ###
+    # Distribute missing powers;
+    # Cells are missing only if they belong to no assembly
+    ###
+    allFuels = {fuel for assembly in assemblys for fuels2Cools in assembly for fuels in fuels2Cools for fuel in fuels};
+    allCools = {cool for assembly in assemblys for fuels2Cools in assembly for cools in fuels2Cools.values() for cool in cools};
+    missingCellNumbers = set(cellNumber2ThermalPower.keys()) - (allFuels | allCools);
+    if missingCellNumbers:
+        missingPower = sum(cellNumber2ThermalPower[cellNumber] for cellNumber in missingCellNumbers);
+        axialZones = sum(len(assembly) for assembly in assemblys);
+        PrintNow('> Distributing {:.0f} Wth from cell #\'s {:s} among {:d} cells in {:d} assemblies'.format(missingPower, ' '.join(str(missingCellNumber) for missingCellNumber in missingCellNumbers), axialZones, len(assemblys)));
+        missingPower /= axialZones;
+        assemblyAxialPowers = [[axialPower + missingPower for axialPower in axialPowers] for axialPowers in assemblyAxialPowers];
+    ###
+    return assemblyAxialPowers;
+###
+# Single-assembly boiling calculation
+###
+def AssemblyBoilingCalculation(self, transportOutputFile, steam, assemblyAxialPowers, assemblyIndex):
+    '''Return boiling calculation and coolant density relative differences of an assembly.''';
+    assembly = self.GetParameter('assemblyFuelsToCools')[assemblyIndex];
+    ###
+    # Extract original water densities
+    ###
+    cellNumbers = [cool for fuels2Cools in assembly for cools in fuels2Cools.values() for cool in cools];
+    cellNumber2PreviousMassDensity = {cellNumber : transportOutputFile.FindCell(cellNumber).GetMassDensity() for cellNumber in cellNumbers + self.GetParameter('coolantBypassCells')};
+    ###
+    # Axial zone powers
+    ###
+    axialZones = len(assembly);
+    axialPowers = assemblyAxialPowers[assemblyIndex];
+    ###
+    # Slice axial power array;
+    ###
+    zoneSlices = 500;
+    axialPowers = Array([axialPower / zoneSlices for axialPower in axialPowers for index in range(zoneSlices)]);
+    ###
+    # Convert axial powers Wth -> kWth
+    ###
+    axialPowers /= 1e3;
+    ###
+    # Initialize axial quality, void fraction, and density
+    ###
+    axialQualitys = Zeros(axialPowers.shape);
+    axialVoidFractions = Zeros(axialPowers.shape);
+    axialMassDensitys = Zeros(axialPowers.shape);
+    ###
+    # Determine the locations of the onset of boiling and end of heating
+    ###
+    onsetIndex = NonZero(axialPowers.cumsum() / steam.massFlowRate >= (steam.enthalpyLiquid - steam.enthalpyInlet))[0][0];
+    ###
+    for endIndex in range(len(assembly)):
+        fuels2Cools = assembly[-(endIndex + 1)];
+        if set(next(fuels for fuels in fuels2Cools)) != set(next(cools for cools in fuels2Cools.values())):
+            break;
+        endIndex = None;
+    ###
+    if endIndex is None:
+        endIndex = 0;
+    endIndex = (axialZones - endIndex) * zoneSlices;
+    ###
+    onePhaseSlice = slice(0, onsetIndex);
+    twoPhaseSlice = slice(onsetIndex, axialZones * zoneSlices);
+    ###
+    # Calculate axial qualities
+    ###
+    latentHeat = steam.enthalpyVapor - steam.enthalpyLiquid;
+    axialQualitys[twoPhaseSlice] = Array([axialPowers[twoPhaseSlice] / steam.massFlowRate / latentHeat]).cumsum();
+    ###
+    # Calculate axial void fractions
+    ###
+    voidFractionCorrelation = self.GetParameter('voidFractionCorrelation');
+    ###
+    if voidFractionCorrelation in ('bestion', ):
+        VoidFractionCorrelation = VoidFractionBestion;
+    elif voidFractionCorrelation in ('lpg', 'bestest', 'liao'):
+        VoidFractionCorrelation = VoidFractionLPG;
+    elif voidFractionCorrelation in ('relap', ):
+        VoidFractionCorrelation = VoidFractionRELAP;
+    elif voidFractionCorrelation in ('hom', 'homogeneous'):
+        VoidFractionCorrelation = VoidFractionHomogeneous;
+    elif voidFractionCorrelation in ('zivi', ):
+        VoidFractionCorrelation = VoidFractionZivi;
+    elif voidFractionCorrelation in ('wallis', ):
+        VoidFractionCorrelation = VoidFractionWallis;
+    elif voidFractionCorrelation in ('lm', 'lockhart', 'martinelli'):
+        VoidFractionCorrelation = VoidFractionLM;
+    elif voidFractionCorrelation in ('thom', ):
+        VoidFractionCorrelation = VoidFractionThom;
+    elif voidFractionCorrelation in ('baroczy', ):
+        VoidFractionCorrelation = VoidFractionBaroczy;
+    else:
+        raise ValueError('Void fraction correlation `{}\' is unrecognized'.format(voidFractionCorrelation));
+    axialVoidFractions[twoPhaseSlice] = VoidFractionCorrelation(steam, axialQualitys[twoPhaseSlice]);
+    ###
+    # Calculate axial mass densitys
+    # Linearly interpolate density until boiling onset
+    ###
+    axialMassDensitys[onePhaseSlice] = steam.densityInlet + Array([(index / onsetIndex) * (steam.densityLiquid - steam.densityInlet) for index in range(onsetIndex)]);
+    axialMassDensitys[twoPhaseSlice] = axialVoidFractions[twoPhaseSlice] * steam.densityVapor + (1 - axialVoidFractions[twoPhaseSlice]) * steam.densityLiquid;
+    ###
+    # Construct slice flow lengths
+    ###
+    flowLengths = [flowLength / zoneSlices for flowLength in self.GetParameter('coolantFlowLengths') for index in range(zoneSlices)];
+    ###
+    # Slice inlet positions, accumulated once rather than per slice
+    ###
+    flowPositions = Concatenate(([0.], Array(flowLengths).cumsum()[ : -1]));
+    ###
+    # Calculate critical quality and critical power ratio
+    ###
+    criticalPowerRatioCorrelation = self.GetParameter('criticalPowerRatioCorrelation');
+    ###
+    if criticalPowerRatioCorrelation in ('m-cise', ):
+        CriticalPowerRatioCorrelation = CriticalPowerRatioMITCISE4;
+    elif criticalPowerRatioCorrelation in ('h-cise', ):
+        CriticalPowerRatioCorrelation = CriticalPowerRatioHitachiCISE4;
+    else:
+        raise ValueError('Critical power ratio correlation `{}\' is unrecognized'.format(criticalPowerRatioCorrelation));
+    axialCriticalQualitys, axialCriticalPowerRatios = CriticalPowerRatioCorrelation(steam, axialPowers, flowLengths, endIndex);
+    ###
+    # Determine the minimum critical power ratio, its quality, and its location
+    ###
+    from numpy import nanargmin as NanArgMin;
+    ###
+    CPR = Array([element for element in axialCriticalPowerRatios]);
+    CPR[NonZero(CPR == 0)] = None;
+    ###
+    # Find initial CPR peak to ignore
+    ###
+    for peakIndex in range(len(CPR) - 1):
+        if CPR[peakIndex + 1] < CPR[peakIndex]:
+            break;
+        ###
+        peakIndex = None;
+    if peakIndex is None:
+        ###
+        # If the CPR monotonically increases, fall back onto an a priori index
+        ###
+        Warning('There is no valid MCPR ... the CPR at the fallback location is chosen instead');
+        peakIndex = self.GetParameter('criticalPowerRatioFallbackIndex') * zoneSlices;
+    ###
+    troughIndex = peakIndex + NanArgMin(CPR[peakIndex : ]);
+    ###
+    minimumCriticalPowerRatio = axialCriticalPowerRatios[troughIndex];
+    minimumCriticalPowerRatioLocation = flowPositions[troughIndex];
+    minimumCriticalPowerRatioQuality = axialCriticalQualitys[troughIndex];
+    ###
+    # Calculate pressure drop
+    ###
+    pressureDropCorrelation = self.GetParameter('pressureDropCorrelation');
+    ###
+    if pressureDropCorrelation in ('epri', 'reddy', 'vipre', 'cobra'):
+        PressureDropCorrelation = PressureDropEPRI;
+    else:
+        raise ValueError('Pressure drop correlation `{}\' is unrecognized'.format(pressureDropCorrelation));
+    axialPressureDrops = PressureDropCorrelation(steam, axialQualitys, axialVoidFractions, axialMassDensitys, flowLengths);
+    ###
+    # Collapse axial power, quality, void fraction, density, and pressure drop arrays
+    ###
+    def Collapse(array, indexs, jndexs):
+        return Array([array[(index) * jndexs : (index + 1) * jndexs].mean() for index in range(indexs)]);
+    ###
+    axialPowers = Collapse(axialPowers, axialZones, zoneSlices) * zoneSlices;
+    axialQualitys = Collapse(axialQualitys, axialZones, zoneSlices);
+    axialVoidFractions = Collapse(axialVoidFractions, axialZones, zoneSlices);
+    axialMassDensitys = Collapse(axialMassDensitys, axialZones, zoneSlices);
+    axialPressureDrops = Collapse(axialPressureDrops, axialZones, zoneSlices);
+    finePositionCPRs = [(flowPositions[index], axialCriticalPowerRatios[index]) for index in range(len(axialCriticalPowerRatios))];
+    ###
+    # Convert axial power kWth -> Wth;
+    # Convert density kg/m³ -> g/cc;
+    # Convert pressure drop Pa -> MPa
+    ###
+    axialPowers *= 1e3;
+    axialMassDensitys /= 1e3;
+    axialPressureDrops /= 1e6;
+    ###
+    # Cell # -> mass density
+    ### # FIXME Fix for multiple coolant cells
+    cellNumber2MassDensity = {cellNumbers[index] : axialMassDensitys[index] for index in range(len(cellNumbers))};
+    ###
+    # Average previous and current water density estimates
+    ###
+    theta = self.GetParameter('coolantDensityDampingCoefficient');
+    for cellNumber, massDensity in cellNumber2MassDensity.items():
+        cellNumber2MassDensity[cellNumber] = theta * massDensity + (1 - theta) * cellNumber2PreviousMassDensity[cellNumber];
+    ###
+    # Set bypass density to that of the inlet
+    ###
+    inletMassDensity = cellNumber2MassDensity[next(iter(cellNumbers))];
+    cellNumber2MassDensity.update({cellNumber : inletMassDensity for cellNumber in self.GetParameter('coolantBypassCells')});
+    ###
+    # Relative differences for the convergence norm
+    ###
+    relativeDifferences = Array([abs(cellNumber2MassDensity[cellNumber] / cellNumber2PreviousMassDensity[cellNumber] - 1) for cellNumber in cellNumbers + self.GetParameter('coolantBypassCells')]);
+    ###
+    boilingCalculation = BoilingCalculation(cellNumbers = cellNumbers, cellNumber2PreviousMassDensity = cellNumber2PreviousMassDensity, cellNumber2MassDensity = cellNumber2MassDensity, axialPowers = axialPowers, axialQualitys = axialQualitys, axialVoidFractions = axialVoidFractions, finePositionCPRs = finePositionCPRs, minimumCriticalPowerRatio = minimumCriticalPowerRatio, minimumCriticalPowerRatioQuality = minimumCriticalPowerRatioQuality, minimumCriticalPowerRatioLocation = minimumCriticalPowerRatioLocation, criticalPowerRatioLimit = self.GetParameter('criticalPowerRatioLimit'), flowLengths = self.GetParameter('coolantFlowLengths'), axialPressureDrops = axialPressureDrops, transportOutputFile = transportOutputFile);
+    ###
+    return boilingCalculation, relativeDifferences;
+###
+# Single-assembly boiling calculation within a forked worker process
+###
+def BoilingProcess(assemblyIndex):
+    '''Return boiling calculation and coolant density relative differences of an assembly within a forked worker process.''';
+    return AssemblyBoilingCalculation(*boilingProcessState, assemblyIndex);
+###
+# Coolant density convergence norm
+###
+def ConvergenceNorm(relativeDifferences, normType):
+    '''Return convergence norm of relative differences and its character.''';
+    if normType in ('1', 'one'):
+        norm = relativeDifferences.mean();
+        normCharacter = '1';
+    elif normType in ('2', 'two'):
+        norm = (relativeDifferences ** 2.).mean() ** 0.5;
+        normCharacter = '2';
+    elif normType in ('inf', 'infinite', 'infinity'):
+        norm = relativeDifferences.max();
+        normCharacter = '∞';
+    else:
+        raise ValueError('Convergence norm type `{}\' is unrecognized'.format(normType));
+    ###
+    return norm, normCharacter;
 
 ###
 ### Replacement for DepletionCalculation methods
@@ -5,7 +5,8 @@
 ###         Implementación de la IAPWS-IF97 Steam Tables               ###
 ##########################################################################
 
-from math import sqrt, log, exp, tan, atan, acos
+from math import tan, atan, acos
+from numpy import any as np_any, asarray, broadcast_arrays, clip, exp, full, log, maximum, nan, sqrt, where
 from scipy.optimize import fsolve
 
 #Boundary Region1-Region2
@@ -74,10 +75,7 @@ def _PSat_T(T):
     >>> "%.8f" % _PSat_T(500)
     '2.63889776'
     """
-    if T<273.15:
-        T=273.15
-    elif T>Tc:
-        T=Tc
+    T=clip(T, 273.15, Tc)
     n=[0, 0.11670521452767E+04, -0.72421316703206E+06, -0.17073846940092E+02, 0.12020824702470E+05, -0.32325550322333E+07, 0.14915108613530E+02, -0.48232657361591E+04, 0.40511340542057E+06, -0.23855557567849E+00, 0.65017534844798E+03]
     tita=T+n[9]/(T-n[10])
     A=tita**2+n[1]*tita+n[2]
@@ -91,10 +89,7 @@ def _TSat_P(P):
     >>> "%.6f" % _TSat_P(10)
     '584.149488'
     """
-    if P<611.212677/1e6:
-        P=611.212677/1e6
-    elif P>22.064:
-        P=22.064
+    P=clip(P, 611.212677/1e6, 22.064)
     n=[0, 0.11670521452767E+04, -0.72421316703206E+06, -0.17073846940092E+02, 0.12020824702470E+05, -0.32325550322333E+07, 0.14915108613530E+02, -0.48232657361591E+04, 0.40511340542057E+06, -0.23855557567849E+00, 0.65017534844798E+03]
     beta=P**0.25
     E=beta**2+n[3]*beta+n[6]
@@ -495,17 +490,9 @@ def _Backward2c_T_Ph(P, h):
 def _Backward2_T_Ph(P, h):
     """Backward equation for region 2, T=f(P,h)"""
     Tsat=_TSat_P(P)
-    if P<=4:
-        T=_Backward2a_T_Ph(P, h)
-    elif 4<P<=6.546699678:
-        T=_Backward2b_T_Ph(P, h)
-    else:
-        hf=_hbc_P(P)
-        if h>=hf:
-            T=_Backward2b_T_Ph(P, h)
-        else:
-            T=_Backward2c_T_Ph(P, h)
-    return max(Tsat, T)
+    hf=_hbc_P(maximum(P, 6.546699678))
+    T=where(P<=4, _Backward2a_T_Ph(P, h), where((P<=6.546699678)|(h>=hf), _Backward2b_T_Ph(P, h), _Backward2c_T_Ph(P, h)))
+    return maximum(Tsat, T)
     
 
 def _Backward2a_T_Ps(P, s):
@@ -1558,7 +1545,7 @@ def _Viscosity(rho, T):
     for i in range(21):
         suma+=nr[i]*(Dr-1)**I[i]*(1/Tr-1)**J[i]
     fi1=exp(Dr*suma)
-    if 645.91<T<650.77 and 245.8<rho<405.3:
+    if np_any((645.91<T)&(T<650.77)&(245.8<rho)&(rho<405.3)):
         xu=0.068
         qc=1.9
         qd=1.1
@@ -1611,10 +1598,7 @@ def _ThCond(rho, T):
     n2=[0, 0.701309e-1, 0.118520e-1, 0.642857, 0.169937e-2, -0.102000e1, -0.411717e1, -0.617937e1, 0.822994e-1, 0.100932e2, 0.308976e-2]
     DT=abs(Tr-1)+n2[10]
     A=2+n2[8]/DT**0.6
-    if Tr<1:
-        B=n2[9]/DT**0.6
-    else:
-        B=1/DT
+    B=where(Tr<1, n2[9]/DT**0.6, 1/DT)
     L2=(n2[1]/Tr**10+n2[2])*d**1.8*exp(n2[3]*(1-d**2.8)) + n2[4]*B*d**A*exp(A/(1+A)*(1-d**(1+A)))+n2[5]*exp(n2[6]*Tr**1.5+n2[7]*d**-5)
     
     return L0+L1+L2
@@ -2142,6 +2126,132 @@ class IAPWS97():
         else:
             raise NotImplementedError("Not implemented for region 4")
     
+#Vectorized evaluation
+def _Bound_TP_array(T, P):
+    """Region definition for arrays of T and P, 0 where not vectorized (regions 3 and 5)"""
+    Tsat=_TSat_P(P)
+    T_b23=_t_P(maximum(P, Ps_623))
+    low=(Pmin<=P)&(P<=Ps_623)
+    high=(Ps_623<P)&(P<=100)
+    region=where(low&(273.15<=T)&(T<=Tsat) | high&(273.15<=T)&(T<=623.15), 1, 0)
+    region=where(low&(Tsat<T)&(T<=1073.15) | high&(T_b23<=T)&(T<=1073.15), 2, region)
+    return region
+
+def _Bound_Ph_array(P, h):
+    """Region definition for arrays of P and h, 0 where not vectorized (regions 3 and 5)"""
+    Pl=clip(P, Pmin, Ps_623)
+    Tsat=_TSat_P(Pl)
+    h14=_Region1(Tsat, Pl)["h"]
+    h24=_Region2(Tsat, Pl)["h"]
+    h25=_Region2(1073.15, Pl)["h"]
+    hmin=_Region1(273.15, P)["h"]
+    h13=_Region1(623.15, maximum(P, Ps_623))["h"]
+    low=(Pmin<=P)&(P<=Ps_623)
+    high=(Ps_623<P)&(P<=100)
+    region=where(low&(hmin<=h)&(h<=h14) | high&(hmin<=h)&(h<=h13), 1, 0)
+    region=where(low&(h14<h)&(h<h24), 4, region)
+    region=where(low&(h24<=h)&(h<=h25), 2, region)
+    return region
+
+def _Properties_array(propiedades, properties):
+    """Requested properties of a region's states, transport properties only when requested"""
+    T=propiedades["T"]
+    P=propiedades["P"]
+    v=propiedades["v"]
+    rho=1/v
+    valores={"T": T, "P": P, "v": v, "rho": rho, "h": propiedades["h"], "u": propiedades["h"]-P*1000*v, "s": propiedades["s"], "region": propiedades["region"], "x": propiedades["x"]}
+    if propiedades["region"]!=4:
+        for propiedad in ("cp", "cv", "w", "alfav", "kt"):
+            valores[propiedad]=propiedades[propiedad]
+        if {"mu", "nu", "Pr"}&set(properties):
+            valores["mu"]=_Viscosity(rho, T)
+            valores["nu"]=valores["mu"]/rho
+        if {"k", "Pr", "alfa"}&set(properties):
+            valores["k"]=_ThCond(rho, T)
+            valores["alfa"]=valores["k"]/1000/rho/valores["cp"]
+        if "Pr" in properties:
+            valores["Pr"]=valores["mu"]*valores["cp"]/valores["k"]*1000
+    else:
+        valores["sigma"]=_Tension(T)
+    return {propiedad: valores[propiedad] for propiedad in properties if propiedad in valores}
+
+def IAPWS97_array(P, T=None, h=None, x=None, properties=("T", "rho", "h")):
+    """Evaluate the Industrial Formulation IAPWS-IF97 for arrays of states
+
+    Incoming properties::
+    P   -   Pressure, MPa, with one of
+    T   -   Temperature, K
+    h   -   Specific enthalpy, kJ/kg
+    x   -   Quality
+
+    Returns a dictionary of arrays, broadcast from the incoming ones, for the
+    requested properties, named as the IAPWS97 attributes; properties
+    undefined for a state (e.g. viscosity of a two-phases mixture) are nan.
+    Regions 1, 2 and 4 are evaluated vectorized, with the backward equations
+    refined by Newton iterations instead of fsolve; states in regions 3 and 5
+    fall back to IAPWS97.
+
+    >>> st=IAPWS97_array([7, 7, 7], T=[550, 600, 700], properties=("rho", "h", "mu"))
+    >>> ["%.6f" % rho for rho in st["rho"]]
+    ['757.208048', '30.487262', '23.655562']
+    >>> ["%.6f" % T for T in IAPWS97_array([7, 7], h=[1000, 3000], properties=("T", ))["T"]]
+    ['505.072980', '617.722506']
+    >>> ["%.7f" % x for x in IAPWS97_array(7, h=[1267.4372139, 2000], properties=("x", ))["x"]]
+    ['0.0000000', '0.4867100']
+    """
+    if T is not None:
+        P, y=broadcast_arrays(asarray(P, dtype=float), asarray(T, dtype=float))
+        region=_Bound_TP_array(y, P)
+    elif h is not None:
+        P, y=broadcast_arrays(asarray(P, dtype=float), asarray(h, dtype=float))
+        region=_Bound_Ph_array(P, y)
+    elif x is not None:
+        P, y=broadcast_arrays(asarray(P, dtype=float), asarray(x, dtype=float))
+        if not ((Pt/1e6<=P)&(P<=Pc)&(0<=y)&(y<=1)).all():
+            raise NotImplementedError("Incoming out of bound")
+        region=full(P.shape, 4)
+    else:
+        raise NotImplementedError("Bad incoming variables")
+
+    valores={propiedad: full(P.shape, nan) for propiedad in properties}
+    for reg in (1, 2, 4):
+        mask=region==reg
+        if not mask.any():
+            continue
+        Pm=P[mask]
+        ym=y[mask]
+        if T is not None:
+            propiedades=[_Region1, _Region2][reg-1](ym, Pm)
+        elif h is not None and reg!=4:
+            Region, Backward=[(_Region1, _Backward1_T_Ph), (_Region2, _Backward2_T_Ph)][reg-1]
+            Tm=Backward(Pm, ym)
+            for i in range(50):
+                propiedades=Region(Tm, Pm)
+                dT=(propiedades["h"]-ym)/propiedades["cp"]
+                Tm=Tm-dT
+                if abs(dT).max()<1e-10*Tm.max():
+                    break
+            propiedades=Region(Tm, Pm)
+        elif h is not None:
+            Tsat=_TSat_P(Pm)
+            h1=_Region1(Tsat, Pm)["h"]
+            h2=_Region2(Tsat, Pm)["h"]
+            propiedades=_Region4(Pm, (ym-h1)/(h2-h1))
+        else:
+            propiedades=_Region4(Pm, ym)
+        for propiedad, valor in _Properties_array(propiedades, properties).items():
+            valores[propiedad][mask]=valor
+
+    #Regions 3 and 5, and out of bound states, through the scalar formulation
+    for index in zip(*(region==0).nonzero()):
+        st=IAPWS97(P=P[index], **{["h", "T"][T is not None]: y[index]})
+        for propiedad in properties:
+            valor=getattr(st, propiedad)
+            if valor is None:
+                valor=nan
+            valores[propiedad][index]=asarray(valor, dtype=float).item()
+    return valores
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
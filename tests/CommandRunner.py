@@ -0,0 +1,78 @@
+#! /usr/bin/env python3
+
+###
+### Import
+###
+
+from MocDown import * ;
+
+###
+### Constants
+###
+
+###
+# Test case:
+# One retry, so that every command has two attempts
+###
+retries = 1;
+
+###
+### Functions
+###
+
+###
+# Run a command, counting its attempts and clean ups
+###
+def RunCounted(command, timeout = None):
+    '''Return if a command raised, its output or error message, and its numbers of attempts and clean ups.''';
+    tmpDir = MakeTemporaryDirectory(display = False);
+    cleanUps = [];
+    try:
+        ###
+        # Each attempt appends a line to a file
+        ###
+        try:
+            output = CommandRunner(retries = retries).Run('echo attempt >> {}attempts ; {}'.format(tmpDir, command), timeout = timeout, cleanUp = lambda: cleanUps.append(True));
+            isRaised = False;
+        except ChildProcessError as error:
+            output = str(error);
+            isRaised = True;
+        ###
+        attempts = ReadFile('{}attempts'.format(tmpDir), display = False).count('attempt');
+    finally:
+        RemoveTree(tmpDir, display = False);
+    ###
+    return isRaised, output, attempts, len(cleanUps);
+###
+# Check that failing commands raise once every attempt is used up
+###
+def CompareCommandRuns():
+    '''Return if failing and timed-out commands raise after every attempt, and succeeding commands return their output.''';
+    results = [];
+    ###
+    # Command which always fails
+    ###
+    isRaised, output, attempts, cleanUps = RunCounted('false');
+    results.append(isRaised and 'exited with return code 1 (attempt 2 of 2)' in output and (1 + retries, retries) == (attempts, cleanUps));
+    ###
+    # Command which always times out
+    ###
+    isRaised, output, attempts, cleanUps = RunCounted('sleep 10', timeout = 0.2);
+    results.append(isRaised and 'timed out after 0.2 seconds (attempt 2 of 2)' in output and (1 + retries, retries) == (attempts, cleanUps));
+    ###
+    # Command which succeeds
+    ###
+    results.append((False, 'done\n', 1, 0) == RunCounted('echo done'));
+    ###
+    return results;
+
+###
+### Script
+###
+
+###
+# main()
+###
+for result in CompareCommandRuns():
+    if result:
+        print('PASS');
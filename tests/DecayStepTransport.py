@@ -0,0 +1,67 @@
+#! /usr/bin/env python3
+
+###
+### Import
+###
+
+from MocDown import * ;
+
+###
+### Constants
+###
+
+###
+# Test case
+###
+transportFileName = '../examples/sphere/inp1';
+
+###
+### Functions
+###
+
+###
+# Build a depletion calculation stand-in at a decay or pickle-transmute step
+###
+def DepletionCalculationStandIn(tmpDir, isDecayStep, isPickleTransmute):
+    '''Return a depletion calculation whose current step is not transported, with its transport input in a temporary directory.''';
+    depletionCalculation = DepletionCalculation.__new__(DepletionCalculation);
+    depletionCalculation.isPickleTransmute = isPickleTransmute;
+    depletionCalculation.GetIsDecayStep = lambda: isDecayStep;
+    depletionCalculation.GetDisplayFiles = lambda: False;
+    depletionCalculation.GetFileName = lambda extension = None, withoutTH = False: '{}inp1{}'.format(tmpDir, ['', '.{}'.format(extension)][extension is not None]);
+    depletionCalculation.GetParameter = {'mcnpSourceFileName' : '{}source'.format(tmpDir)}.__getitem__;
+    ###
+    return depletionCalculation;
+###
+# Check that transport files of steps without transport are closed as those of transport steps
+###
+def CompareDecayStepTransport():
+    '''Return if transport files of decay and pickle-transmute steps are read and closed after pickling.''';
+    results = [];
+    for isDecayStep, isPickleTransmute in ((True, False), (False, True)):
+        tmpDir = MakeTemporaryDirectory(display = False);
+        try:
+            CopyFile(transportFileName, '{}inp1.i'.format(tmpDir), display = False);
+            depletionCalculation = DepletionCalculationStandIn(tmpDir, isDecayStep, isPickleTransmute);
+            ###
+            # Transport returns the input file, which Deplete closes once the step is pickled
+            ###
+            transportFile = depletionCalculation.Transport();
+            transportFile.Close();
+            ###
+            results.append(isinstance(transportFile, McnpInputFile) and 1 in transportFile.GetCellNumber2Cell());
+        finally:
+            RemoveTree(tmpDir, display = False);
+    ###
+    return results;
+
+###
+### Script
+###
+
+###
+# main()
+###
+for result in CompareDecayStepTransport():
+    if result:
+        print('PASS');
@@ -0,0 +1,83 @@
+#! /usr/bin/env python3
+
+###
+### Import
+###
+
+from MocDown import * ;
+
+###
+### Constants
+###
+
+###
+# Test case:
+# Two burn cells over three depletion steps;
+# Cell #2 holds no inventory at the first step, and cell #1 holds zero moles of Pu-239 at the first step
+###
+cellNumber2Zam2Moles = {
+    1 : [{922350 : 1.0, 922380 : 9.0, 942390 : 0.0}, {922350 : 0.9, 922380 : 8.9, 942390 : 0.1}, {922350 : 0.8, 922380 : 8.8, 942390 : 0.2}],
+    2 : [{}, {922350 : 2.0, 922380 : 18.0}, {922350 : 1.8, 922380 : 17.8, 541350 : 1e-6}],
+};
+multiplicationFactors = [1.10, None, 1.05];
+
+###
+### Functions
+###
+
+###
+# Build a depletion calculation pickle stand-in
+###
+def DepletionCalculationPickleStandIn():
+    '''Return an object with the attributes of a depletion calculation pickle.''';
+    depletionCalculationPickle = Class();
+    depletionCalculationPickle.cellNumber2Zam2Moles = cellNumber2Zam2Moles;
+    depletionCalculationPickle.cellNumber2DecayPowers = {cellNumber : [0.] * 3 for cellNumber in cellNumber2Zam2Moles};
+    depletionCalculationPickle.cellNumber2Volume = {cellNumber : 1. for cellNumber in cellNumber2Zam2Moles};
+    depletionCalculationPickle.multiplicationFactors = multiplicationFactors;
+    for attribute in ('mevPerFissions', 'multiplicationFactorSigmas', 'neutronsPerFissions', 'sourceRates'):
+        setattr(depletionCalculationPickle, attribute, [None] * 3);
+    ###
+    return depletionCalculationPickle;
+###
+# Check that a history saved to file slices as the one in memory
+###
+def CompareRoundTrip():
+    '''Return if a saved and loaded depletion history slices as the one in memory, and as the pickled inventories.''';
+    history = DepletionHistory(DepletionCalculationPickleStandIn());
+    ###
+    tmpDir = MakeTemporaryDirectory(display = False);
+    try:
+        history.Save(baseName = '{}history'.format(tmpDir), display = False);
+        loaded = DepletionHistory('{}history.npz'.format(tmpDir));
+        ###
+        results = [];
+        ###
+        # Isotope slices of a cell and step, absent isotopes holding NaN
+        ###
+        zams = [922350, 942390, 541350];
+        one, two = history.GetMoles([1, 2], [2], zams), loaded.GetMoles([1, 2], [2], zams);
+        results.append(one.shape == two.shape == (2, 1, 3) and ((one == two) | (IsNan(one) & IsNan(two))).all());
+        ###
+        # Isotope -> moles summed over cells, keeping zero moles but not absent isotopes
+        ###
+        results.append(all(loaded.GetZa2Moles(depletionStep) == {Zam2Za(zam) : sum(zam2Moles[depletionStep][zam] for zam2Moles in cellNumber2Zam2Moles.values() if zam in zam2Moles[depletionStep]) for zam in {zam for zam2Moles in cellNumber2Zam2Moles.values() for zam in zam2Moles[depletionStep]}} for depletionStep in range(3)));
+        ###
+        # Populated and transport steps
+        ###
+        results.append(loaded.GetCellNumberPopulatedSteps(2).tolist() == [1, 2] and loaded.GetTransportSteps().tolist() == [0, 2]);
+    finally:
+        RemoveTree(tmpDir, display = False);
+    ###
+    return results;
+
+###
+### Script
+###
+
+###
+# main()
+###
+for result in CompareRoundTrip():
+    if result:
+        print('PASS');
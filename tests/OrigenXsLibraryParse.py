@@ -0,0 +1,111 @@
+#! /usr/bin/env python3
+
+###
+### Import
+###
+
+from MocDown import * ;
+from timeit import repeat as TimeRepeat;
+
+###
+### Constants
+###
+
+###
+# Test case:
+# No ORIGEN libraries ship with MocDown, so a synthetic cross-section library is written in ORIGEN2 format;
+# Six sub-libraries, each with a title line, isotopes, and a terminator
+###
+libs = (201, 202, 203, 204, 205, 206);
+numberOfIsotopes = 700;
+###
+# Timing repeats, of which the best is reported
+###
+timingRepeats = 5;
+
+###
+### Functions
+###
+
+###
+# Per-lib rescanning cross-section library parser, as it was before parsing in one pass
+###
+def ParseOrigenXsLibraryRescan(raw):
+    '''Return lib -> isotopes, lib -> isotope -> metastable fractions, lines, and isotope -> (lib, line index) slots of an ORIGEN cross-section library, rescanning it for every lib.''';
+    def HelperExcited(*args):
+        return SafeDivide(args[2], args[0] + args[2]), SafeDivide(args[3], args[1] + args[3]);
+    ###
+    libs = set(int(float(lib)) for lib in ReCompile(r'^ *(\d{1,3}) +', 2 | 8).findall(raw));
+    ###
+    lib2Zams = {};
+    lib2Zam2Excite = {};
+    for lib in libs:
+        lib2Zams[lib] = [];
+        lib2Zam2Excite[lib] = {};
+        for match in ReCompile(r'^ *{} +(\d{{5,7}}) +([\d\.e+\-]+) +([\d\.e+\-]+) +[\d\.e+\-]+ +[\d\.e+\-]+ +([\d\.e+\-]+) +([\d\.e+\-]+) + [\d\.e+\-]+ *$'.format(lib), 2 | 8).finditer(raw):
+            zam = int(float(match.group(1)));
+            lib2Zams[lib].append(zam);
+            lib2Zam2Excite[lib][zam] = HelperExcited(*(float(group.replace(' ', '')) for group in match.groups()[1 : ]));
+    ###
+    reXs = ReCompile(r'^ *(\d+) +(\d+)');
+    xsLibraryLines = raw.split('\n');
+    zam2XsLibrarySlots = {};
+    for slot, line in enumerate(xsLibraryLines):
+        match = reXs.search(line);
+        if match is None:
+            continue;
+        ###
+        lib, zam = (int(float(group)) for group in match.groups());
+        try:
+            zam2XsLibrarySlots[zam].append((lib, slot));
+        except KeyError:
+            zam2XsLibrarySlots[zam] = [(lib, slot)];
+    ###
+    return lib2Zams, lib2Zam2Excite, xsLibraryLines, zam2XsLibrarySlots;
+###
+# Write synthetic cross-section library
+###
+def SyntheticXsLibrary():
+    '''Return text of a synthetic ORIGEN2 cross-section library.''';
+    lines = [];
+    for lib in libs:
+        lines.append('{:5d}    SYNTHETIC TITLE LINE FOR LIB {:d}'.format(lib, lib));
+        for index in range(numberOfIsotopes):
+            zam = 10010 + 10 * (index * 37 % numberOfIsotopes) + 10000 * (lib % 3);
+            sigmas = ' '.join('{:9.3E}'.format((index * lib * (column + 1) % 997 + 1) / 997.) for column in range(6));
+            lines.append('{:4d} {:7d} {}  {:9.3E}'.format(lib, zam, sigmas, -1.));
+        lines.append('  -1');
+    ###
+    return '\n'.join(lines) + '\n';
+###
+# Check that the one-pass parser reproduces the rescanning parser, and time both
+###
+def CompareParsers():
+    '''Return if the one-pass and rescanning cross-section library parsers agree.''';
+    raw = SyntheticXsLibrary();
+    ###
+    lib2Zams, lib2Zam2Excite, xsLibraryLines, zam2XsLibrarySlots = ParseOrigenXsLibrary(raw);
+    rescanLib2Zams, rescanLib2Zam2Excite, rescanXsLibraryLines, rescanZam2XsLibrarySlots = ParseOrigenXsLibraryRescan(raw);
+    ###
+    results = [];
+    results.append({lib : set(zams) for lib, zams in rescanLib2Zams.items()} == lib2Zams);
+    results.append(rescanLib2Zam2Excite == lib2Zam2Excite and all(list(rescanLib2Zam2Excite[lib]) == list(lib2Zam2Excite[lib]) for lib in libs));
+    results.append(rescanXsLibraryLines == xsLibraryLines and rescanZam2XsLibrarySlots == zam2XsLibrarySlots);
+    ###
+    # Best of several repeats
+    ###
+    rescanSeconds, onePassSeconds = (min(TimeRepeat(Partial(Parse, raw), number = 1, repeat = timingRepeats)) for Parse in (ParseOrigenXsLibraryRescan, ParseOrigenXsLibrary));
+    PrintNow('> Parsing {:d} lines: {:.1f} ms rescanning; {:.1f} ms in one pass ({:.1f}x)'.format(len(xsLibraryLines), 1e3 * rescanSeconds, 1e3 * onePassSeconds, rescanSeconds / onePassSeconds));
+    ###
+    return results;
+
+###
+### Script
+###
+
+###
+# main()
+###
+for result in CompareParsers():
+    if result:
+        print('PASS');
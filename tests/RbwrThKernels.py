@@ -0,0 +1,182 @@
+#! /usr/bin/env python3
+
+###
+### Import
+###
+
+from MocDown import * ;
+
+###
+### Constants
+###
+
+###
+# Test cases
+###
+mocDownInputFileName = '../examples/rbwrThAssembly/mocdown.inp';
+###
+# Relative tolerance between loop and cumulative-sum results
+###
+relativeTolerance = 1e-12;
+
+###
+### Functions
+###
+
+###
+# Loop MIT-modified CISE-4 critical power ratio correlation
+###
+def CriticalPowerRatioMITCISE4Loop(steam, axialPowers, flowLengths, endIndex):
+    '''Perform MIT-modified CISE-4 critical power ratio correlation, one spatial region at a time.''';
+    mdot = 0.95 * steam.massFlowRate;
+    G = 0.95 * steam.massFlux;
+    Dh = steam.heatedDiameter;
+    De = steam.hydraulicDiameter;
+    P = steam.pressure;
+    Pcrit = steam.criticalPressure;
+    hfg = steam.enthalpyVapor - steam.enthalpyLiquid;
+    dhsub = steam.enthalpyLiquid - steam.enthalpyInlet;
+    Pz = 1.25 * Array([axialPower for axialPower in axialPowers]);
+    dz = flowLengths;
+    ###
+    onsetIndex = NonZero(Pz.cumsum() / mdot >= dhsub)[0][0];
+    ###
+    b = 0.199 * (Pcrit / P - 1) ** 0.4 * G * De ** 1.2;
+    Gstar = 3375. * (1 - P / Pcrit) ** 3.;
+    if G <= Gstar:
+        a = (1 + (1 - P / Pcrit) ** -3. * 0.7 * G / 6750.) ** -1.;
+    else:
+        a = (1 - P / Pcrit) / (0.7 * G / 1000.) ** (1. / 3.);
+    ###
+    criticalQuality = Zeros(Pz.shape);
+    criticalPowerRatio = Zeros(Pz.shape);
+    boilingLength = 0;
+    thermalPower = sum(Pz[ : onsetIndex]);
+    for index in range(onsetIndex + 1, endIndex):
+        boilingLength += dz[index];
+        thermalPower += Pz[index];
+        ###
+        criticalQuality[index] = (De / Dh) * a / (1 + b / boilingLength);
+        criticalPowerRatio[index] = mdot * hfg * criticalQuality[index] / thermalPower;
+    ###
+    return criticalQuality, criticalPowerRatio;
+###
+# Loop generic two-phase pressure drop correlation
+###
+def PressureDropTwoPhaseLoop(steam, quality, voidFraction, massDensity, flowLengths, twoPhaseFrictionMultiplier):
+    '''Perform generic two-phase pressure drop correlation, one spatial region at a time.''';
+    x = quality;
+    alpha = voidFraction;
+    rhomix = massDensity;
+    dz = flowLengths;
+    phi2 = twoPhaseFrictionMultiplier;
+    g = steam.gravity;
+    G = steam.massFlux;
+    De = steam.hydraulicDiameter;
+    rhol = steam.densityLiquid;
+    rhov = steam.densityVapor;
+    mul = steam.dynamicViscosityLiquid;
+    ###
+    vm = Nan2Num(x ** 2. / rhov / alpha + (1 - x) ** 2. / rhov / (1 - alpha));
+    flo = 0.079 * (G * De / mul) ** -0.25;
+    ###
+    dP = Zeros(x.shape);
+    for index in range(1, len(x)):
+        dP[index] = dP[index - 1] + \
+                    G ** 2. * (vm[index] - vm[index - 1]) + \
+                    g * 0.5 * (dz[index - 1] + dz[index]) * 0.5 * (rhomix[index - 1] + rhomix[index]) + \
+                    2. * flo * G ** 2. / De / rhol * 0.5 * (dz[index - 1] + dz[index]) * 0.5 * (phi2[index - 1] + phi2[index]);
+    ###
+    return dP;
+###
+# Parse rbwrThAssembly parameters
+###
+def RbwrThAssemblyParameters():
+    '''Return RBWR-Th library and parameters of the rbwrThAssembly example.''';
+    arguments = Class();
+    arguments.isQuiet = arguments.isVerbose = False;
+    arguments.mocDownInputFileName = mocDownInputFileName;
+    ###
+    mocDownInputFile = MocDownInputFile(arguments);
+    ImportLibraries(mocDownInputFile);
+    mocDownInputFile.Populate();
+    ###
+    import RbwrTh;
+    ###
+    return RbwrTh, mocDownInputFile.GetParameters();
+###
+# Build rbwrThAssembly steam and chopped-parabola axial profiles
+###
+def RbwrThAssemblyProfiles(zoneSlices = 500):
+    '''Return steam, and sliced axial powers [kWth], flow lengths, qualities, void fractions, mass densities, and friction multipliers of the rbwrThAssembly example.''';
+    RbwrTh, parameters = RbwrThAssemblyParameters();
+    steam = RbwrTh.Steam(pressure = parameters['coolantInletPressure'], temperature = parameters['coolantInletTemperature'], massFlowRate = parameters['coolantMassFlowRate'], heatedDiameter = parameters['coolantHeatedDiameter'], hydraulicDiameter = parameters['coolantHydraulicDiameter'], flowArea = parameters['coolantFlowArea'], tableTolerance = parameters['steamTableTolerance']);
+    ###
+    # Chopped-parabola depletion power [Wth] over the heated zones, between the unheated lower plenum and upper riser
+    ###
+    flowLengths = parameters['coolantFlowLengths'];
+    heatedZones = len(flowLengths) - 2;
+    zonePowers = [0.] + [1.5e6 * parameters['depletionPower'] / heatedZones * (1 - ((index + 0.5) / heatedZones * 2 - 1) ** 2) for index in range(heatedZones)] + [0.];
+    axialPowers = Array([zonePower / zoneSlices / 1e3 for zonePower in zonePowers for index in range(zoneSlices)]);
+    flowLengths = [flowLength / zoneSlices for flowLength in flowLengths for index in range(zoneSlices)];
+    ###
+    # Qualities, void fractions, and mass densities past the onset of boiling
+    ###
+    onsetIndex = NonZero(axialPowers.cumsum() / steam.massFlowRate >= (steam.enthalpyLiquid - steam.enthalpyInlet))[0][0];
+    twoPhaseSlice = slice(onsetIndex, len(axialPowers));
+    qualitys = Zeros(axialPowers.shape);
+    voidFractions = Zeros(axialPowers.shape);
+    massDensitys = Zeros(axialPowers.shape) + steam.densityInlet;
+    qualitys[twoPhaseSlice] = axialPowers[twoPhaseSlice].cumsum() / steam.massFlowRate / (steam.enthalpyVapor - steam.enthalpyLiquid);
+    voidFractions[twoPhaseSlice] = RbwrTh.VoidFractionRELAP(steam, qualitys[twoPhaseSlice]);
+    massDensitys[twoPhaseSlice] = voidFractions[twoPhaseSlice] * steam.densityVapor + (1 - voidFractions[twoPhaseSlice]) * steam.densityLiquid;
+    frictionMultipliers = 1. + (steam.densityLiquid / steam.densityVapor - 1.) * qualitys * Nan2Num(1.02 * qualitys ** -0.175 * (steam.massFlux / 1356.) ** -0.45);
+    ###
+    return RbwrTh, steam, axialPowers, flowLengths, qualitys, voidFractions, massDensitys, frictionMultipliers;
+###
+# Check that two assemblies share, rather than duplicate, the power of cells outside every assembly
+###
+def CompareAssemblyPowers():
+    '''Return if the axial powers of two rbwrThAssembly copies sum to the core power.''';
+    RbwrTh, parameters = RbwrThAssemblyParameters();
+    assembly = parameters['assemblyFuelsToCools'][0];
+    ###
+    # Second assembly offsets every cell #;
+    # Cell #7000 belongs to neither
+    ###
+    assemblys = [assembly, tuple({tuple(fuel + 10000 for fuel in fuels) : tuple(cool + 10000 for cool in cools) for fuels, cools in fuels2Cools.items()} for fuels2Cools in assembly)];
+    cellNumbers = {cellNumber for fuels2Cools in assemblys[0] + assemblys[1] for fuels, cools in fuels2Cools.items() for cellNumber in fuels + cools} | {7000};
+    cellNumber2ThermalPower = {cellNumber : 1e3 + cellNumber % 997 for cellNumber in cellNumbers};
+    ###
+    assemblyAxialPowers = RbwrTh.AssemblyAxialPowers(cellNumber2ThermalPower, assemblys);
+    corePower = sum(cellNumber2ThermalPower.values());
+    assemblyPower = sum(sum(axialPowers) for axialPowers in assemblyAxialPowers);
+    ###
+    return [abs(assemblyPower - corePower) <= relativeTolerance * corePower];
+###
+# Check that cumulative-sum kernels reproduce their loops
+###
+def CompareKernels():
+    '''Return if critical power ratio and pressure drop kernels match their loops.''';
+    RbwrTh, steam, axialPowers, flowLengths, qualitys, voidFractions, massDensitys, frictionMultipliers = RbwrThAssemblyProfiles();
+    ###
+    def Close(ones, twos):
+        return all(abs(one - two) <= relativeTolerance * max(abs(one), abs(two)) for one, two in zip(ones, twos));
+    ###
+    results = [];
+    for endIndex in (len(axialPowers), len(axialPowers) - 500):
+        results.extend(Close(one, two) for one, two in zip(RbwrTh.CriticalPowerRatioMITCISE4(steam, axialPowers, flowLengths, endIndex), CriticalPowerRatioMITCISE4Loop(steam, axialPowers, flowLengths, endIndex)));
+    results.append(Close(RbwrTh.PressureDropTwoPhase(steam, qualitys, voidFractions, massDensitys, flowLengths, frictionMultipliers), PressureDropTwoPhaseLoop(steam, qualitys, voidFractions, massDensitys, flowLengths, frictionMultipliers)));
+    ###
+    return results;
+
+###
+### Script
+###
+
+###
+# main()
+###
+for result in CompareKernels() + CompareAssemblyPowers():
+    if result:
+        print('PASS');
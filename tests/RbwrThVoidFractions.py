@@ -0,0 +1,213 @@
+#! /usr/bin/env python3
+
+###
+### Import
+###
+
+from MocDown import * ;
+from timeit import repeat as TimeRepeat;
+
+###
+### Constants
+###
+
+###
+# Test cases
+###
+mocDownInputFileName = '../examples/rbwrThAssembly/mocdown.inp';
+###
+# Absolute tolerance between loop and vectorized results;
+# Rounding may let either take one more fixed-point iteration than the other, each converging to within epsilon
+###
+absoluteTolerance = epsilon;
+###
+# Timing repeats, of which the best is reported
+###
+timingRepeats = 3;
+
+###
+### Functions
+###
+
+###
+# Loop Liao/Parlos/Griffith (LPG) void fraction correlation
+###
+def VoidFractionLPGLoop(steam, quality):
+    '''Peform Liao/Parlos/Griffith (LPG) void fraction correlation, one spatial region at a time.''';
+    x = quality;
+    g = steam.gravity;
+    G = steam.massFlux;
+    De = steam.hydraulicDiameter;
+    rhol = steam.densityLiquid;
+    rhov = steam.densityVapor;
+    rholv = rhol - rhov;
+    sigma = steam.surfaceTension;
+    ###
+    jv = G * x / rhov;
+    jl = G * (1 - x) / rhol;
+    jgst = jv * (rhov / (g * De * rholv)) ** 0.5;
+    boundary = 2.34 - 1.07 * (g * sigma * rholv / rhol ** 2.) ** 0.25;
+    ###
+    alpha = Zeros(len(quality));
+    alphaBubbly = alphaSlug = None;
+    for index in range(len(x)):
+        if jl[index] > boundary:
+            regime = 0;
+        elif jgst[index] > 1:
+            regime = 1;
+        else:
+            regime = 2;
+        ###
+        difference = epsilon;
+        while difference >= epsilon:
+            previous = alpha[index];
+            if 0 == regime:
+                C0 = 1.;
+                Vvj = 1.53 * (1. - alpha[index]) ** 2. * (g * sigma * rholv / rhol ** 2.) ** 0.25;
+            elif 1 == regime:
+                C0 = 1. + (1. - alpha[index]) / (alpha[index] + 4. * (rhov / rhol) ** 0.5);
+                Vvj = (C0 - 1.) * (g * De * rholv * (1 - alpha[index]) / (0.015 * rhol)) ** 0.5;
+            elif 2 == regime:
+                C0 = 1.2 - 0.2 * (rhov / rhol) ** 0.5 * (1. - Exponent(-18. * alpha[index]));
+                Vvj = 0.33 * (g * sigma * rholv / rhov ** 2.) ** 0.25;
+            ###
+            alpha[index] = RbwrTh.VoidFractionDriftFlux(x = x[index], rhol = rhol, rhov = rhov, G = G, C0 = C0, Vvj = Vvj);
+            difference = abs(previous - alpha[index]);
+        ###
+        if 0 == regime:
+            alphaBubbly = alpha[index];
+        elif 1 == regime:
+            if alphaSlug is not None:
+                alpha[index] = max(alpha[index], alphaSlug);
+            elif alphaBubbly is not None:
+                alpha[index] = max(alpha[index], alphaBubbly);
+        elif 2 == regime:
+            alphaSlug = alpha[index];
+    ###
+    return alpha;
+###
+# Loop Chexal-Lellouche void fraction correlation
+###
+def VoidFractionChexalLelloucheLoop(steam, quality):
+    '''Perform Chexal-Lellouche void fraction correlation, one spatial region at a time.''';
+    x = quality;
+    g = steam.gravity;
+    G = steam.massFlux;
+    De = steam.hydraulicDiameter;
+    rhol = steam.densityLiquid;
+    rhov = steam.densityVapor;
+    rholv = rhol - rhov;
+    rhovOl = rhov / rhol;
+    sigma = steam.surfaceTension;
+    mul = steam.dynamicViscosityLiquid;
+    muv = steam.dynamicViscosityVapor;
+    P = steam.pressure;
+    Pcrit = steam.criticalPressure;
+    ###
+    Rel = G * (1 - x) * De / mul;
+    Rev = G *  x * De / muv;
+    ###
+    B1 = Array([min(0.8, 1 / (1 + Exponent(-max(Rel[index], Rev[index]) / 6e4))) for index in range(len(x))]);
+    K0 = B1 + (1 - B1) * rhovOl ** 0.25;
+    r = (1 + 1.57 * rhovOl) / (1 - B1);
+    C1 = 4 * Pcrit ** 2. / P / (Pcrit - P);
+    ###
+    C3 = Array([max(0.5, 2 * Exponent(-abs(Rel[index]) / 6e4)) for index in range(len(x))]);
+    C5 = (150 * rhovOl) ** 0.5;
+    if 1 / rhovOl <= 18:
+        C2 = 0.4757 * (-NaturalLogarithm(rhovOl)) ** 0.7;
+    elif C5 >= 1:
+        C2 = 1;
+    else:
+        C2 = 1 / (1 - Exponent(-C5 / (1 - C5)));
+    ###
+    C7 = (0.09144 / De) ** 0.6;
+    if C7 >= 1:
+        C4 = 1;
+    else:
+        C4 = 1 / (1 - Exponent(-C5 / (1 - C5)));
+    ###
+    # Homogeneous void fraction as a first guess, as in the vectorized solver
+    ###
+    alpha = Zeros(len(quality));
+    for index in range(len(x)):
+        alpha[index] = RbwrTh.VoidFractionDriftFlux(x = x[index], rhol = rhol, rhov = rhov, G = G, C0 = 1, Vvj = 0);
+        ###
+        difference = epsilon;
+        while difference >= epsilon:
+            previous = alpha[index];
+            C9 = (1 - alpha[index]) ** B1[index];
+            Vvj = 2 ** 0.5 * (g * sigma * rholv / rhol ** 2.) ** 0.25 * C2 * C3[index] * C4 * C9;
+            L = (1 - Exponent(-C1 * alpha[index])) / (1 - Exponent(-C1));
+            C0 = L / (K0[index] + (1 - K0[index]) * alpha[index] ** r[index]);
+            ###
+            alpha[index] = RbwrTh.VoidFractionDriftFlux(x = x[index], rhol = rhol, rhov = rhov, G = G, C0 = C0, Vvj = Vvj);
+            difference = abs(previous - alpha[index]);
+    ###
+    return alpha;
+###
+# Build rbwrThAssembly steam and qualities
+###
+def RbwrThAssemblyQualitys(zoneSlices = 500):
+    '''Return steam and sliced two-phase qualities of the rbwrThAssembly example under a chopped-parabola power, and steam and quality sweeps spanning every LPG flow regime.''';
+    arguments = Class();
+    arguments.isQuiet = arguments.isVerbose = False;
+    arguments.mocDownInputFileName = mocDownInputFileName;
+    ###
+    mocDownInputFile = MocDownInputFile(arguments);
+    ImportLibraries(mocDownInputFile);
+    mocDownInputFile.Populate();
+    parameters = mocDownInputFile.GetParameters();
+    ###
+    global RbwrTh;
+    import RbwrTh;
+    ###
+    Steam = lambda massFlowRate: RbwrTh.Steam(pressure = parameters['coolantInletPressure'], temperature = parameters['coolantInletTemperature'], massFlowRate = massFlowRate, heatedDiameter = parameters['coolantHeatedDiameter'], hydraulicDiameter = parameters['coolantHydraulicDiameter'], flowArea = parameters['coolantFlowArea'], tableTolerance = parameters['steamTableTolerance']);
+    steam = Steam(parameters['coolantMassFlowRate']);
+    ###
+    # Chopped-parabola depletion power [kWth] over the heated zones, between the unheated lower plenum and upper riser
+    ###
+    heatedZones = len(parameters['coolantFlowLengths']) - 2;
+    zonePowers = [0.] + [1.5e6 * parameters['depletionPower'] / heatedZones * (1 - ((index + 0.5) / heatedZones * 2 - 1) ** 2) for index in range(heatedZones)] + [0.];
+    axialPowers = Array([zonePower / zoneSlices / 1e3 for zonePower in zonePowers for index in range(zoneSlices)]);
+    ###
+    onsetIndex = NonZero(axialPowers.cumsum() / steam.massFlowRate >= (steam.enthalpyLiquid - steam.enthalpyInlet))[0][0];
+    qualitys = axialPowers[onsetIndex : ].cumsum() / steam.massFlowRate / (steam.enthalpyVapor - steam.enthalpyLiquid);
+    qualitys = qualitys[qualitys > 0];
+    ###
+    # Quality sweeps;
+    # Annular and churn/slug regimes at the nominal flow rate, and bubbly and annular regimes at double it
+    ###
+    sweepQualitys = LogSpace(-4, NaturalLogarithm(0.95) / NaturalLogarithm(10.), 1000);
+    sweeps = [(steam, sweepQualitys), (Steam(2. * parameters['coolantMassFlowRate']), sweepQualitys)];
+    ###
+    return steam, qualitys, sweeps;
+###
+# Check that vectorized void fraction solvers reproduce their loops, and time both
+###
+def CompareVoidFractions():
+    '''Return if the vectorized LPG and Chexal-Lellouche void fraction correlations match their loops.''';
+    steam, qualitys, sweeps = RbwrThAssemblyQualitys();
+    ###
+    results = [];
+    for name, VoidFraction, VoidFractionLoop in (('LPG', RbwrTh.VoidFractionLPG, VoidFractionLPGLoop), ('Chexal-Lellouche', RbwrTh.VoidFractionChexalLellouche, VoidFractionChexalLelloucheLoop)):
+        for sweepSteam, quality in [(steam, qualitys)] + sweeps:
+            results.append(abs(VoidFraction(sweepSteam, quality) - VoidFractionLoop(sweepSteam, quality)).max() <= absoluteTolerance);
+        ###
+        # Best of several repeats
+        ###
+        loopSeconds, vectorSeconds = (min(TimeRepeat(Partial(Function, steam, qualitys), number = 1, repeat = timingRepeats)) for Function in (VoidFractionLoop, VoidFraction));
+        PrintNow('> {} void fractions of {:d} slices: {:.1f} ms looping; {:.1f} ms vectorized ({:.1f}x)'.format(name, len(qualitys), 1e3 * loopSeconds, 1e3 * vectorSeconds, loopSeconds / vectorSeconds));
+    ###
+    return results;
+
+###
+### Script
+###
+
+###
+# main()
+###
+for result in CompareVoidFractions():
+    if result:
+        print('PASS');
@@ -0,0 +1 @@
+../src/iapws.py
\ No newline at end of file